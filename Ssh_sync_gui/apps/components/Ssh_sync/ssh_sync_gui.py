@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-X-Seti - July03 2023 - SSH File Sync GUI - Version: 4
+X-Seti - July03 2023 - SSH File Sync GUI - Version: 22
 this belongs in apps/components/Ssh_sync/ssh_sync_gui.py
 
 SSH File Sync - Bidirectional file synchronization between two Linux machines
@@ -8,30 +8,80 @@ SSH File Sync - Bidirectional file synchronization between two Linux machines
 
 import os
 import tempfile
-import subprocess
 import shutil
 import struct
 import sys
 import io
+import time
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from PyQt6.QtWidgets import (QApplication, QSlider, QCheckBox,
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget, QDialog, QFormLayout, QSpinBox,  QListWidgetItem, QLabel, QPushButton, QFrame, QFileDialog, QLineEdit, QTextEdit, QMessageBox, QScrollArea, QGroupBox, QTableWidget, QTableWidgetItem, QColorDialog, QHeaderView, QAbstractItemView, QMenu, QComboBox, QInputDialog, QTabWidget, QDoubleSpinBox, QRadioButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect, QByteArray, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QImage, QPainter, QPen, QBrush, QColor, QCursor
-from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect, QTimer
+from PyQt6.QtGui import QFont, QIcon, QPixmap, QImage, QPen, QBrush, QColor, QCursor
+
+# Add apps directory to path for core/ and methods/ imports
+apps_path = Path(__file__).parent.parent.parent
+if str(apps_path) not in sys.path:
+    sys.path.insert(0, str(apps_path))
+
+from core.sshsync_core import (build_ssh_cmd_prefix, build_rsync_ssh_option, list_remote_tree,
+    list_remote_index, remote_batch_ops, quote_remote_path, local_paths_overlap,
+    remote_paths_overlap)
+from core.sshsync_indexcore import RemoteIndex, load_listing_text
+from core.sshsync_conncore import get_master_pool
+from core.sshsync_runcore import run_command_job
+from core.sshsync_rsynccore import (run_rsync_job, run_transfer_job, run_batch_job, run_paths_job,
+    format_rate)
+from core.sshsync_compresscore import (COMPRESSION_MODES, get_compression_policy,
+    describe_compression)
+from core.sshsync_shardcore import run_sharded_job, walk_local_tree
+from core.sshsync_manifestcore import (get_manifest_path, profile_key, run_incremental_push_job,
+    run_manifest_scan_job)
+from core.sshsync_watchcore import LocalWatcher, PendingChanges
+from core.sshsync_remotewatchcore import RemoteWatcher, build_remote_watch_cmd
+from core.sshsync_tarcore import COMPRESSION_CHOICES, run_auto_transfer_job
+from core.sshsync_bisynccore import (KEEP_LOCAL, KEEP_REMOTE, get_state_path, run_bisync_job,
+    run_resolve_job)
+from core.sshsync_fanoutcore import parse_host_group, run_fanout_job
+from core.sshsync_plancore import (PlanCache, describe_plan, plan_resume_paths, run_plan_job,
+    run_planned_job)
+from core.sshsync_resumecore import (TransferJournal, connection_key, get_journal_path,
+    is_interrupted, run_resume_job, transfer_spec)
+from core.sshsync_bwcore import (BandwidthSchedule, format_cap, get_bandwidth_budget,
+    parse_schedule)
+from core.sshsync_themecore import load_theme_snapshot
+from core.sshsync_iconcore import ICON_SVGS
+from core.sshsync_profilecore import (DIRECTIONS, PROFILE_SETTINGS, ProfileScheduler, ProfileStore,
+    default_profile, describe_result, get_profiles_path, parse_profile_schedule, profile_bandwidth,
+    run_profile_job)
+from methods.sshsync_jobexec import JobExecutor
+from methods.sshsync_iconcache import cached_icon, cached_pixmap, ensure_icon_atlas, set_theme_color
 
-# Add root directory to path
 App_name = "SSH File Sync"
 DEBUG_STANDALONE = True
 
+# Options saved with the profile store that apply to every profile
+PERSISTED_OPTIONS = ('auto_sync_enabled', 'sync_interval', 'watch_mode_enabled', 'watch_latency',
+    'remote_watch_enabled', 'three_way_sync_enabled', 'parallel_sync_enabled',
+    'parallel_max_streams', 'incremental_sync_enabled', 'tar_transport_enabled',
+    'tar_compression', 'compression_mode', 'bandwidth_limit', 'bandwidth_schedule',
+    'fanout_hosts', 'fanout_max_parallel')
+
 class SSHSyncGUI(QWidget):
     """SSH File Sync - Main window"""
 
     sync_completed = pyqtSignal()
+    local_changes_detected = pyqtSignal(object)  # set of relative paths, None = rescan all
+    remote_changes_detected = pyqtSignal(object) # set of paths relative to remote export
+    remote_watch_status = pyqtSignal(str)
+    remote_watch_stopped = pyqtSignal(object)    # the RemoteWatcher that gave up
+
+    # The launcher's --startup-profile sets a list here; phases append (name, perf_counter)
+    startup_marks = None
 
-    def __init__(self, parent=None, main_window=None): #vers 1
+    def __init__(self, parent=None, main_window=None): #vers 8
         """initialize_features"""
         if DEBUG_STANDALONE and main_window is None:
             print(f"{App_name} Initializing ...")
@@ -55,20 +105,98 @@ class SSHSyncGUI(QWidget):
         self.remote_import_path = "~/Desktop/import"
         self.auto_sync_enabled = False
         self.sync_interval = 60  # seconds
+        self.watch_mode_enabled = True  # inotify-driven auto-sync, timer only as fallback
+        self.watch_latency = 2  # seconds from first change to push
+        self.remote_watch_enabled = True  # remote change feed drives pulls
         self.delete_extra_files = False  # Whether to delete files not in source
+        self.three_way_sync_enabled = False  # Sync Both as a three-way merge of export <-> remote import
+        self.parallel_sync_enabled = False  # Sharded parallel rsync streams
+        self.parallel_max_streams = 4
+        self.incremental_sync_enabled = False  # Push only manifest changes since last sync
+        self.tar_transport_enabled = True  # Tar stream when the plan is many small files
+        self.tar_compression = 'auto'  # auto / zstd / lz4 / none
+        self.compression_mode = 'adaptive'  # rsync compression: adaptive / always / off
+        self.compression_policy = get_compression_policy()
+        self.bandwidth_limit = 0  # KB/s shared by all transfers, 0 = unlimited
+        self.bandwidth_schedule = ""  # time-of-day rules, one per line
+        self.bandwidth_budget = get_bandwidth_budget()
+        self.profile_bandwidth_limit = 0  # KB/s for the active profile's transfers, 0 = global cap only
+        self.profile_bandwidth_schedule = ""  # the profile's own time-of-day rules
+        self.fanout_hosts = ""  # host group for fan-out pushes, one user@host[:port] per line
+        self.fanout_max_parallel = 4
+
+        # Named sync profiles - the active one fills the settings above, scheduled ones
+        # run in the background under a global cap
+        self.profile_store = ProfileStore(get_profiles_path())
+        self.active_profile = "Default"
+        self.profile_scheduler = ProfileScheduler(self.profile_store)
+        self.profile_scheduler_enabled = False
+        self.profile_timer = QTimer()
+        self.profile_timer.timeout.connect(self._run_scheduled_profiles)
+        # Scheduled profiles get workers of their own, one per allowed concurrent
+        # profile - they never hold up interactive jobs or the syncing flag
+        self.profile_executor = JobExecutor(max_workers=self.profile_scheduler.max_concurrent,
+            parent=self)
+        self.profile_executor.busy_changed.connect(self._on_jobs_busy_changed)
+        self._load_profile_settings()
         
         # Sync state
         self.connected = False
         self.syncing = False
+
+        # Shared ControlMaster pool - one multiplexed master per host/profile
+        self.ssh_pool = get_master_pool()
+        self.control_path = None
+
+        # Remote listing index - metadata for the remote panel without further ssh calls
+        self.remote_index = RemoteIndex()
+        self.remote_listing_serial = 0
+
+        # Resume journal - transfers that started but did not finish, resumed on connect
+        self.transfer_journal = TransferJournal(get_journal_path())
+
+        # Dry-run plans for Mirror / Clone - shown for confirmation, then executed as planned
+        self.plan_cache = PlanCache()
+
+        # Background job executor - every transfer and remote operation runs here,
+        # and it owns the syncing flag. Three workers: both halves of Sync Both run at
+        # once and a listing refresh still gets a worker
+        self.job_executor = JobExecutor(max_workers=3, parent=self)
+        self.transfer_progress = {}  # job name -> status bar text, one per running transfer
+        self.job_executor.busy_changed.connect(self._on_jobs_busy_changed)
         
         # Auto-sync timer
         self.sync_timer = QTimer()
         self.sync_timer.timeout.connect(self._auto_sync)
-        
-        # App settings reference (if available)
+
+        # Bandwidth cap shown in the status bar follows the schedule
+        self.bandwidth_timer = QTimer()
+        self.bandwidth_timer.timeout.connect(self._update_bandwidth_label)
+
+        # Watch mode - changes are coalesced and transferred as path lists,
+        # pushes from the local watcher, pulls from the remote watcher. In two-way
+        # mode both only trigger the three-way merge
+        self.local_watcher = None
+        self.remote_watcher = None
+        self.manifest_tracked = None  # manifest key the local watcher has kept current since a full scan
+        self.local_pending = PendingChanges()
+        self.remote_pending = PendingChanges()
+        self.three_way_running = False
+        self.three_way_again = None  # interactive flag of a merge requested while one runs
+        self.local_changes_detected.connect(self._on_local_changes)
+        self.remote_changes_detected.connect(self._on_remote_changes)
+        self.remote_watch_status.connect(self._log_status)
+        self.remote_watch_stopped.connect(self._on_remote_watch_stopped)
+        
+        self._mark_startup("state, jobs and profiles")
+
+        # App settings reference (if available) - standalone, only the active theme is
+        # read; the full settings system loads when the theme dialog is opened
         self.app_settings = None
         if main_window and hasattr(main_window, 'app_settings'):
             self.app_settings = main_window.app_settings
+        else:
+            self.app_settings = load_theme_snapshot()
 
         # Set default fonts - will be overridden by app_settings if available
         from PyQt6.QtGui import QFont
@@ -111,6 +239,12 @@ class SSHSyncGUI(QWidget):
             self.infobar_font = QFont("Courier New", 11)
         
         self.setFont(default_font)
+        self._mark_startup("settings and fonts")
+
+        # Toolbar icons share the process-wide icon cache - (setter, factory) pairs
+        # are kept so a theme text color change can redraw them
+        self.icon_color = None
+        self.themed_icons = []
 
         self.background_color = QColor(42, 42, 42)
         self.setMinimumSize(200, 200)
@@ -127,8 +261,6 @@ class SSHSyncGUI(QWidget):
         # Window flags
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
 
-        self._initialize_features()
-
         # Corner resize variables
         self.dragging = False
         self.drag_position = None
@@ -143,17 +275,19 @@ class SSHSyncGUI(QWidget):
 
         # Setup UI FIRST
         self.setup_ui()
+        self._initialize_features()
+        self._mark_startup("panels")
 
         # Set window icon
-        icon_pixmap = self._create_app_icon_pixmap(64)
-        from PyQt6.QtGui import QIcon
-        self.setWindowIcon(QIcon(icon_pixmap))
+        self._set_themed_icon(lambda pixmap: self.setWindowIcon(QIcon(pixmap)),
+                              lambda: self._create_app_icon_pixmap(64))
 
         # Setup hotkeys
         self._setup_hotkeys()
 
         # Apply theme ONCE at the end
         self._apply_theme()
+        self._mark_startup("theme")
 
         if hasattr(self, '_update_dock_button_visibility'):
             self._update_dock_button_visibility()
@@ -164,9 +298,17 @@ class SSHSyncGUI(QWidget):
         # Enable mouse tracking
         self.setMouseTracking(True)
 
+        # Build the icon atlas once the window is up, if missing or stale
+        QTimer.singleShot(0, self._ensure_icon_atlas)
+
         if DEBUG_STANDALONE:
             print(f"{App_name} initialized")
 
+    def _mark_startup(self, phase): #vers 1
+        """Record a construction phase for the launcher's --startup-profile report"""
+        if SSHSyncGUI.startup_marks is not None:
+            SSHSyncGUI.startup_marks.append((phase, time.perf_counter()))
+
     def setup_ui(self): #vers 1
         """Setup the main UI layout"""
         main_layout = QVBoxLayout(self)
@@ -201,10 +343,9 @@ class SSHSyncGUI(QWidget):
         main_layout.addWidget(status_frame)
 
 
-    def _initialize_features(self): #vers 1
+    def _initialize_features(self): #vers 2
         """Initialize all features after UI setup"""
         try:
-            self._apply_theme()
             self._update_status_indicators()
 
             if self.main_window and hasattr(self.main_window, 'log_message'):
@@ -234,7 +375,7 @@ class SSHSyncGUI(QWidget):
         return status_bar
 
 
-    def _show_workshop_settings(self): #vers 1
+    def _show_workshop_settings(self): #vers 2
         """Show SSH Sync settings dialog"""
         dialog = QDialog(self)
         dialog.setWindowTitle("SSH Sync Settings")
@@ -253,6 +394,10 @@ class SSHSyncGUI(QWidget):
         sync_tab = self._create_sync_settings_tab()
         tabs.addTab(sync_tab, "Sync Options")
 
+        # Profiles Tab
+        profiles_tab = self._create_profiles_settings_tab()
+        tabs.addTab(profiles_tab, "Profiles")
+
         layout.addWidget(tabs)
 
         # Buttons
@@ -391,7 +536,7 @@ class SSHSyncGUI(QWidget):
         return tab
 
 
-    def _create_sync_settings_tab(self): #vers 1
+    def _create_sync_settings_tab(self): #vers 10
         """Create Sync Options settings tab"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -412,6 +557,28 @@ class SSHSyncGUI(QWidget):
         self.sync_interval_input.setSuffix(" seconds")
         sync_layout.addRow("Sync Interval:", self.sync_interval_input)
 
+        # Watch mode
+        self.watch_mode_checkbox = QCheckBox("Watch local changes (inotify)")
+        self.watch_mode_checkbox.setChecked(self.watch_mode_enabled)
+        self.watch_mode_checkbox.setToolTip(
+            "Push only the files that changed, shortly after they change.\n"
+            "Falls back to the sync interval timer when inotify is unavailable.")
+        sync_layout.addRow("", self.watch_mode_checkbox)
+
+        self.watch_latency_input = QSpinBox()
+        self.watch_latency_input.setRange(1, 300)
+        self.watch_latency_input.setValue(self.watch_latency)
+        self.watch_latency_input.setSuffix(" seconds")
+        self.watch_latency_input.setToolTip("Longest wait between a change and its push")
+        sync_layout.addRow("Watch Latency:", self.watch_latency_input)
+
+        self.remote_watch_checkbox = QCheckBox("Watch remote changes")
+        self.remote_watch_checkbox.setChecked(self.remote_watch_enabled)
+        self.remote_watch_checkbox.setToolTip(
+            "Keep one ssh session open streaming changes in the remote export folder\n"
+            "(inotifywait, or find polling when it is not installed) and pull only those.")
+        sync_layout.addRow("", self.remote_watch_checkbox)
+
         sync_group.setLayout(sync_layout)
         layout.addWidget(sync_group)
 
@@ -428,6 +595,17 @@ class SSHSyncGUI(QWidget):
             "[WARN] Warning: This can permanently delete files!"
         )
         behavior_layout.addWidget(self.delete_extra_checkbox)
+
+        self.three_way_sync_checkbox = QCheckBox("Two-way sync (three-way merge)")
+        self.three_way_sync_checkbox.setChecked(self.three_way_sync_enabled)
+        self.three_way_sync_checkbox.setToolTip(
+            "Sync Both keeps the local export and remote import folders in step in both\n"
+            "directions, compared against the last synced state: changes and deletions\n"
+            "on either side are carried over, files changed on both sides are listed\n"
+            "as conflicts and left untouched until resolved.\n"
+            "Auto-sync and both watchers then run the same merge instead of one-way\n"
+            "pushes and pulls; the remote watcher follows the remote import folder.")
+        behavior_layout.addWidget(self.three_way_sync_checkbox)
         
         # Info label
         info_label = QLabel(
@@ -443,10 +621,283 @@ class SSHSyncGUI(QWidget):
         behavior_group.setLayout(behavior_layout)
         layout.addWidget(behavior_group)
 
+        # Transfer mode group
+        transfer_group = QGroupBox("Transfer Mode")
+        transfer_layout = QFormLayout()
+
+        self.parallel_sync_checkbox = QCheckBox("Sharded parallel transfer")
+        self.parallel_sync_checkbox.setChecked(self.parallel_sync_enabled)
+        self.parallel_sync_checkbox.setToolTip(
+            "Split the file tree into size-balanced shards and run several rsync\n"
+            "streams at once. The stream count is tuned from measured throughput.")
+        transfer_layout.addRow("", self.parallel_sync_checkbox)
+
+        self.parallel_streams_input = QSpinBox()
+        self.parallel_streams_input.setRange(1, 16)
+        self.parallel_streams_input.setValue(self.parallel_max_streams)
+        transfer_layout.addRow("Max Streams:", self.parallel_streams_input)
+
+        self.incremental_sync_checkbox = QCheckBox("Incremental push (local manifest)")
+        self.incremental_sync_checkbox.setChecked(self.incremental_sync_enabled)
+        self.incremental_sync_checkbox.setToolTip(
+            "Keep a manifest of the local export folder and send rsync only the\n"
+            "files changed since the last successful Sync to Remote.\n"
+            "Assumes the remote copy is only changed by this sync - use Mirror\n"
+            "to run a full comparison.")
+        transfer_layout.addRow("", self.incremental_sync_checkbox)
+
+        self.tar_transport_checkbox = QCheckBox("Tar stream for many small files (auto)")
+        self.tar_transport_checkbox.setChecked(self.tar_transport_enabled)
+        self.tar_transport_checkbox.setToolTip(
+            "Dry-run each sync first; when the change set is many small files, send it\n"
+            "as one compressed tar stream over a single ssh channel instead of rsync.")
+        transfer_layout.addRow("", self.tar_transport_checkbox)
+
+        self.tar_compression_combo = QComboBox()
+        self.tar_compression_combo.addItems(COMPRESSION_CHOICES)
+        self.tar_compression_combo.setCurrentText(self.tar_compression)
+        transfer_layout.addRow("Tar Compression:", self.tar_compression_combo)
+
+        self.compression_mode_combo = QComboBox()
+        self.compression_mode_combo.addItems(COMPRESSION_MODES)
+        self.compression_mode_combo.setCurrentText(self.compression_mode)
+        self.compression_mode_combo.setToolTip(
+            "adaptive: pick zstd/lz4/zlib level or no compression per transfer from\n"
+            "link speed, CPU load and how compressible the files are\n"
+            "always: plain rsync -z\noff: never compress")
+        transfer_layout.addRow("Rsync Compression:", self.compression_mode_combo)
+
+        transfer_group.setLayout(transfer_layout)
+        layout.addWidget(transfer_group)
+
+        # Bandwidth group
+        bandwidth_group = QGroupBox("Bandwidth")
+        bandwidth_layout = QFormLayout()
+
+        self.bandwidth_limit_input = QSpinBox()
+        self.bandwidth_limit_input.setRange(0, 10 * 1024 * 1024)
+        self.bandwidth_limit_input.setValue(self.bandwidth_limit)
+        self.bandwidth_limit_input.setSuffix(" KB/s")
+        self.bandwidth_limit_input.setSpecialValueText("Unlimited")
+        self.bandwidth_limit_input.setToolTip(
+            "Total cap shared by every running transfer, used when no rule matches")
+        bandwidth_layout.addRow("Default Limit:", self.bandwidth_limit_input)
+
+        self.bandwidth_schedule_input = QTextEdit()
+        self.bandwidth_schedule_input.setPlainText(self.bandwidth_schedule)
+        self.bandwidth_schedule_input.setFixedHeight(70)
+        self.bandwidth_schedule_input.setPlaceholderText(
+            "Mon-Fri 09:00-18:00 2048\n22:00-06:00 0")
+        self.bandwidth_schedule_input.setToolTip(
+            "One rule per line: [days] HH:MM-HH:MM limit in KB/s (0 = unlimited).\n"
+            "The first matching rule wins; rsync streams take their share when they\n"
+            "start, tar streams follow the cap while they run.")
+        bandwidth_layout.addRow("Schedule:", self.bandwidth_schedule_input)
+
+        bandwidth_group.setLayout(bandwidth_layout)
+        layout.addWidget(bandwidth_group)
+
+        # Host group (fan-out) group
+        fanout_group = QGroupBox("Host Group (Fan-out)")
+        fanout_layout = QFormLayout()
+
+        self.fanout_hosts_input = QTextEdit()
+        self.fanout_hosts_input.setPlainText(self.fanout_hosts)
+        self.fanout_hosts_input.setFixedHeight(70)
+        self.fanout_hosts_input.setPlaceholderText("tester@rig1\ntester@rig2:2222")
+        self.fanout_hosts_input.setToolTip(
+            "Push to Host Group sends the local export folder to the remote import path\n"
+            "on each of these hosts. User and port default to the connection settings;\n"
+            "authentication uses the same key or password.")
+        fanout_layout.addRow("Hosts:", self.fanout_hosts_input)
+
+        self.fanout_parallel_input = QSpinBox()
+        self.fanout_parallel_input.setRange(1, 32)
+        self.fanout_parallel_input.setValue(self.fanout_max_parallel)
+        fanout_layout.addRow("Hosts at Once:", self.fanout_parallel_input)
+
+        fanout_group.setLayout(fanout_layout)
+        layout.addWidget(fanout_group)
+
         layout.addStretch()
         return tab
 
 
+    def _create_profiles_settings_tab(self): #vers 2
+        """Create Profiles settings tab - named profiles and the profile scheduler"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        profile = self.profile_store.get(self.active_profile) or default_profile()
+
+        # Active profile group
+        active_group = QGroupBox("Active Profile")
+        active_layout = QFormLayout()
+
+        self.profile_name_input = QLineEdit(self.active_profile)
+        self.profile_name_input.setToolTip(
+            "Save stores the connection and folder settings under this name and makes it\n"
+            "the active profile. Enter a new name to create another profile.")
+        active_layout.addRow("Name:", self.profile_name_input)
+
+        self.profile_direction_combo = QComboBox()
+        self.profile_direction_combo.addItems(DIRECTIONS)
+        self.profile_direction_combo.setCurrentText(profile['direction'])
+        self.profile_direction_combo.setToolTip(
+            "push: local export -> remote import\n"
+            "pull: remote export -> local import\n"
+            "both: push, then pull")
+        active_layout.addRow("Scheduled Direction:", self.profile_direction_combo)
+
+        self.profile_schedule_input = QLineEdit(profile['schedule'])
+        self.profile_schedule_input.setPlaceholderText("15m, 3600, */30 * * * * - empty = manual only")
+        self.profile_schedule_input.setToolTip(
+            "An interval (seconds, or with s/m/h/d) counted from the end of the last run,\n"
+            "or a cron expression: minute hour day month weekday (@hourly, @daily too).")
+        active_layout.addRow("Schedule:", self.profile_schedule_input)
+
+        self.profile_priority_input = QSpinBox()
+        self.profile_priority_input.setRange(-100, 100)
+        self.profile_priority_input.setValue(profile['priority'])
+        self.profile_priority_input.setToolTip(
+            "When more profiles are due than may run at once, higher priority goes first")
+        active_layout.addRow("Priority:", self.profile_priority_input)
+
+        self.profile_enabled_checkbox = QCheckBox("Run on schedule")
+        self.profile_enabled_checkbox.setChecked(profile['enabled'])
+        active_layout.addRow("", self.profile_enabled_checkbox)
+
+        self.profile_bandwidth_input = QSpinBox()
+        self.profile_bandwidth_input.setRange(0, 10 * 1024 * 1024)
+        self.profile_bandwidth_input.setValue(self.profile_bandwidth_limit)
+        self.profile_bandwidth_input.setSuffix(" KB/s")
+        self.profile_bandwidth_input.setSpecialValueText("Global cap only")
+        self.profile_bandwidth_input.setToolTip(
+            "Cap shared by this profile's transfers, used when no profile rule matches.\n"
+            "Each stream still takes no more than its share of the global cap.")
+        active_layout.addRow("Bandwidth Limit:", self.profile_bandwidth_input)
+
+        self.profile_bandwidth_schedule_input = QTextEdit()
+        self.profile_bandwidth_schedule_input.setPlainText(self.profile_bandwidth_schedule)
+        self.profile_bandwidth_schedule_input.setFixedHeight(50)
+        self.profile_bandwidth_schedule_input.setPlaceholderText("Mon-Fri 09:00-18:00 512")
+        self.profile_bandwidth_schedule_input.setToolTip(
+            "Rules for this profile only, in the same form as the global schedule")
+        active_layout.addRow("Bandwidth Schedule:", self.profile_bandwidth_schedule_input)
+
+        active_group.setLayout(active_layout)
+        layout.addWidget(active_group)
+
+        # Saved profiles group
+        saved_group = QGroupBox("Saved Profiles")
+        saved_layout = QVBoxLayout()
+
+        self.profile_list = QListWidget()
+        self._fill_profile_list()
+        saved_layout.addWidget(self.profile_list)
+
+        profile_buttons = QHBoxLayout()
+        profile_buttons.addStretch()
+
+        load_profile_btn = QPushButton("Load")
+        load_profile_btn.setToolTip("Fill the dialog from the selected profile - Save makes it active")
+        load_profile_btn.clicked.connect(self._load_profile_into_dialog)
+        profile_buttons.addWidget(load_profile_btn)
+
+        delete_profile_btn = QPushButton("Delete")
+        delete_profile_btn.clicked.connect(self._delete_profile)
+        profile_buttons.addWidget(delete_profile_btn)
+
+        saved_layout.addLayout(profile_buttons)
+        saved_group.setLayout(saved_layout)
+        layout.addWidget(saved_group)
+
+        # Scheduler group
+        scheduler_group = QGroupBox("Scheduler")
+        scheduler_layout = QFormLayout()
+
+        self.profile_scheduler_checkbox = QCheckBox("Run scheduled profiles in the background")
+        self.profile_scheduler_checkbox.setChecked(self.profile_scheduler_enabled)
+        self.profile_scheduler_checkbox.setToolTip(
+            "Every enabled profile with a schedule runs on its own connection, whichever\n"
+            "profile is active. Password profiles need the password entered this session.")
+        scheduler_layout.addRow("", self.profile_scheduler_checkbox)
+
+        self.profile_cap_input = QSpinBox()
+        self.profile_cap_input.setRange(1, 8)
+        self.profile_cap_input.setValue(self.profile_scheduler.max_concurrent)
+        scheduler_layout.addRow("Profiles at Once:", self.profile_cap_input)
+
+        scheduler_group.setLayout(scheduler_layout)
+        layout.addWidget(scheduler_group)
+
+        return tab
+
+
+    def _fill_profile_list(self): #vers 1
+        """List saved profiles with their schedule, priority and last result"""
+        self.profile_list.clear()
+        for profile in self.profile_store.profiles():
+            schedule = profile['schedule'] or "manual"
+            if not profile['enabled']:
+                schedule += ", disabled"
+            text = f"{profile['name']}  [{profile['direction']}, {schedule}, priority {profile['priority']}]"
+            if profile['last_result']:
+                text += f"  - {profile['last_result']}"
+            item = QListWidgetItem(text)
+            item.setData(Qt.ItemDataRole.UserRole, profile['name'])
+            self.profile_list.addItem(item)
+
+
+    def _load_profile_into_dialog(self): #vers 2
+        """Copy the selected profile into the settings dialog inputs"""
+        item = self.profile_list.currentItem()
+        profile = self.profile_store.get(item.data(Qt.ItemDataRole.UserRole)) if item else None
+        if profile is None:
+            return
+        self.profile_name_input.setText(profile['name'])
+        self.host_input.setText(profile['remote_host'])
+        self.user_input.setText(profile['remote_user'])
+        self.port_input.setValue(profile['remote_port'])
+        self.auth_key_radio.setChecked(not profile['use_password'])
+        self.auth_password_radio.setChecked(profile['use_password'])
+        self.key_path_input.setText(profile['ssh_key_path'])
+        self.local_export_input.setText(profile['local_export_path'])
+        self.local_import_input.setText(profile['local_import_path'])
+        self.remote_export_input.setText(profile['remote_export_path'])
+        self.remote_import_input.setText(profile['remote_import_path'])
+        self.delete_extra_checkbox.setChecked(profile['delete_extra_files'])
+        self.profile_direction_combo.setCurrentText(profile['direction'])
+        self.profile_schedule_input.setText(profile['schedule'])
+        self.profile_priority_input.setValue(profile['priority'])
+        self.profile_enabled_checkbox.setChecked(profile['enabled'])
+        self.profile_bandwidth_input.setValue(profile['profile_bandwidth_limit'])
+        self.profile_bandwidth_schedule_input.setPlainText(profile['profile_bandwidth_schedule'])
+
+
+    def _delete_profile(self): #vers 1
+        """Delete the selected profile - the active one stays until another is saved"""
+        item = self.profile_list.currentItem()
+        if not item:
+            return
+        name = item.data(Qt.ItemDataRole.UserRole)
+        if name == self.active_profile:
+            QMessageBox.information(self, "Profiles",
+                "The active profile cannot be deleted - load and save another one first")
+            return
+        reply = QMessageBox.question(self, "Delete Profile", f"Delete profile '{name}'?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        success, error = self.profile_store.remove(name)
+        self.profile_scheduler.forget(name)
+        if success:
+            self._log_status(f"Profile '{name}' deleted")
+        else:
+            self._log_status(f"[FAIL] Could not save profiles: {error}")
+        self._fill_profile_list()
+
+
     def _browse_ssh_key(self): #vers 1
         """Browse for SSH key file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -470,8 +921,8 @@ class SSHSyncGUI(QWidget):
             line_edit.setText(dir_path)
 
 
-    def _test_ssh_connection(self): #vers 1
-        """Test SSH connection to remote host"""
+    def _test_ssh_connection(self): #vers 2
+        """Test SSH connection to remote host - runs on the job executor"""
         host = self.host_input.text()
         user = self.user_input.text()
         port = self.port_input.value()
@@ -509,28 +960,29 @@ class SSHSyncGUI(QWidget):
                     "echo 'Connection successful'"
                 ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                QMessageBox.information(self, "Success", "SSH connection successful!")
-            else:
-                error_msg = result.stderr
-                if "sshpass: not found" in error_msg or "command not found" in error_msg:
-                    QMessageBox.warning(self, "Missing Dependency", 
-                        "Password authentication requires 'sshpass'.\n\n"
-                        "Install with:\nsudo pacman -S sshpass  (Arch)\n"
-                        "sudo apt install sshpass  (Ubuntu)")
+            def on_done(success, result):
+                if success:
+                    QMessageBox.information(self, "Success", "SSH connection successful!")
+                elif result.endswith("Timed out"):
+                    QMessageBox.warning(self, "Timeout", "Connection timed out")
                 else:
-                    QMessageBox.warning(self, "Connection Failed", 
-                        f"Failed to connect:\n{error_msg}")
+                    error_msg = result
+                    if "sshpass: not found" in error_msg or "command not found" in error_msg:
+                        QMessageBox.warning(self, "Missing Dependency", 
+                            "Password authentication requires 'sshpass'.\n\n"
+                            "Install with:\nsudo pacman -S sshpass  (Arch)\n"
+                            "sudo apt install sshpass  (Ubuntu)")
+                    else:
+                        QMessageBox.warning(self, "Connection Failed", 
+                            f"Failed to connect:\n{error_msg}")
+
+            self._submit_command("Test connection", cmd, on_done, timeout=10)
                 
-        except subprocess.TimeoutExpired:
-            QMessageBox.warning(self, "Timeout", "Connection timed out")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Connection error:\n{str(e)}")
 
 
-    def _apply_settings(self): #vers 1
+    def _apply_settings(self): #vers 12
         """Apply settings from dialog"""
         self.remote_host = self.host_input.text()
         self.remote_user = self.user_input.text()
@@ -549,13 +1001,35 @@ class SSHSyncGUI(QWidget):
         self.remote_import_path = self.remote_import_input.text()
         self.auto_sync_enabled = self.auto_sync_checkbox.isChecked()
         self.sync_interval = self.sync_interval_input.value()
+        self.watch_mode_enabled = self.watch_mode_checkbox.isChecked()
+        self.watch_latency = self.watch_latency_input.value()
+        self.remote_watch_enabled = self.remote_watch_checkbox.isChecked()
         self.delete_extra_files = self.delete_extra_checkbox.isChecked()
-        
-        # Update auto-sync timer
+        self.three_way_sync_enabled = self.three_way_sync_checkbox.isChecked()
+        self.parallel_sync_enabled = self.parallel_sync_checkbox.isChecked()
+        self.parallel_max_streams = self.parallel_streams_input.value()
+        self.incremental_sync_enabled = self.incremental_sync_checkbox.isChecked()
+        self.tar_transport_enabled = self.tar_transport_checkbox.isChecked()
+        self.tar_compression = self.tar_compression_combo.currentText()
+        self.compression_mode = self.compression_mode_combo.currentText()
+        self.compression_policy.mode = self.compression_mode
+        self._apply_bandwidth_schedule(self.bandwidth_limit_input.value(),
+            self.bandwidth_schedule_input.toPlainText().strip())
+        self._apply_profile_bandwidth(self.profile_bandwidth_input.value(),
+            self.profile_bandwidth_schedule_input.toPlainText().strip())
+        self.fanout_hosts = self.fanout_hosts_input.toPlainText().strip()
+        self.fanout_max_parallel = self.fanout_parallel_input.value()
+
+        # Persist everything under the named profile and apply the scheduler settings
+        self.profile_scheduler_enabled = self.profile_scheduler_checkbox.isChecked()
+        self.profile_scheduler.max_concurrent = self.profile_cap_input.value()
+        self._save_profile_settings(self.profile_name_input.text().strip() or self.active_profile)
+        self._update_profile_scheduler()
+        
+        # Restart auto-sync so watch/timer settings take effect
+        self._stop_auto_sync()
         if self.auto_sync_enabled and self.connected:
-            self.sync_timer.start(self.sync_interval * 1000)
-        else:
-            self.sync_timer.stop()
+            self._start_auto_sync()
         
         # Refresh file lists
         self._refresh_local_files()
@@ -567,6 +1041,132 @@ class SSHSyncGUI(QWidget):
         else:
             self._log_status("[OK] Delete mode disabled - extra files will be preserved")
 
+    def _apply_bandwidth_schedule(self, limit, schedule_text): #vers 1
+        """Install the default limit and schedule rules in the global bandwidth budget"""
+        success, rules = parse_schedule(schedule_text)
+        if not success:
+            self._log_status(f"[FAIL] Bandwidth schedule: {rules} - previous schedule kept")
+            return
+        self.bandwidth_limit = limit
+        self.bandwidth_schedule = schedule_text
+        self.bandwidth_budget.set_schedule(BandwidthSchedule(rules, limit))
+        self._update_bandwidth_label()
+
+    def _apply_profile_bandwidth(self, limit, schedule_text): #vers 1
+        """Install the active profile's limit and rules - they cap this window's transfers"""
+        success, rules = parse_schedule(schedule_text)
+        if not success:
+            self._log_status(f"[FAIL] Profile bandwidth schedule: {rules} - previous schedule kept")
+            return
+        self.profile_bandwidth_limit = limit
+        self.profile_bandwidth_schedule = schedule_text
+        self.bandwidth_budget.set_profile_schedule(BandwidthSchedule(rules, limit))
+
+    def _load_profile_settings(self): #vers 2
+        """Restore the saved options and the active profile's connection and folders"""
+        settings = self.profile_store.settings()
+        for key, value in settings.get('options', {}).items():
+            if key in PERSISTED_OPTIONS:
+                setattr(self, key, value)
+        self.compression_policy.mode = self.compression_mode
+        success, rules = parse_schedule(self.bandwidth_schedule)
+        if success:
+            self.bandwidth_budget.set_schedule(BandwidthSchedule(rules, self.bandwidth_limit))
+
+        self.active_profile = settings.get('active', self.active_profile)
+        profile = self.profile_store.get(self.active_profile)
+        if profile:
+            for key in PROFILE_SETTINGS:
+                setattr(self, key, profile[key])
+            self.bandwidth_budget.set_profile_schedule(profile_bandwidth(profile))
+
+        self.profile_scheduler_enabled = settings.get('scheduler_enabled', False)
+        self.profile_scheduler.max_concurrent = settings.get('max_concurrent', 2)
+        self._update_profile_scheduler()
+
+    def _save_profile_settings(self, name): #vers 1
+        """Persist the current settings as profile name and make it the active profile"""
+        profile = self.profile_store.get(name) or default_profile()
+        profile.update({key: getattr(self, key) for key in PROFILE_SETTINGS})
+        schedule = self.profile_schedule_input.text().strip()
+        success, parsed = parse_profile_schedule(schedule)
+        if success:
+            profile['schedule'] = schedule
+        else:
+            self._log_status(f"[FAIL] Profile schedule: {parsed} - previous schedule kept")
+        profile['direction'] = self.profile_direction_combo.currentText()
+        profile['priority'] = self.profile_priority_input.value()
+        profile['enabled'] = self.profile_enabled_checkbox.isChecked()
+
+        success, error = self.profile_store.put(name, profile)
+        if success:
+            success, error = self.profile_store.update_settings(active=name,
+                options={key: getattr(self, key) for key in PERSISTED_OPTIONS},
+                scheduler_enabled=self.profile_scheduler_enabled,
+                max_concurrent=self.profile_scheduler.max_concurrent)
+        self.profile_scheduler.forget(name)
+        if success:
+            self.active_profile = name
+            self._log_status(f"[OK] Settings saved to profile '{name}'")
+        else:
+            self._log_status(f"[FAIL] Could not save profiles: {error}")
+
+    def _update_profile_scheduler(self): #vers 2
+        """Start or stop the scheduler tick and size the profile workers to the cap"""
+        if self.profile_executor.max_workers != self.profile_scheduler.max_concurrent:
+            self.profile_executor.resize(self.profile_scheduler.max_concurrent)
+        if not self.profile_scheduler_enabled:
+            self.profile_timer.stop()
+        elif not self.profile_timer.isActive():
+            self.profile_timer.start(15000)  # schedules have minute resolution
+
+    def _profile_ssh_option(self, profile): #vers 2
+        """rsync -e option for a profile, or None when its password is not known
+
+        A profile on the live connection rides the pooled master; passwords are kept
+        for the session only, so password profiles of other accounts cannot run.
+        """
+        same_account = ((profile['remote_user'], profile['remote_host'], profile['remote_port'])
+            == (self.remote_user, self.remote_host, self.remote_port))
+        live = self.connected and same_account
+        password = None
+        if profile['use_password']:
+            if same_account:
+                password = self._load_password_securely()
+            if not password:
+                return None
+        return build_rsync_ssh_option(profile['use_password'], password, profile['ssh_key_path'],
+            profile['remote_port'], self.control_path if live else None)
+
+    def _run_scheduled_profiles(self): #vers 2
+        """Scheduler tick - start due profiles, highest priority first, up to the cap"""
+        for profile in self.profile_scheduler.take():
+            name = f"Profile {profile['name']}"
+            ssh_option = self._profile_ssh_option(profile)
+            if ssh_option is None:
+                self.profile_scheduler.finish(profile['name'],
+                    "failed: password not entered this session")
+                self._log_status(f"[FAIL] {name}: password not entered this session")
+                continue
+
+            def on_done(success, result, name=name, profile_name=profile['name']):
+                self._clear_transfer_progress(name)
+                self.profile_scheduler.finish(profile_name, describe_result(success, result))
+                if success:
+                    self._log_status(f"[OK] {name} completed - {len(result['changed'])} changed, "
+                        f"{len(result['deleted'])} deleted, {result['bytes']:,} bytes")
+                    if profile_name == self.active_profile:
+                        self._refresh_local_files()
+                        if self.connected:
+                            self._refresh_remote_files()
+                else:
+                    self._log_status(f"[FAIL] {name} failed: {result}")
+                self._run_scheduled_profiles()  # a slot is free again
+
+            self._log_status(f"{name} started ({profile['direction']}, priority {profile['priority']})")
+            self.profile_executor.submit(name, run_profile_job, profile, ssh_option, on_done=on_done,
+                on_progress=lambda info, name=name: self._on_transfer_progress(name, info))
+
     def _save_password_securely(self): #vers 1
         """Save password securely using basic encryption"""
         # Note: For production, use python-keyring library
@@ -583,24 +1183,20 @@ class SSHSyncGUI(QWidget):
         # return keyring.get_password("ssh_file_sync", self.remote_host)
         return self.remote_password
 
-    def _build_ssh_cmd_prefix(self): #vers 1
-        """Build SSH command prefix based on authentication method"""
-        if self.use_password:
-            password = self._load_password_securely()
-            return ["sshpass", "-p", password, "ssh", "-p", str(self.remote_port)]
-        else:
-            return ["ssh", "-i", self.ssh_key_path, "-p", str(self.remote_port)]
+    def _build_ssh_cmd_prefix(self): #vers 2
+        """Build SSH command prefix based on authentication method - rides the pooled master"""
+        password = self._load_password_securely() if self.use_password else None
+        return build_ssh_cmd_prefix(self.use_password, password, self.ssh_key_path,
+            self.remote_port, self.control_path)
 
-    def _build_rsync_ssh_option(self): #vers 1
-        """Build rsync -e SSH option based on authentication method"""
-        if self.use_password:
-            password = self._load_password_securely()
-            return f"sshpass -p '{password}' ssh -p {self.remote_port}"
-        else:
-            return f"ssh -i {self.ssh_key_path} -p {self.remote_port}"
+    def _build_rsync_ssh_option(self): #vers 2
+        """Build rsync -e SSH option based on authentication method - rides the pooled master"""
+        password = self._load_password_securely() if self.use_password else None
+        return build_rsync_ssh_option(self.use_password, password, self.ssh_key_path,
+            self.remote_port, self.control_path)
 
 
-    def _create_toolbar(self): #vers 1
+    def _create_toolbar(self): #vers 2
         """Create top toolbar with controls"""
         self.toolbar = QFrame()
         self.toolbar.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
@@ -611,14 +1207,14 @@ class SSHSyncGUI(QWidget):
 
         # Left side - Settings and Theme buttons
         settings_btn = QPushButton()
-        settings_btn.setIcon(self._create_settings_icon())
+        self._set_themed_icon(settings_btn.setIcon, self._create_settings_icon)
         settings_btn.setToolTip("Connection Settings")
         settings_btn.setFixedSize(32, 32)
         settings_btn.clicked.connect(self._show_workshop_settings)
         toolbar_layout.addWidget(settings_btn)
 
         theme_btn = QPushButton()
-        theme_btn.setIcon(self._create_theme_icon())
+        self._set_themed_icon(theme_btn.setIcon, self._create_theme_icon)
         theme_btn.setToolTip("Theme & Appearance Settings")
         theme_btn.setFixedSize(32, 32)
         theme_btn.clicked.connect(self._show_theme_settings)
@@ -634,8 +1230,7 @@ class SSHSyncGUI(QWidget):
         
         # App icon
         icon_label = QLabel()
-        icon_pixmap = self._create_app_icon_pixmap(32)
-        icon_label.setPixmap(icon_pixmap)
+        self._set_themed_icon(icon_label.setPixmap, lambda: self._create_app_icon_pixmap(32))
         center_layout.addWidget(icon_label)
         
         # Title label - make it draggable
@@ -650,7 +1245,7 @@ class SSHSyncGUI(QWidget):
 
         # Right side - Info and window controls
         info_btn = QPushButton()
-        info_btn.setIcon(self._create_info_icon())
+        self._set_themed_icon(info_btn.setIcon, self._create_info_icon)
         info_btn.setToolTip("About")
         info_btn.setFixedSize(32, 32)
         info_btn.clicked.connect(self._show_about)
@@ -660,19 +1255,19 @@ class SSHSyncGUI(QWidget):
 
         # Window controls
         minimize_btn = QPushButton()
-        minimize_btn.setIcon(self._create_minimize_icon())
+        self._set_themed_icon(minimize_btn.setIcon, self._create_minimize_icon)
         minimize_btn.setFixedSize(32, 32)
         minimize_btn.clicked.connect(self.showMinimized)
         toolbar_layout.addWidget(minimize_btn)
 
         maximize_btn = QPushButton()
-        maximize_btn.setIcon(self._create_maximize_icon())
+        self._set_themed_icon(maximize_btn.setIcon, self._create_maximize_icon)
         maximize_btn.setFixedSize(32, 32)
         maximize_btn.clicked.connect(self._toggle_maximize)
         toolbar_layout.addWidget(maximize_btn)
 
         close_btn = QPushButton()
-        close_btn.setIcon(self._create_close_icon())
+        self._set_themed_icon(close_btn.setIcon, self._create_close_icon)
         close_btn.setFixedSize(32, 32)
         close_btn.clicked.connect(self.close)
         toolbar_layout.addWidget(close_btn)
@@ -680,7 +1275,7 @@ class SSHSyncGUI(QWidget):
         return self.toolbar
 
 
-    def _create_left_panel(self): #vers 1
+    def _create_left_panel(self): #vers 2
         """Create left panel - Local file browser"""
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
@@ -704,49 +1299,49 @@ class SSHSyncGUI(QWidget):
 
         # Create icon buttons (30x30)
         self.local_rename_btn = QPushButton()
-        self.local_rename_btn.setIcon(self._create_rename_icon())
+        self._set_themed_icon(self.local_rename_btn.setIcon, self._create_rename_icon)
         self.local_rename_btn.setToolTip("Rename")
         self.local_rename_btn.setFixedSize(30, 30)
         self.local_rename_btn.clicked.connect(lambda: self._rename_file("local"))
         toolbar_layout.addWidget(self.local_rename_btn)
 
         self.local_ignore_btn = QPushButton()
-        self.local_ignore_btn.setIcon(self._create_ignore_icon())
+        self._set_themed_icon(self.local_ignore_btn.setIcon, self._create_ignore_icon)
         self.local_ignore_btn.setToolTip("Ignore File")
         self.local_ignore_btn.setFixedSize(30, 30)
         self.local_ignore_btn.clicked.connect(lambda: self._ignore_file("local"))
         toolbar_layout.addWidget(self.local_ignore_btn)
 
         self.local_find_btn = QPushButton()
-        self.local_find_btn.setIcon(self._create_find_icon())
+        self._set_themed_icon(self.local_find_btn.setIcon, self._create_find_icon)
         self.local_find_btn.setToolTip("Find")
         self.local_find_btn.setFixedSize(30, 30)
         self.local_find_btn.clicked.connect(lambda: self._find_file("local"))
         toolbar_layout.addWidget(self.local_find_btn)
 
         self.local_replace_btn = QPushButton()
-        self.local_replace_btn.setIcon(self._create_replace_icon())
+        self._set_themed_icon(self.local_replace_btn.setIcon, self._create_replace_icon)
         self.local_replace_btn.setToolTip("Replace")
         self.local_replace_btn.setFixedSize(30, 30)
         self.local_replace_btn.clicked.connect(lambda: self._replace_file("local"))
         toolbar_layout.addWidget(self.local_replace_btn)
 
         self.local_delete_btn = QPushButton()
-        self.local_delete_btn.setIcon(self._create_delete_icon())
+        self._set_themed_icon(self.local_delete_btn.setIcon, self._create_delete_icon)
         self.local_delete_btn.setToolTip("Delete")
         self.local_delete_btn.setFixedSize(30, 30)
         self.local_delete_btn.clicked.connect(lambda: self._delete_file("local"))
         toolbar_layout.addWidget(self.local_delete_btn)
 
         self.local_adddir_btn = QPushButton()
-        self.local_adddir_btn.setIcon(self._create_adddir_icon())
+        self._set_themed_icon(self.local_adddir_btn.setIcon, self._create_adddir_icon)
         self.local_adddir_btn.setToolTip("Add Directory")
         self.local_adddir_btn.setFixedSize(30, 30)
         self.local_adddir_btn.clicked.connect(lambda: self._add_directory("local"))
         toolbar_layout.addWidget(self.local_adddir_btn)
 
         self.local_info_btn = QPushButton()
-        self.local_info_btn.setIcon(self._create_info_icon())
+        self._set_themed_icon(self.local_info_btn.setIcon, self._create_info_icon)
         self.local_info_btn.setToolTip("Info")
         self.local_info_btn.setFixedSize(30, 30)
         self.local_info_btn.clicked.connect(lambda: self._show_file_info("local"))
@@ -770,8 +1365,8 @@ class SSHSyncGUI(QWidget):
         return panel
 
 
-    def _create_middle_panel(self): #vers 1
-        """Create middle panel - Remote file browser"""
+    def _create_middle_panel(self): #vers 4
+        """Create middle panel - Remote file browser, built on first connect"""
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
         layout = QVBoxLayout(panel)
@@ -786,77 +1381,15 @@ class SSHSyncGUI(QWidget):
         self.connection_status_label.setFont(self.panel_font)
         layout.addWidget(self.connection_status_label)
 
-        # Icon toolbar
-        toolbar = QFrame()
-        toolbar_layout = QHBoxLayout(toolbar)
-        toolbar_layout.setContentsMargins(2, 2, 2, 2)
-        toolbar_layout.setSpacing(2)
-
-        # Create icon buttons (30x30)
-        self.remote_rename_btn = QPushButton()
-        self.remote_rename_btn.setIcon(self._create_rename_icon())
-        self.remote_rename_btn.setToolTip("Rename")
-        self.remote_rename_btn.setFixedSize(30, 30)
-        self.remote_rename_btn.clicked.connect(lambda: self._rename_file("remote"))
-        self.remote_rename_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_rename_btn)
-
-        self.remote_ignore_btn = QPushButton()
-        self.remote_ignore_btn.setIcon(self._create_ignore_icon())
-        self.remote_ignore_btn.setToolTip("Ignore File")
-        self.remote_ignore_btn.setFixedSize(30, 30)
-        self.remote_ignore_btn.clicked.connect(lambda: self._ignore_file("remote"))
-        self.remote_ignore_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_ignore_btn)
-
-        self.remote_find_btn = QPushButton()
-        self.remote_find_btn.setIcon(self._create_find_icon())
-        self.remote_find_btn.setToolTip("Find")
-        self.remote_find_btn.setFixedSize(30, 30)
-        self.remote_find_btn.clicked.connect(lambda: self._find_file("remote"))
-        self.remote_find_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_find_btn)
-
-        self.remote_replace_btn = QPushButton()
-        self.remote_replace_btn.setIcon(self._create_replace_icon())
-        self.remote_replace_btn.setToolTip("Replace")
-        self.remote_replace_btn.setFixedSize(30, 30)
-        self.remote_replace_btn.clicked.connect(lambda: self._replace_file("remote"))
-        self.remote_replace_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_replace_btn)
-
-        self.remote_delete_btn = QPushButton()
-        self.remote_delete_btn.setIcon(self._create_delete_icon())
-        self.remote_delete_btn.setToolTip("Delete")
-        self.remote_delete_btn.setFixedSize(30, 30)
-        self.remote_delete_btn.clicked.connect(lambda: self._delete_file("remote"))
-        self.remote_delete_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_delete_btn)
-
-        self.remote_adddir_btn = QPushButton()
-        self.remote_adddir_btn.setIcon(self._create_adddir_icon())
-        self.remote_adddir_btn.setToolTip("Add Directory")
-        self.remote_adddir_btn.setFixedSize(30, 30)
-        self.remote_adddir_btn.clicked.connect(lambda: self._add_directory("remote"))
-        self.remote_adddir_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_adddir_btn)
-
-        self.remote_info_btn = QPushButton()
-        self.remote_info_btn.setIcon(self._create_info_icon())
-        self.remote_info_btn.setToolTip("Info")
-        self.remote_info_btn.setFixedSize(30, 30)
-        self.remote_info_btn.clicked.connect(lambda: self._show_file_info("remote"))
-        self.remote_info_btn.setEnabled(False)
-        toolbar_layout.addWidget(self.remote_info_btn)
-
-        toolbar_layout.addStretch()
-        layout.addWidget(toolbar)
-
-        # File list
-        self.remote_file_list = QListWidget()
-        self.remote_file_list.setFont(self.panel_font)
-        self.remote_file_list.setAlternatingRowColors(True)
-        layout.addWidget(self.remote_file_list)
+        # Icon toolbar and file list - everything in them needs the connection, so
+        # they replace this placeholder on first connect
+        self.remote_panel_layout = layout
+        self.remote_placeholder = QLabel("Connect to browse the remote import folder")
+        self.remote_placeholder.setFont(self.panel_font)
+        self.remote_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.remote_placeholder, 1)
+        self.remote_file_list = None
+        self.remote_tool_buttons = []
 
         # Connect/Refresh buttons
         button_layout = QHBoxLayout()
@@ -875,7 +1408,53 @@ class SSHSyncGUI(QWidget):
         return panel
 
 
-    def _create_right_panel(self): #vers 1
+    def _build_remote_browser(self): #vers 3
+        """Create the remote file operation buttons (30x30) and file list in place of the placeholder"""
+        index = self.remote_panel_layout.indexOf(self.remote_placeholder)
+        self.remote_panel_layout.removeWidget(self.remote_placeholder)
+        self.remote_placeholder.deleteLater()
+        self.remote_placeholder = None
+
+        toolbar = QFrame()
+        toolbar.setFixedHeight(34)
+        toolbar_layout = QHBoxLayout(toolbar)
+        toolbar_layout.setContentsMargins(2, 2, 2, 2)
+        toolbar_layout.setSpacing(2)
+        for icon_factory, tooltip, action in (
+                (self._create_rename_icon, "Rename", self._rename_file),
+                (self._create_ignore_icon, "Ignore File", self._ignore_file),
+                (self._create_find_icon, "Find", self._find_file),
+                (self._create_replace_icon, "Replace", self._replace_file),
+                (self._create_delete_icon, "Delete", self._delete_file),
+                (self._create_adddir_icon, "Add Directory", self._add_directory),
+                (self._create_info_icon, "Info", self._show_file_info)):
+            button = QPushButton()
+            self._set_themed_icon(button.setIcon, icon_factory)
+            button.setToolTip(tooltip)
+            button.setFixedSize(30, 30)
+            button.clicked.connect(lambda checked=False, action=action: action("remote"))
+            toolbar_layout.addWidget(button)
+            self.remote_tool_buttons.append(button)
+        toolbar_layout.addStretch()
+        self.remote_panel_layout.insertWidget(index, toolbar)
+
+        self.remote_file_list = QListWidget()
+        self.remote_file_list.setFont(self.panel_font)
+        self.remote_file_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.remote_file_list.setAlternatingRowColors(True)
+        self.remote_panel_layout.insertWidget(index + 1, self.remote_file_list)
+
+    def _set_remote_tools_enabled(self, enabled): #vers 2
+        """Enable or disable the remote toolbar - the browser is built the first time it is enabled"""
+        if self.remote_file_list is None:
+            if not enabled:
+                return
+            self._build_remote_browser()
+        for button in self.remote_tool_buttons:
+            button.setEnabled(enabled)
+
+
+    def _create_right_panel(self): #vers 5
         """Create right panel - Status, controls, and placeholders"""
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
@@ -891,14 +1470,14 @@ class SSHSyncGUI(QWidget):
         sync_layout = QVBoxLayout()
 
         self.sync_to_remote_btn = QPushButton("Sync to Remote ->")
-        self.sync_to_remote_btn.setIcon(self._create_export_icon())
-        self.sync_to_remote_btn.clicked.connect(self._sync_to_remote)
+        self._set_themed_icon(self.sync_to_remote_btn.setIcon, self._create_export_icon)
+        self.sync_to_remote_btn.clicked.connect(lambda: self._sync_to_remote())
         self.sync_to_remote_btn.setEnabled(False)
         sync_layout.addWidget(self.sync_to_remote_btn)
 
         self.sync_from_remote_btn = QPushButton("<- Sync from Remote")
-        self.sync_from_remote_btn.setIcon(self._create_import_icon())
-        self.sync_from_remote_btn.clicked.connect(self._sync_from_remote)
+        self._set_themed_icon(self.sync_from_remote_btn.setIcon, self._create_import_icon)
+        self.sync_from_remote_btn.clicked.connect(lambda: self._sync_from_remote())
         self.sync_from_remote_btn.setEnabled(False)
         sync_layout.addWidget(self.sync_from_remote_btn)
 
@@ -907,6 +1486,12 @@ class SSHSyncGUI(QWidget):
         self.sync_both_btn.setEnabled(False)
         sync_layout.addWidget(self.sync_both_btn)
 
+        self.cancel_jobs_btn = QPushButton("Cancel Running Jobs")
+        self.cancel_jobs_btn.setToolTip("Stop every queued and running transfer")
+        self.cancel_jobs_btn.clicked.connect(self._cancel_jobs)
+        self.cancel_jobs_btn.setEnabled(False)
+        sync_layout.addWidget(self.cancel_jobs_btn)
+
         sync_group.setLayout(sync_layout)
         layout.addWidget(sync_group)
 
@@ -919,6 +1504,11 @@ class SSHSyncGUI(QWidget):
         self.mirror_btn.clicked.connect(self._mirror_to_remote)
         self.mirror_btn.setEnabled(False)
         advanced_layout.addWidget(self.mirror_btn)
+
+        self.fanout_btn = QPushButton("Push to Host Group")
+        self.fanout_btn.setToolTip("Send the local export folder to every host in the host group")
+        self.fanout_btn.clicked.connect(self._push_to_host_group)
+        advanced_layout.addWidget(self.fanout_btn)
         
         self.clone_btn = QPushButton("Clone Remote -> Local")
         self.clone_btn.setToolTip("Make local identical to remote (destructive)")
@@ -927,10 +1517,16 @@ class SSHSyncGUI(QWidget):
         advanced_layout.addWidget(self.clone_btn)
         
         self.copy_selected_btn = QPushButton("Copy Selected Files")
-        self.copy_selected_btn.setToolTip("Copy selected files only")
+        self.copy_selected_btn.setToolTip("Copy selected local files to remote (one transfer)")
         self.copy_selected_btn.clicked.connect(self._copy_selected)
         self.copy_selected_btn.setEnabled(False)
         advanced_layout.addWidget(self.copy_selected_btn)
+
+        self.download_selected_btn = QPushButton("Download Selected Files")
+        self.download_selected_btn.setToolTip("Copy selected remote files to local import (one transfer)")
+        self.download_selected_btn.clicked.connect(self._copy_selected_from_remote)
+        self.download_selected_btn.setEnabled(False)
+        advanced_layout.addWidget(self.download_selected_btn)
         
         advanced_group.setLayout(advanced_layout)
         layout.addWidget(advanced_group)
@@ -968,7 +1564,7 @@ class SSHSyncGUI(QWidget):
         return panel
 
 
-    def _setup_status_indicators(self): #vers 1
+    def _setup_status_indicators(self): #vers 3
         """Setup status indicators at bottom"""
         status_frame = QFrame()
         status_frame.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Sunken)
@@ -985,6 +1581,18 @@ class SSHSyncGUI(QWidget):
 
         layout.addStretch()
 
+        # Live transfer progress (rate, percent, ETA, current file)
+        self.transfer_label = QLabel("")
+        self.transfer_label.setFont(self.infobar_font)
+        layout.addWidget(self.transfer_label)
+
+        # Current bandwidth cap from the schedule
+        self.bandwidth_label = QLabel("")
+        self.bandwidth_label.setFont(self.infobar_font)
+        layout.addWidget(self.bandwidth_label)
+        self._update_bandwidth_label()
+        self.bandwidth_timer.start(30000)
+
         # Stats
         self.stats_label = QLabel("Local: 0 files | Remote: 0 files")
         self.stats_label.setFont(self.infobar_font)
@@ -993,6 +1601,14 @@ class SSHSyncGUI(QWidget):
         return status_frame
 
 
+    def _update_bandwidth_label(self): #vers 1
+        """Show the cap in force right now and the rule that set it"""
+        limit, rule = self.bandwidth_budget.current_cap()
+        if limit:
+            self.bandwidth_label.setText(f"Cap: {format_cap(limit)} ({rule})")
+        else:
+            self.bandwidth_label.setText("Cap: unlimited")
+
     def _update_status_indicators(self): #vers 1
         """Update status bar indicators"""
         if self.connected:
@@ -1003,8 +1619,9 @@ class SSHSyncGUI(QWidget):
             self.status_indicator.setStyleSheet("color: #ff0000;")
 
 
-    def _refresh_local_files(self): #vers 1
+    def _refresh_local_files(self): #vers 2
         """Refresh local file list"""
+        self.plan_cache.clear()
         self.local_file_list.clear()
         
         export_path = Path(self.local_export_path)
@@ -1021,38 +1638,67 @@ class SSHSyncGUI(QWidget):
             self._log_status(f"Local export path does not exist: {export_path}")
 
 
-    def _refresh_remote_files(self): #vers 1
-        """Refresh remote file list via SSH"""
+    def _refresh_remote_files(self): #vers 4
+        """Refresh remote file list - one streamed metadata listing on the job executor"""
+        self.plan_cache.clear()
         if not self.connected:
             self._log_status("Not connected to remote")
             return
 
+        password = self._load_password_securely() if self.use_password else None
+        args = (self.remote_host, self.remote_user, self.remote_import_path, self.remote_port,
+            self.use_password, password, self.ssh_key_path, self.control_path)
+
+        def job(token, progress):
+            return list_remote_index(*args, max_depth=1, token=token,
+                on_entries=lambda entries: progress({'entries': entries}))
+
+        # Entries stream in batches - a newer refresh makes older batches stale
+        self.remote_listing_serial += 1
+        serial = self.remote_listing_serial
+
+        def on_progress(info):
+            if serial == self.remote_listing_serial:
+                self._add_remote_entries(info['entries'])
+
+        def on_done(success, result):
+            if serial == self.remote_listing_serial:
+                self._on_remote_index_listed(success, result)
+
         self.remote_file_list.clear()
-        
-        try:
-            # List remote files
-            ssh_cmd = self._build_ssh_cmd_prefix()
-            cmd = ssh_cmd + [
-                f"{self.remote_user}@{self.remote_host}",
-                f"ls -1 {self.remote_import_path}"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                files = result.stdout.strip().split('\n')
-                for file in files:
-                    if file:  # Skip empty lines
-                        self.remote_file_list.addItem(file)
-                self._log_status(f"Loaded {len(files)} remote files")
-                self._update_file_stats()
-            else:
-                self._log_status(f"Error listing remote files: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            self._log_status("Remote file list timed out")
-        except Exception as e:
-            self._log_status(f"Error listing remote files: {e}")
+        self.job_executor.submit("List remote files", job, on_done=on_done,
+            on_progress=on_progress)
+
+
+    def _add_remote_entries(self, entries): #vers 1
+        """Append remote index entries to the remote list, metadata as tooltip"""
+        for entry in entries:
+            item = QListWidgetItem(entry.name)
+            item.setToolTip(entry.summary())
+            self.remote_file_list.addItem(item)
+
+
+    def _on_remote_index_listed(self, success, result): #vers 1
+        """Keep the finished remote index and put the streamed list in order"""
+        if success:
+            self.remote_index = result
+            self.remote_file_list.sortItems()
+            self._log_status(f"Loaded {len(result)} remote files")
+            self._update_file_stats()
+        else:
+            self._log_status(f"Error listing remote files: {result}")
+
+
+    def _on_remote_files_listed(self, success, result): #vers 2
+        """Fill the remote list from listing records returned by a batched remote op"""
+        if success:
+            self.remote_listing_serial += 1
+            self.remote_file_list.clear()
+            index = load_listing_text(RemoteIndex(self.remote_import_path, 1), result)
+            self._add_remote_entries(index.children())
+            self._on_remote_index_listed(True, index)
+        else:
+            self._log_status(f"Error listing remote files: {result}")
 
 
     def _toggle_connection(self): #vers 1
@@ -1063,93 +1709,111 @@ class SSHSyncGUI(QWidget):
             self._connect()
 
 
-    def _connect(self): #vers 1
-        """Connect to remote host"""
+    def _connect(self): #vers 3
+        """Connect to remote host - opens (or reuses) the shared ControlMaster on the job executor"""
         if not self.remote_host or not self.remote_user:
             QMessageBox.warning(self, "Configuration Required", 
                 "Please configure connection settings first")
             self._show_workshop_settings()
             return
 
-        try:
-            # Build SSH command based on auth method
-            if self.use_password:
-                # Using password authentication (requires sshpass)
-                password = self._load_password_securely()
-                if not password:
-                    QMessageBox.warning(self, "Password Required", 
-                        "Please set a password in settings")
-                    return
-                
-                # Test with sshpass
-                cmd = [
-                    "sshpass", "-p", password,
-                    "ssh",
-                    "-p", str(self.remote_port),
-                    "-o", "ConnectTimeout=5",
-                    "-o", "StrictHostKeyChecking=no",
-                    f"{self.remote_user}@{self.remote_host}",
-                    "echo 'OK'"
-                ]
-            else:
-                # Using key authentication
-                cmd = [
-                    "ssh",
-                    "-i", self.ssh_key_path,
-                    "-p", str(self.remote_port),
-                    "-o", "ConnectTimeout=5",
-                    "-o", "StrictHostKeyChecking=no",
-                    f"{self.remote_user}@{self.remote_host}",
-                    "echo 'OK'"
-                ]
+        password = None
+        if self.use_password:
+            # Using password authentication (requires sshpass)
+            password = self._load_password_securely()
+            if not password:
+                QMessageBox.warning(self, "Password Required", 
+                    "Please set a password in settings")
+                return
+
+        self.connect_btn.setEnabled(False)
+        self._log_status(f"Connecting to {self.remote_user}@{self.remote_host}...")
+        # The master doubles as the connection test
+        self.job_executor.submit("Connect", self._open_master_job, password,
+            on_done=self._on_connected)
+
+
+    def _open_master_job(self, token, progress, password): #vers 1
+        """Job body - open the pooled master, returns (success, control path or error)"""
+        return self.ssh_pool.acquire(self.remote_host, self.remote_user,
+            self.remote_port, self.use_password, password, self.ssh_key_path)
+
+
+    def _on_connected(self, success, result): #vers 6
+        """Finish connecting once the master job is done"""
+        self.connect_btn.setEnabled(True)
+        if success:
+            self.control_path = result
+            self.connected = True
+            self.connect_btn.setText("Disconnect")
+            self.connection_status_label.setText(f"Connected to {self.remote_host}")
+            self.refresh_remote_btn.setEnabled(True)
+            self.sync_to_remote_btn.setEnabled(True)
+            self.sync_from_remote_btn.setEnabled(True)
+            self.sync_both_btn.setEnabled(True)
+            self.mirror_btn.setEnabled(True)
+            self.clone_btn.setEnabled(True)
+            self.copy_selected_btn.setEnabled(True)
+            self.download_selected_btn.setEnabled(True)
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            # Enable remote file operation buttons
+            self._set_remote_tools_enabled(True)
             
-            if result.returncode == 0:
-                self.connected = True
-                self.connect_btn.setText("Disconnect")
-                self.connection_status_label.setText(f"Connected to {self.remote_host}")
-                self.refresh_remote_btn.setEnabled(True)
-                self.sync_to_remote_btn.setEnabled(True)
-                self.sync_from_remote_btn.setEnabled(True)
-                self.sync_both_btn.setEnabled(True)
-                self.mirror_btn.setEnabled(True)
-                self.clone_btn.setEnabled(True)
-                self.copy_selected_btn.setEnabled(True)
-                
-                # Enable remote file operation buttons
-                self.remote_rename_btn.setEnabled(True)
-                self.remote_ignore_btn.setEnabled(True)
-                self.remote_find_btn.setEnabled(True)
-                self.remote_replace_btn.setEnabled(True)
-                self.remote_delete_btn.setEnabled(True)
-                self.remote_adddir_btn.setEnabled(True)
-                self.remote_info_btn.setEnabled(True)
-                
-                self._update_status_indicators()
-                self._log_status(f"Connected to {self.remote_user}@{self.remote_host}")
-                self._refresh_remote_files()
-                
-                # Start auto-sync if enabled
-                if self.auto_sync_enabled:
-                    self.sync_timer.start(self.sync_interval * 1000)
+            self._update_status_indicators()
+            self._log_status(f"Connected to {self.remote_user}@{self.remote_host}")
+            self._refresh_remote_files()
+            self._probe_link()
+            self._resume_interrupted()
+            
+            # Start auto-sync if enabled
+            if self.auto_sync_enabled:
+                self._start_auto_sync()
+        else:
+            error_msg = result
+            self._log_status(f"[FAIL] Connection failed: {error_msg}")
+            if "sshpass: not found" in error_msg or "command not found" in error_msg:
+                QMessageBox.warning(self, "Missing Dependency", 
+                    "Password authentication requires 'sshpass' to be installed.\n\n"
+                    "Install it with:\nsudo pacman -S sshpass  (Arch)\n"
+                    "sudo apt install sshpass  (Ubuntu)")
             else:
-                error_msg = result.stderr
-                if "sshpass: not found" in error_msg or "command not found" in error_msg:
-                    QMessageBox.warning(self, "Missing Dependency", 
-                        "Password authentication requires 'sshpass' to be installed.\n\n"
-                        "Install it with:\nsudo pacman -S sshpass  (Arch)\n"
-                        "sudo apt install sshpass  (Ubuntu)")
-                else:
-                    QMessageBox.warning(self, "Connection Failed", 
-                        f"Could not connect:\n{error_msg}")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Connection error:\n{str(e)}")
+                QMessageBox.warning(self, "Connection Failed", 
+                    f"Could not connect:\n{error_msg}")
+
+
+    def _probe_link(self): #vers 1
+        """Measure link throughput and the remote rsync version for the compression policy"""
+        self.compression_policy.mode = self.compression_mode
+        self.compression_policy.configure(self._build_ssh_cmd_prefix(),
+            f"{self.remote_user}@{self.remote_host}")
+
+        policy = self.compression_policy
+        source = f"{self.local_export_path}/"
+        dest = f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}/"
+
+        def job(token, progress):
+            success, result = policy.probe(token)
+            if not success:
+                return False, result
+            # Also warms the sample cache for the export folder
+            return True, (result, policy.rsync_args(source, dest))
+
+        def on_done(success, result):
+            if success:
+                rate, args = result
+                self._log_status(f"[OK] Link ~{format_rate(rate)}, "
+                    f"push compression: {describe_compression(args)}")
+            else:
+                self._log_status(f"[WARN] Link probe failed: {result}")
+
+        self.job_executor.submit("Link probe", job, on_done=on_done)
 
 
-    def _disconnect(self): #vers 1
-        """Disconnect from remote host"""
+    def _disconnect(self): #vers 6
+        """Disconnect from remote host - tears down the pooled masters"""
+        self.ssh_pool.release_all()
+        self.control_path = None
+        self.remote_index = RemoteIndex()
         self.connected = False
         self.connect_btn.setText("Connect")
         self.connection_status_label.setText("Not Connected")
@@ -1160,186 +1824,555 @@ class SSHSyncGUI(QWidget):
         self.mirror_btn.setEnabled(False)
         self.clone_btn.setEnabled(False)
         self.copy_selected_btn.setEnabled(False)
+        self.download_selected_btn.setEnabled(False)
         
         # Disable remote file operation buttons
-        self.remote_rename_btn.setEnabled(False)
-        self.remote_ignore_btn.setEnabled(False)
-        self.remote_find_btn.setEnabled(False)
-        self.remote_replace_btn.setEnabled(False)
-        self.remote_delete_btn.setEnabled(False)
-        self.remote_adddir_btn.setEnabled(False)
-        self.remote_info_btn.setEnabled(False)
+        self._set_remote_tools_enabled(False)
         
-        self.sync_timer.stop()
+        self._stop_auto_sync()
         self._update_status_indicators()
         self._log_status("Disconnected")
 
 
-    def _sync_to_remote(self): #vers 1
+    def _submit_command(self, name, cmd, on_done, timeout=None, input_data=None): #vers 1
+        """Queue a single ssh/rsync command on the job executor"""
+        return self.job_executor.submit(name, run_command_job, cmd, timeout, input_data,
+            on_done=on_done)
+
+
+    def _queue_remote_ops(self, name, operations, on_done, refresh=True): #vers 1
+        """Queue remote file operations as one ssh round trip, relisting in the same session"""
+        password = self._load_password_securely() if self.use_password else None
+        if refresh:
+            operations = operations + [('list', '.', '')]
+        args = (self.remote_host, self.remote_user, self.remote_import_path, operations,
+            self.remote_port, self.use_password, password, self.ssh_key_path, self.control_path)
+
+        def job(token, progress):
+            return remote_batch_ops(*args, token=token)
+
+        def finished(success, results):
+            if success and refresh and results and results[-1][0] == 'list':
+                *results, listing = results
+                self._on_remote_files_listed(listing[1], listing[2])
+            on_done(success, results)
+
+        return self.job_executor.submit(name, job, on_done=finished)
+
+
+    def _queue_transfer(self, name, source, dest, delete, refresh, then=None,
+        resume_delete=None, on_fail=None): #vers 7
+        """Queue a transfer - rsync, sharded rsync streams, or a tar stream for many small files
+
+        resume_delete overrides delete for the journaled resume (False: resume never deletes).
+        """
+        ssh_option = self._build_rsync_ssh_option()
+        remote_prefix = f"{self.remote_user}@{self.remote_host}:"
+        pull = source.startswith(remote_prefix)
+        if not self.parallel_sync_enabled:
+            job = (run_transfer_job, ssh_option, source, dest, delete)
+        else:
+            job = self._sharded_job(source, dest, delete, pull, ssh_option)
+
+        if self.tar_transport_enabled:
+            # The transport plan's file list is what plain rsync runs - only sharded
+            # streams are handed over as a job of their own
+            remote, local = (source, dest) if pull else (dest, source)
+            job = (run_auto_transfer_job, ssh_option, self._build_ssh_cmd_prefix(),
+                remote_prefix[:-1], local.rstrip('/'), remote[len(remote_prefix):].rstrip('/'),
+                not pull, delete, self.tar_compression,
+                job if self.parallel_sync_enabled else None)
+        return self._queue_rsync(name, None, refresh, then, job=job,
+            resume=transfer_spec(name, source, dest, delete if resume_delete is None else resume_delete),
+            on_fail=on_fail)
+
+
+    def _sharded_job(self, source, dest, delete, pull, ssh_option): #vers 1
+        """Sharded parallel rsync job tuple - lists the source tree to build shards"""
+        remote_prefix = f"{self.remote_user}@{self.remote_host}:"
+        if pull:
+            password = self._load_password_securely() if self.use_password else None
+            args = (self.remote_host, self.remote_user, source[len(remote_prefix):].rstrip('/'),
+                self.remote_port, self.use_password, password, self.ssh_key_path,
+                self.control_path)
+
+            def lister():
+                success, files = list_remote_tree(*args)
+                if not success:
+                    raise RuntimeError(files)
+                return files
+        else:
+            local_root = source
+            lister = lambda: walk_local_tree(local_root)
+
+        self._log_status(f"  (sharded mode: up to {self.parallel_max_streams} streams)")
+        return (run_sharded_job, ssh_option, source, dest, delete, lister,
+            self.parallel_max_streams)
+
+
+    def _queue_rsync(self, name, cmd, refresh, then=None, job=None, resume=None,
+        on_fail=None): #vers 7
+        """Queue a streamed rsync transfer, log the outcome and refresh the destination list
+
+        resume is a transfer_spec() to journal, or the id of a journal entry being resumed.
+        on_fail runs (before then) when the transfer fails.
+        """
+        entry_id = self._journal_begin(resume)
+
+        def on_done(success, result):
+            self._clear_transfer_progress(name)
+            self._journal_end(entry_id, name, success, result)
+            if success:
+                transport = f" via {result['transport']}" if result.get('transport') else ""
+                self._log_status(f"[OK] {name} completed{transport} - {len(result['changed'])} changed, "
+                    f"{len(result['deleted'])} deleted, {result['bytes']:,} bytes")
+                refresh()
+                self.sync_completed.emit()
+            else:
+                self._log_status(f"[FAIL] {name} failed: {result}")
+                if on_fail:
+                    on_fail()
+            if then:
+                then()
+
+        fn, *args = job if job else (run_rsync_job, cmd)
+        return self.job_executor.submit(name, fn, *args, on_done=on_done,
+            on_progress=lambda info: self._on_transfer_progress(name, info, entry_id))
+
+
+    def _on_transfer_progress(self, name, info, entry_id=None): #vers 5
+        """Show live rsync throughput, percent, ETA and current file in the status bar
+
+        Each running transfer keeps its own segment, so concurrent jobs are shown side by side;
+        fan-out pushes add the percent of every host still running.
+        """
+        if entry_id:
+            self.transfer_journal.checkpoint(entry_id, info)
+        current = info.get('file', '')
+        if len(current) > 40:
+            current = "..." + current[-37:]
+        if info.get('hosts'):
+            current += " | " + ", ".join(f"{label} {state['percent']}%"
+                for label, state in info['hosts'].items() if state['state'] == "running")
+        streams = f" x{info['streams']}" if info.get('streams') else ""
+        self.transfer_progress[name] = (
+            f"{name}{streams}: {info.get('percent', 0)}% | {format_rate(info.get('rate_bps', 0))} | "
+            f"ETA {info.get('eta') or '--'} | {current}")
+        self.transfer_label.setText("  ||  ".join(self.transfer_progress.values()))
+
+    def _clear_transfer_progress(self, name): #vers 1
+        """Drop a finished transfer's status bar segment"""
+        self.transfer_progress.pop(name, None)
+        self.transfer_label.setText("  ||  ".join(self.transfer_progress.values()))
+
+
+    def _journal_begin(self, resume): #vers 1
+        """Journal entry id for a transfer - resume is a new spec, an existing id, or None"""
+        if resume is None or isinstance(resume, str):
+            return resume
+        return self.transfer_journal.begin(self._connection_key(), resume)
+
+    def _journal_end(self, entry_id, name, success, result): #vers 2
+        """Retire a finished transfer - only runs cut off by the link or a cancel stay for resuming"""
+        if entry_id is None:
+            return
+        if success:
+            self.transfer_journal.finish(entry_id)
+        elif not is_interrupted(result):
+            self.transfer_journal.drop(entry_id)
+        elif entry_id in self.transfer_journal:
+            self._log_status(f"[WARN] {name} kept in the resume journal - resumes on next connect")
+
+    def _connection_key(self): #vers 1
+        return connection_key(self.remote_user, self.remote_host, self.remote_port)
+
+    def _resume_interrupted(self): #vers 1
+        """Queue every journaled transfer of this connection - partial files are reused"""
+        remote_prefix = f"{self.remote_user}@{self.remote_host}:"
+        ssh_option = self._build_rsync_ssh_option()
+        for entry_id, entry in self.transfer_journal.pending(self._connection_key()):
+            spec = entry['spec']
+            if self.transfer_journal.retry(entry_id) is None:
+                self._log_status(f"[FAIL] {spec['name']}: gave up resuming after repeated failures")
+                continue
+            self._log_status(f"[WARN] Resuming interrupted {spec['name']} "
+                f"({entry['bytes']:,} bytes done, last file: {entry['file'] or '-'})")
+            pull = spec['source'].startswith(remote_prefix)
+            refresh = self._refresh_local_files if pull else self._refresh_remote_files
+            self._queue_rsync(f"{spec['name']} (resumed)", None, refresh,
+                job=(run_resume_job, ssh_option, spec, entry['file']), resume=entry_id)
+
+    def _sync_to_remote(self, then=None, on_fail=None): #vers 6
         """Sync local export to remote import"""
         if not self.connected:
             return
 
         self._log_status("Syncing to remote...")
-        try:
-            cmd = [
-                "rsync",
-                "-avz",
-            ]
-            
-            # Only add --delete if option is enabled
-            if self.delete_extra_files:
-                cmd.append("--delete")
-                self._log_status("  (delete mode: removing extra files)")
-            else:
-                self._log_status("  (preserve mode: keeping extra files)")
-            
-            cmd.extend([
-                "-e", self._build_rsync_ssh_option(),
-                f"{self.local_export_path}/",
-                f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}/"
-            ])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                self._log_status("[OK] Sync to remote completed")
-                self._refresh_remote_files()
+        
+        # Only add --delete if option is enabled
+        if self.delete_extra_files:
+            self._log_status("  (delete mode: removing extra files)")
+        else:
+            self._log_status("  (preserve mode: keeping extra files)")
+        
+        if self.incremental_sync_enabled:
+            return self._queue_incremental_push(then, on_fail=on_fail)
+
+        self._queue_transfer("Sync to remote",
+            f"{self.local_export_path}/",
+            f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}/",
+            self.delete_extra_files, self._refresh_remote_files, then, on_fail=on_fail)
+
+
+    def _manifest_key(self): #vers 1
+        return profile_key(self.remote_user, self.remote_host, self.remote_port,
+            self.local_export_path, self.remote_import_path)
+
+
+    def _queue_incremental_push(self, then=None, paths=None, on_fail=None): #vers 5
+        """Push only the paths the local manifest reports changed since the last sync
+
+        paths=None rescans the whole tree - unless the local watcher has tracked every
+        change since a full scan, in which case the manifest is already current.
+        """
+        if paths is None and self.local_watcher and self.manifest_tracked == self._manifest_key():
+            paths = []
+            self._log_status("  (incremental mode: local manifest, kept current by the watcher)")
+        else:
+            self._log_status("  (incremental mode: local manifest)")
+        remote = f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}"
+        # A resumed incremental push runs as a full comparison - the manifest is only committed on success
+        return self._queue_rsync("Sync to remote", None, self._refresh_remote_files, then,
+            job=(run_incremental_push_job, get_manifest_path(self._manifest_key()),
+                self.local_export_path, remote, self._build_rsync_ssh_option(),
+                self.delete_extra_files, paths),
+            resume=transfer_spec("Sync to remote", f"{self.local_export_path}/", f"{remote}/",
+                self.delete_extra_files), on_fail=on_fail)
+
+
+    def _track_manifest(self): #vers 1
+        """Full manifest scan once the local watcher runs - afterwards pushes re-stat only watched paths"""
+        watcher, key = self.local_watcher, self._manifest_key()
+        self.manifest_tracked = None
+        if not (watcher and self.incremental_sync_enabled):
+            return
+
+        def on_done(success, result):
+            if watcher is not self.local_watcher:
+                return
+            if success:
+                self.manifest_tracked = key
+                self._log_status(f"[OK] Local manifest current ({result[0]} changed, "
+                    f"{result[1]} removed since the last scan)")
             else:
-                self._log_status(f"[FAIL] Sync failed: {result.stderr}")
-                
-        except Exception as e:
-            self._log_status(f"[FAIL] Sync error: {e}")
+                self._log_status(f"[WARN] Local manifest scan failed: {result} - pushes rescan")
+
+        self.job_executor.submit("Manifest scan", run_manifest_scan_job,
+            get_manifest_path(self._manifest_key()), self.local_export_path, on_done=on_done)
 
 
-    def _sync_from_remote(self): #vers 1
+    def _sync_from_remote(self, then=None, on_fail=None): #vers 5
         """Sync remote export to local import"""
         if not self.connected:
             return
 
         self._log_status("Syncing from remote...")
-        try:
-            cmd = [
-                "rsync",
-                "-avz",
-            ]
-            
-            # Only add --delete if option is enabled
-            if self.delete_extra_files:
-                cmd.append("--delete")
-                self._log_status("  (delete mode: removing extra files)")
-            else:
-                self._log_status("  (preserve mode: keeping extra files)")
-            
-            cmd.extend([
-                "-e", self._build_rsync_ssh_option(),
-                f"{self.remote_user}@{self.remote_host}:{self.remote_export_path}/",
-                f"{self.local_import_path}/"
-            ])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                self._log_status("[OK] Sync from remote completed")
-                self._refresh_local_files()
-            else:
-                self._log_status(f"[FAIL] Sync failed: {result.stderr}")
-                
-        except Exception as e:
-            self._log_status(f"[FAIL] Sync error: {e}")
-
-
-    def _sync_bidirectional(self): #vers 1
-        """Sync both directions"""
+        
+        # Only add --delete if option is enabled
+        if self.delete_extra_files:
+            self._log_status("  (delete mode: removing extra files)")
+        else:
+            self._log_status("  (preserve mode: keeping extra files)")
+        
+        self._queue_transfer("Sync from remote",
+            f"{self.remote_user}@{self.remote_host}:{self.remote_export_path}/",
+            f"{self.local_import_path}/",
+            self.delete_extra_files, self._refresh_local_files, then, on_fail=on_fail)
+
+
+    def _sync_bidirectional(self): #vers 5
+        """Sync both directions - three-way merge when enabled, else push and pull side by side
+
+        The halves touch disjoint folder pairs (local export -> remote import, remote
+        export -> local import) and run concurrently, each on its own channel of the
+        shared ssh master. Pairs where one folder is or contains the other on either
+        side fall back to pull-after-push.
+        """
+        if self.three_way_sync_enabled:
+            return self._sync_three_way(interactive=True)
+        overlapping = (local_paths_overlap(self.local_export_path, self.local_import_path)
+            or remote_paths_overlap(self.remote_import_path, self.remote_export_path))
+        if overlapping:
+            return self._sync_to_remote(then=self._sync_from_remote)
         self._sync_to_remote()
         self._sync_from_remote()
 
-    def _mirror_to_remote(self): #vers 1
-        """Mirror local to remote - makes remote identical to local (DESTRUCTIVE)"""
+    def _sync_three_way(self, interactive=False, allow_deletions=False): #vers 3
+        """Three-way sync of local export <-> remote import against the last synced state
+
+        A run the deletion guard refuses is offered for confirmation when interactive,
+        and rerun with allow_deletions - auto-sync only logs it. Only one merge runs
+        at a time; requests meanwhile (watcher batches, timer, Sync Both) collapse
+        into one rerun when it finishes.
+        """
         if not self.connected:
             return
-        
-        reply = QMessageBox.warning(
-            self,
-            "Confirm Mirror",
-            "This will make the remote directory IDENTICAL to local.\n"
-            "All files on remote not in local will be DELETED!\n\n"
-            "WARNING: This operation ALWAYS deletes extra files (--delete flag),\n"
-            "regardless of your sync settings.\n\n"
-            "Continue?",
+        if self.three_way_running:
+            self.three_way_again = bool(interactive or self.three_way_again)
+            return
+        self.three_way_running = True
+        self._log_status("Two-way sync (three-way merge)...")
+        remote = f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}"
+        state_path = get_state_path(profile_key(self.remote_user, self.remote_host,
+            self.remote_port, self.local_export_path, self.remote_import_path))
+        password = self._load_password_securely() if self.use_password else None
+        args = (self.remote_host, self.remote_user, self.remote_import_path, self.remote_port,
+            self.use_password, password, self.ssh_key_path, self.control_path)
+
+        def lister(token):
+            return list_remote_index(*args, max_depth=None, token=token, strict=True)
+
+        def on_done(success, result):
+            self._clear_transfer_progress("Two-way sync")
+            self.three_way_running = False
+            again, self.three_way_again = self.three_way_again, None
+            if again is not None:
+                QTimer.singleShot(0, lambda: self._sync_three_way(again))
+            if not success and isinstance(result, dict):
+                self._confirm_bisync_deletions(result, interactive)
+                return
+            if not success:
+                self._log_status(f"[FAIL] Two-way sync failed: {result}")
+                return
+            self._log_status(f"[OK] Two-way sync completed - {result['pushed']} pushed, "
+                f"{result['pulled']} pulled, {result['bytes']:,} bytes")
+            self._refresh_local_files()
+            self._refresh_remote_files()
+            self.sync_completed.emit()
+            conflicts = result['conflicts']
+            if conflicts:
+                self._log_status(f"[WARN] {len(conflicts)} conflict(s) changed on both sides - "
+                    "left untouched")
+                if interactive:
+                    self._show_conflicts(conflicts, state_path, remote)
+
+        self.job_executor.submit("Two-way sync", run_bisync_job, state_path,
+            self._build_rsync_ssh_option(), self.local_export_path, remote, lister,
+            allow_deletions, on_done=on_done,
+            on_progress=lambda info: self._on_transfer_progress("Two-way sync", info))
+
+    def _confirm_bisync_deletions(self, refusal, interactive): #vers 1
+        """Deletion guard objected - ask before rerunning the two-way sync with deletions allowed"""
+        self._log_status(f"[WARN] Two-way sync held back: {refusal['refused']}")
+        if not interactive:
+            self._log_status("[WARN] Run Sync Both to review and confirm the deletions")
+            return
+        reply = QMessageBox.question(self, "Confirm Deletions",
+            f"{refusal['refused']}\n\n"
+            f"Local files to delete: {refusal['delete_local']:,}\n"
+            f"Remote files to delete: {refusal['delete_remote']:,}\n\n"
+            "Delete them and continue the two-way sync?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
+            QMessageBox.StandardButton.No)
+        if reply == QMessageBox.StandardButton.Yes:
+            self._sync_three_way(interactive, allow_deletions=True)
+
+    def _show_conflicts(self, conflicts, state_path, remote): #vers 1
+        """List two-way sync conflicts and apply the chosen side for each"""
+        from datetime import datetime
+
+        def describe(state):
+            if not state:
+                return "deleted"
+            return f"{state[0]:,} bytes, {datetime.fromtimestamp(state[1]):%Y-%m-%d %H:%M:%S}"
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Two-Way Sync Conflicts")
+        dialog.setMinimumSize(700, 400)
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel(f"{len(conflicts)} file(s) changed on both sides since the last sync."))
+
+        table = QTableWidget(len(conflicts), 4)
+        table.setHorizontalHeaderLabels(["Path", "Local", "Remote", "Keep"])
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        choices = []
+        for row, (path, here, there) in enumerate(conflicts):
+            table.setItem(row, 0, QTableWidgetItem(path))
+            table.setItem(row, 1, QTableWidgetItem(describe(here)))
+            table.setItem(row, 2, QTableWidgetItem(describe(there)))
+            combo = QComboBox()
+            combo.addItems(["Skip", "Local", "Remote"])
+            table.setCellWidget(row, 3, combo)
+            choices.append(combo)
+        layout.addWidget(table)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        apply_btn = QPushButton("Apply")
+        apply_btn.clicked.connect(dialog.accept)
+        button_layout.addWidget(apply_btn)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.reject)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        keep = {"Local": KEEP_LOCAL, "Remote": KEEP_REMOTE}
+        resolutions = [(path, keep[combo.currentText()], here, there)
+            for (path, here, there), combo in zip(conflicts, choices)
+            if combo.currentText() in keep]
+        if not resolutions:
+            return
+        self._log_status(f"Resolving {len(resolutions)} conflict(s)...")
+        self._queue_rsync("Resolve conflicts", None, self._refresh_remote_files,
+            then=self._refresh_local_files,
+            job=(run_resolve_job, state_path, self._build_rsync_ssh_option(),
+                self.local_export_path, remote, resolutions))
+
+    def _push_to_host_group(self): #vers 1
+        """Push the local export folder to every host of the host group in parallel"""
+        success, hosts = parse_host_group(self.fanout_hosts, self.remote_user, self.remote_port)
+        if not success:
+            QMessageBox.warning(self, "Host Group", f"Invalid host group:\n{hosts}")
+            return
+        if not hosts:
+            QMessageBox.information(self, "Host Group",
+                "Add hosts under Settings > Sync Options > Host Group first")
             return
-        
-        self._log_status("Mirroring local to remote (DESTRUCTIVE)...")
-        try:
-            cmd = [
-                "rsync",
-                "-avz",
-                "--delete",  # ALWAYS delete for mirror operation
-                "-e", self._build_rsync_ssh_option(),
-                f"{self.local_export_path}/",
-                f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}/"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                self._log_status("[OK] Mirror to remote completed")
-                self._refresh_remote_files()
-            else:
-                self._log_status(f"[FAIL] Mirror failed: {result.stderr}")
-                
-        except Exception as e:
-            self._log_status(f"[FAIL] Mirror error: {e}")
 
-    def _clone_from_remote(self): #vers 1
-        """Clone remote to local - makes local identical to remote (DESTRUCTIVE)"""
+        password = self._load_password_securely() if self.use_password else None
+
+        def ssh_option_for(port):
+            return build_rsync_ssh_option(self.use_password, password, self.ssh_key_path, port)
+
+        def on_done(success, results):
+            self._clear_transfer_progress("Fan-out")
+            if not success:
+                self._log_status(f"[FAIL] Fan-out push failed: {results}")
+                return
+            failed = [result for result in results if not result['success']]
+            for result in results:
+                if result['success']:
+                    self._log_status(f"[OK] {result['host']}: {result['changed']} changed, "
+                        f"{result['deleted']} deleted, {result['bytes']:,} bytes")
+                else:
+                    self._log_status(f"[FAIL] {result['host']}: {result['error']}")
+            self._log_status(f"Fan-out push: {len(results) - len(failed)}/{len(results)} hosts succeeded")
+            self._show_fanout_results(results)
+
+        self._log_status(f"Fan-out push to {len(hosts)} host(s), {self.fanout_max_parallel} at once...")
+        self.job_executor.submit("Fan-out", run_fanout_job, self.local_export_path, hosts,
+            self.remote_import_path, self.delete_extra_files, self.fanout_max_parallel,
+            ssh_option_for, on_done=on_done,
+            on_progress=lambda info: self._on_transfer_progress("Fan-out", info))
+
+    def _show_fanout_results(self, results): #vers 1
+        """Fan-out results table - one row per host"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Fan-out Results")
+        dialog.setMinimumSize(700, 300)
+        layout = QVBoxLayout(dialog)
+
+        table = QTableWidget(len(results), 6)
+        table.setHorizontalHeaderLabels(["Host", "Status", "Changed", "Deleted", "Bytes", "Time / Error"])
+        table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        for row, result in enumerate(results):
+            status = QTableWidgetItem("[OK]" if result['success'] else "[FAIL]")
+            status.setForeground(QColor("#00aa00" if result['success'] else "#ff0000"))
+            detail = f"{result['seconds']:.1f}s" if result['success'] else result['error']
+            for column, item in enumerate((QTableWidgetItem(result['host']), status,
+                    QTableWidgetItem(f"{result['changed']:,}"), QTableWidgetItem(f"{result['deleted']:,}"),
+                    QTableWidgetItem(f"{result['bytes']:,}"), QTableWidgetItem(detail))):
+                table.setItem(row, column, item)
+        layout.addWidget(table)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dialog.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        dialog.exec()
+
+    def _mirror_to_remote(self): #vers 5
+        """Mirror local to remote - makes remote identical to local (DESTRUCTIVE)"""
         if not self.connected:
             return
-        
-        reply = QMessageBox.warning(
-            self,
-            "Confirm Clone",
-            "This will make the local directory IDENTICAL to remote.\n"
-            "All files locally not on remote will be DELETED!\n\n"
-            "WARNING: This operation ALWAYS deletes extra files (--delete flag),\n"
-            "regardless of your sync settings.\n\n"
-            "Continue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
+
+        self._log_status("Planning mirror to remote...")
+        self._queue_planned("Mirror to remote", "Confirm Mirror",
+            "This will make the remote directory IDENTICAL to local.",
+            f"{self.local_export_path}/",
+            f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}/",
+            self._refresh_remote_files)  # ALWAYS delete for mirror operation
+
+    def _clone_from_remote(self): #vers 5
+        """Clone remote to local - makes local identical to remote (DESTRUCTIVE)"""
+        if not self.connected:
             return
-        
-        self._log_status("Cloning remote to local (DESTRUCTIVE)...")
-        try:
-            cmd = [
-                "rsync",
-                "-avz",
-                "--delete",  # ALWAYS delete for clone operation
-                "-e", self._build_rsync_ssh_option(),
-                f"{self.remote_user}@{self.remote_host}:{self.remote_export_path}/",
-                f"{self.local_import_path}/"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                self._log_status("[OK] Clone from remote completed")
-                self._refresh_local_files()
+
+        self._log_status("Planning clone from remote...")
+        self._queue_planned("Clone from remote", "Confirm Clone",
+            "This will make the local directory IDENTICAL to remote.",
+            f"{self.remote_user}@{self.remote_host}:{self.remote_export_path}/",
+            f"{self.local_import_path}/",
+            self._refresh_local_files)  # ALWAYS delete for clone operation
+
+    def _queue_planned(self, name, title, intro, source, dest, refresh): #vers 1
+        """Dry-run a destructive transfer, show its plan for confirmation, then run exactly that plan"""
+        cached = self.plan_cache.get(source, dest, True)
+        if cached is not None:
+            return self._confirm_plan(name, title, intro, source, dest, refresh, True, cached)
+
+        def on_done(success, result):
+            self._clear_transfer_progress(f"Plan {name}")
+            if success:
+                self.plan_cache.put(source, dest, True, result)
             else:
-                self._log_status(f"[FAIL] Clone failed: {result.stderr}")
-                
-        except Exception as e:
-            self._log_status(f"[FAIL] Clone error: {e}")
+                self._log_status(f"[FAIL] Planning {name} failed: {result}")
+            self._confirm_plan(name, title, intro, source, dest, refresh, success, result)
+
+        self.job_executor.submit(f"Plan {name}", run_plan_job, self._build_rsync_ssh_option(),
+            source, dest, True, on_done=on_done,
+            on_progress=lambda info: self._on_transfer_progress(f"Plan {name}", info))
+
+    def _confirm_plan(self, name, title, intro, source, dest, refresh, planned, plan): #vers 2
+        """Confirmation dialog listing the plan - without a plan, the generic warning and a full transfer"""
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Warning)
+        box.setWindowTitle(title)
+        if planned:
+            summary, details = describe_plan(plan)
+            if not details:
+                self._log_status(f"[OK] {name}: nothing to do - already identical")
+                return
+            box.setText(f"{intro}\n\n{summary}\n\nContinue?")
+            box.setDetailedText(details)
+        else:
+            box.setText(f"{intro}\nAll files not in the source will be DELETED!\n\n"
+                "WARNING: This operation ALWAYS deletes extra files (--delete flag),\n"
+                "regardless of your sync settings.\n\n"
+                "Continue?")
+        box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        if box.exec() != QMessageBox.StandardButton.Yes:
+            return
 
-    def _copy_selected(self): #vers 1
-        """Copy selected files from local to remote"""
+        # An interrupted run is resumed without asking again, so it only resends -
+        # deletions always go through this confirmation
+        self._log_status(f"{name} (DESTRUCTIVE)...")
+        if not planned:
+            return self._queue_transfer(name, source, dest, True, refresh, resume_delete=False)
+        self.plan_cache.take(source, dest, True)
+        self._queue_rsync(name, None, refresh,
+            job=(run_planned_job, self._build_rsync_ssh_option(), source, dest, plan),
+            resume=transfer_spec(name, source, dest, False, plan_resume_paths(plan)))
+
+    def _copy_selected(self): #vers 3
+        """Copy selected files from local to remote - one rsync for the whole selection"""
         if not self.connected:
             return
         
@@ -1348,34 +2381,56 @@ class SSHSyncGUI(QWidget):
             QMessageBox.information(self, "No Selection", "Please select files to copy")
             return
         
-        file_list = [item.text() for item in selected_items]
+        file_list = [item.text() for item in selected_items
+            if (Path(self.local_export_path) / item.text()).exists()]
         self._log_status(f"Copying {len(file_list)} selected files...")
-        
-        try:
-            for filename in file_list:
-                local_file = Path(self.local_export_path) / filename
-                if local_file.exists():
-                    cmd = [
-                        "rsync",
-                        "-avz",
-                        "-e", self._build_rsync_ssh_option(),
-                        str(local_file),
-                        f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}/"
-                    ]
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                    
-                    if result.returncode == 0:
+        self._queue_batch_copy("Copy selected", file_list, self.local_export_path,
+            f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}",
+            self._refresh_remote_files)
+
+    def _copy_selected_from_remote(self): #vers 1
+        """Download selected remote files to local import - one rsync for the whole selection"""
+        if not self.connected:
+            return
+
+        selected_items = self.remote_file_list.selectedItems()
+        if not selected_items:
+            QMessageBox.information(self, "No Selection", "Please select remote files to download")
+            return
+
+        file_list = [item.text() for item in selected_items]
+        self._log_status(f"Downloading {len(file_list)} selected files to {self.local_import_path}...")
+        self._queue_batch_copy("Download selected", file_list,
+            f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}",
+            self.local_import_path, self._refresh_local_files)
+
+    def _queue_batch_copy(self, name, file_list, source_dir, dest_dir, refresh): #vers 4
+        """Queue one rsync over an explicit selection passed NUL-separated via --files-from"""
+        if not file_list:
+            return
+        entry_id = self._journal_begin(transfer_spec(name, f"{source_dir}/", f"{dest_dir}/",
+            False, file_list))
+
+        def on_done(success, result):
+            self._clear_transfer_progress(name)
+            self._journal_end(entry_id, name, success, result)
+            if success:
+                changed = set(result['changed'])
+                for filename in file_list:
+                    if filename in changed or any(path.startswith(filename + "/") for path in changed):
                         self._log_status(f"[OK] Copied: {filename}")
                     else:
-                        self._log_status(f"[FAIL] Failed: {filename}")
-            
-            self._refresh_remote_files()
-            
-        except Exception as e:
-            self._log_status(f"[FAIL] Copy error: {e}")
+                        self._log_status(f"[OK] Up to date: {filename}")
+                refresh()
+                self.sync_completed.emit()
+            else:
+                self._log_status(f"[FAIL] {name} failed: {result}")
+
+        self.job_executor.submit(name, run_batch_job, self._build_rsync_ssh_option(), source_dir,
+            dest_dir, file_list, on_done=on_done,
+            on_progress=lambda info: self._on_transfer_progress(name, info, entry_id))
 
-    def _rename_file(self, location): #vers 2
+    def _rename_file(self, location): #vers 4
         """Rename selected file"""
         file_list = self.local_file_list if location == "local" else self.remote_file_list
         selected = file_list.selectedItems()
@@ -1399,23 +2454,18 @@ class SSHSyncGUI(QWidget):
                 except Exception as e:
                     self._log_status(f"[FAIL] Rename failed: {e}")
             else:
-                # Remote rename via SSH
+                # Remote rename via SSH - rename and relist in one round trip
                 if not self.connected:
                     return
-                try:
-                    ssh_cmd = self._build_ssh_cmd_prefix()
-                    cmd = ssh_cmd + [
-                        f"{self.remote_user}@{self.remote_host}",
-                        f"cd {self.remote_import_path} && mv '{old_name}' '{new_name}'"
-                    ]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
+
+                def on_done(success, results):
+                    if success and results[0][1]:
                         self._log_status(f"[OK] Renamed: {old_name} to {new_name}")
-                        self._refresh_remote_files()
                     else:
-                        self._log_status(f"[FAIL] Remote rename failed: {result.stderr}")
-                except Exception as e:
-                    self._log_status(f"[FAIL] Rename error: {e}")
+                        error = results[0][2] if success else results
+                        self._log_status(f"[FAIL] Remote rename failed: {error}")
+
+                self._queue_remote_ops("Remote rename", [('rename', old_name, new_name)], on_done)
 
     def _ignore_file(self, location): #vers 2
         """Mark file to be ignored during sync"""
@@ -1478,7 +2528,7 @@ class SSHSyncGUI(QWidget):
             QMessageBox.information(self, "Not Supported", 
                 "Remote file replace not yet supported.\nUse local replace then sync.")
 
-    def _delete_file(self, location): #vers 1
+    def _delete_file(self, location): #vers 3
         """Delete selected file"""
         file_list = self.local_file_list if location == "local" else self.remote_file_list
         selected = file_list.selectedItems()
@@ -1515,23 +2565,22 @@ class SSHSyncGUI(QWidget):
         else:
             if not self.connected:
                 return
-            for filename in files_to_delete:
-                try:
-                    ssh_cmd = self._build_ssh_cmd_prefix()
-                    cmd = ssh_cmd + [
-                        f"{self.remote_user}@{self.remote_host}",
-                        f"rm -rf {self.remote_import_path}/{filename}"
-                    ]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
+
+            # Every delete plus the relist travel in one ssh round trip
+            def on_done(success, results):
+                if not success:
+                    self._log_status(f"[FAIL] Delete error: {results}")
+                    return
+                for filename, (_, deleted, output) in zip(files_to_delete, results):
+                    if deleted:
                         self._log_status(f"[OK] Deleted: {filename}")
                     else:
-                        self._log_status(f"[FAIL] Delete failed: {result.stderr}")
-                except Exception as e:
-                    self._log_status(f"[FAIL] Delete error: {e}")
-            self._refresh_remote_files()
+                        self._log_status(f"[FAIL] Delete failed: {output}")
 
-    def _add_directory(self, location): #vers 1
+            self._queue_remote_ops("Remote delete",
+                [('delete', filename, '') for filename in files_to_delete], on_done)
+
+    def _add_directory(self, location): #vers 3
         """Create new directory"""
         dir_name, ok = QInputDialog.getText(self, "Add Directory", "Directory name:")
         
@@ -1547,22 +2596,17 @@ class SSHSyncGUI(QWidget):
             else:
                 if not self.connected:
                     return
-                try:
-                    ssh_cmd = self._build_ssh_cmd_prefix()
-                    cmd = ssh_cmd + [
-                        f"{self.remote_user}@{self.remote_host}",
-                        f"mkdir -p {self.remote_import_path}/{dir_name}"
-                    ]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
+
+                def on_done(success, results):
+                    if success and results[0][1]:
                         self._log_status(f"[OK] Created directory: {dir_name}")
-                        self._refresh_remote_files()
                     else:
-                        self._log_status(f"[FAIL] Create directory failed: {result.stderr}")
-                except Exception as e:
-                    self._log_status(f"[FAIL] Directory error: {e}")
+                        error = results[0][2] if success else results
+                        self._log_status(f"[FAIL] Create directory failed: {error}")
+
+                self._queue_remote_ops("Remote mkdir", [('mkdir', dir_name, '')], on_done)
 
-    def _show_file_info(self, location): #vers 2
+    def _show_file_info(self, location): #vers 5
         """Show file information"""
         file_list = self.local_file_list if location == "local" else self.remote_file_list
         selected = file_list.selectedItems()
@@ -1593,43 +2637,225 @@ Path: {file_path} n/
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not get file info: {e}")
         else:
+            # Answer from the listing index when possible - no network round trip
+            description = self.remote_index.describe(filename)
+            if description:
+                QMessageBox.information(self, "Remote File Info", description)
+                return
             if not self.connected:
                 return
-            try:
-                ssh_cmd = self._build_ssh_cmd_prefix()
-                cmd = ssh_cmd + [
-                    f"{self.remote_user}@{self.remote_host}",
-                    f"stat {self.remote_import_path}/{filename}"
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    QMessageBox.information(self, "Remote File Info", result.stdout)
+
+            def on_done(success, results):
+                if success and results[0][1]:
+                    QMessageBox.information(self, "Remote File Info", results[0][2])
                 else:
-                    QMessageBox.warning(self, "Error", f"Could not get file info: {result.stderr}")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"File info error: {e}")
+                    error = results[0][2] if success else results
+                    QMessageBox.warning(self, "Error", f"Could not get file info: {error}")
+
+            self._queue_remote_ops("Remote file info", [('stat', filename, '')], on_done,
+                refresh=False)
 
 
-    def _auto_sync(self): #vers 1
-        """Auto-sync timer callback"""
+    def _auto_sync(self): #vers 5
+        """Auto-sync timer callback - covers whichever direction has no watcher"""
         if self.connected and not self.syncing:
             self._log_status("Auto-sync triggered")
-            self._sync_bidirectional()
+            if self.three_way_sync_enabled:
+                self._sync_three_way()  # conflicts only logged, Sync Both offers to resolve
+            elif self.remote_watcher:
+                self._sync_to_remote()
+            elif self.local_watcher:
+                self._sync_from_remote()
+            else:
+                self._sync_bidirectional()
+
+
+    def _on_jobs_busy_changed(self, busy): #vers 2
+        """An executor started or drained - the syncing flag follows interactive jobs only"""
+        self.syncing = self.job_executor.busy
+        self.cancel_jobs_btn.setEnabled(self.job_executor.busy or self.profile_executor.busy)
+
 
+    def _cancel_jobs(self): #vers 3
+        """Cancel every queued and running job - cancelled transfers are not resumed"""
+        self.job_executor.cancel_all()
+        self.profile_executor.cancel_all()
+        self.transfer_journal.discard(self._connection_key())
+        self._log_status("[WARN] Cancelling running jobs...")
 
-    def _toggle_auto_sync(self, state): #vers 1
+
+    def _toggle_auto_sync(self, state): #vers 2
         """Toggle auto-sync on/off"""
         enabled = (state == Qt.CheckState.Checked.value)
         self.auto_sync_enabled = enabled
         
         if enabled and self.connected:
-            self.sync_timer.start(self.sync_interval * 1000)
+            self._start_auto_sync()
             self._log_status("Auto-sync enabled")
         else:
-            self.sync_timer.stop()
+            self._stop_auto_sync()
             self._log_status("Auto-sync disabled")
 
 
+    def _start_auto_sync(self): #vers 5
+        """Start the local/remote watchers, plus the interval timer for any direction without one
+
+        In two-way mode the remote watcher follows the remote import folder, the
+        other side of the three-way merge, and no manifest is tracked.
+        """
+        if self.watch_mode_enabled:
+            watcher = LocalWatcher(self.local_export_path, self.local_changes_detected.emit,
+                self.watch_latency)
+            success, result = watcher.start()
+            if success:
+                self.local_watcher = watcher
+                self._log_status(f"[OK] Watching {self.local_export_path} ({result} directories)")
+                if not self.three_way_sync_enabled:
+                    self._track_manifest()
+            else:
+                self._log_status(f"[WARN] Watch mode unavailable ({result}) - using interval timer")
+
+        if self.remote_watch_enabled:
+            password = self._load_password_securely() if self.use_password else None
+            ssh_prefix = build_ssh_cmd_prefix(self.use_password, password, self.ssh_key_path,
+                self.remote_port, self.control_path)
+            watched = self.remote_import_path if self.three_way_sync_enabled else self.remote_export_path
+            cmd = build_remote_watch_cmd(ssh_prefix, f"{self.remote_user}@{self.remote_host}",
+                quote_remote_path(watched))
+            self.remote_watcher = RemoteWatcher(cmd, self.remote_changes_detected.emit,
+                self.remote_watch_status.emit, self.watch_latency, self.remote_watch_stopped.emit)
+            self.remote_watcher.start()
+
+        if not (self.local_watcher and self.remote_watcher):
+            self.sync_timer.start(self.sync_interval * 1000)
+
+
+    def _stop_auto_sync(self): #vers 3
+        """Stop the watchers and the interval timer"""
+        self.sync_timer.stop()
+        self.manifest_tracked = None
+        if self.local_watcher:
+            self.local_watcher.stop()
+            self.local_watcher = None
+        if self.remote_watcher:
+            self.remote_watcher.stop()
+            self.remote_watcher = None
+        self.local_pending.clear()
+        self.remote_pending.clear()
+
+
+    def _on_local_changes(self, paths): #vers 4
+        """Local watcher batch arrived - coalesce with anything pending while a push runs"""
+        if not self.connected or not self.local_watcher:
+            return
+        self.plan_cache.clear()
+        if self.three_way_sync_enabled:
+            return self._sync_three_way()
+        self.local_pending.add(paths)
+        self._flush_local_changes()
+
+
+    def _flush_local_changes(self): #vers 4
+        """Push pending watched changes - only those paths unless events were lost
+
+        A failed push puts its batch back - it goes out with the next watcher batch
+        rather than being retried at once against a link that just failed.
+        """
+        batch = self.local_pending.take()
+        if batch is None:
+            return
+        full, paths = batch
+        failed = []
+
+        def on_fail():
+            failed.append(True)
+            if self.local_watcher:
+                self.local_pending.add(None if full else paths)
+
+        def then():
+            self.local_pending.finish()
+            if not failed:
+                self._flush_local_changes()
+
+        if full:
+            self._log_status("[WARN] Watch events overflowed - running full sync")
+            self.manifest_tracked = None  # this push rescans; tracking resumes once it succeeds
+            key = self._manifest_key() if self.incremental_sync_enabled else None
+
+            def then_full():
+                if key and not failed and self.local_watcher:
+                    self.manifest_tracked = key
+                then()
+
+            self._sync_to_remote(then=then_full, on_fail=on_fail)
+            return
+
+        self._log_status(f"Auto-sync: {len(paths)} changed path(s)")
+        if self.incremental_sync_enabled:
+            self._queue_incremental_push(then, paths, on_fail=on_fail)
+        else:
+            remote = f"{self.remote_user}@{self.remote_host}:{self.remote_import_path}"
+            self._queue_rsync("Sync to remote", None, self._refresh_remote_files, then,
+                job=(run_paths_job, self._build_rsync_ssh_option(), self.local_export_path,
+                    remote, paths, self.delete_extra_files),
+                resume=transfer_spec("Sync to remote", f"{self.local_export_path}/", f"{remote}/",
+                    self.delete_extra_files, paths), on_fail=on_fail)
+
+
+    def _on_remote_watch_stopped(self, watcher): #vers 1
+        """Remote watcher gave up - pulls go back to the interval timer"""
+        if watcher is not self.remote_watcher:
+            return
+        self.remote_watcher = None
+        self.remote_pending.clear()
+        if self.connected and self.auto_sync_enabled:
+            self._log_status("[WARN] Remote watch stopped - pulling on the auto-sync interval")
+            if not self.sync_timer.isActive():
+                self.sync_timer.start(self.sync_interval * 1000)
+
+
+    def _on_remote_changes(self, paths): #vers 3
+        """Remote watcher batch arrived - coalesce with anything pending while a pull runs"""
+        if not self.connected or not self.remote_watcher:
+            return
+        self.plan_cache.clear()
+        if self.three_way_sync_enabled:
+            return self._sync_three_way()
+        self.remote_pending.add(paths)
+        self._flush_remote_changes()
+
+
+    def _flush_remote_changes(self): #vers 2
+        """Pull only the remote paths the watcher reported - a failed pull puts its batch back"""
+        batch = self.remote_pending.take()
+        if batch is None:
+            return
+        full, paths = batch
+        failed = []
+
+        def on_fail():
+            failed.append(True)
+            if self.remote_watcher:
+                self.remote_pending.add(None if full else paths)
+
+        def then():
+            self.remote_pending.finish()
+            if not failed:
+                self._flush_remote_changes()
+
+        if full:
+            self._sync_from_remote(then=then, on_fail=on_fail)
+            return
+
+        self._log_status(f"Auto-sync: {len(paths)} remote change(s)")
+        remote = f"{self.remote_user}@{self.remote_host}:{self.remote_export_path}"
+        self._queue_rsync("Sync from remote", None, self._refresh_local_files, then,
+            job=(run_paths_job, self._build_rsync_ssh_option(), remote, self.local_import_path,
+                paths, self.delete_extra_files),
+            resume=transfer_spec("Sync from remote", f"{remote}/", f"{self.local_import_path}/",
+                self.delete_extra_files, paths), on_fail=on_fail)
+
+
     def _log_status(self, message): #vers 1
         """Add message to status log"""
         from datetime import datetime
@@ -1641,10 +2867,10 @@ Path: {file_path} n/
         )
 
 
-    def _update_file_stats(self): #vers 1
+    def _update_file_stats(self): #vers 2
         """Update file count statistics"""
         local_count = self.local_file_list.count()
-        remote_count = self.remote_file_list.count()
+        remote_count = self.remote_file_list.count() if self.remote_file_list else 0
         self.stats_label.setText(f"Local: {local_count} files | Remote: {remote_count} files")
 
 
@@ -1655,7 +2881,7 @@ Path: {file_path} n/
             "Bidirectional file synchronization between Linux machines.\n\n"
             "Version 1.2")
 
-    def _show_theme_settings(self): #vers 1
+    def _show_theme_settings(self): #vers 2
         """Launch the main theme settings dialog from app_settings_system"""
         try:
             # Try to import from utils directory
@@ -1671,8 +2897,8 @@ Path: {file_path} n/
             try:
                 from app_settings_system import AppSettings, SettingsDialog
                 
-                # Create or get app_settings instance
-                if not self.app_settings:
+                # Replace the startup snapshot with the full settings system on first use
+                if not isinstance(self.app_settings, AppSettings):
                     self.app_settings = AppSettings()
                 
                 # Show the main settings dialog
@@ -1711,6 +2937,16 @@ Path: {file_path} n/
         quit_shortcut.activated.connect(self.close)
 
 
+    def closeEvent(self, event): #vers 5
+        """Stop background jobs and close pooled SSH masters on exit"""
+        self._stop_auto_sync()
+        self.profile_timer.stop()
+        self.job_executor.shutdown()
+        self.profile_executor.shutdown()
+        self.ssh_pool.release_all()
+        super().closeEvent(event)
+
+
     def _toggle_maximize(self): #vers 1
         """Toggle window maximize state"""
         if self.isMaximized():
@@ -1858,7 +3094,7 @@ Path: {file_path} n/
 
 
     # Theme and icon methods
-    def _apply_theme(self): #vers 1
+    def _apply_theme(self): #vers 2
         """Apply current theme to the window - integrates with app_settings"""
         # Try to get theme from app_settings if available
         if self.app_settings and hasattr(self.app_settings, 'current_settings'):
@@ -1911,6 +3147,13 @@ Path: {file_path} n/
         # Calculate alternating row colors
         from PyQt6.QtGui import QColor
         bg_qcolor = QColor(bg_color)
+
+        # Icons are only redrawn when the text color they are drawn in changes
+        icon_color = QColor(text_color).name()
+        if icon_color != self.icon_color:
+            self.icon_color = icon_color
+            set_theme_color(icon_color)
+            self._refresh_themed_icons()
         
         # Make alternate row slightly lighter or darker
         alternate_color = bg_qcolor.lighter(110) if bg_qcolor.lightness() < 128 else bg_qcolor.darker(110)
@@ -2003,224 +3246,119 @@ Path: {file_path} n/
         """)
 
 
-    def _create_info_icon(self): #vers 1
+    def _create_info_icon(self): #vers 2
         """Info icon"""
-        svg_data = b'''<svg width="20" height="20" viewBox="0 0 20 20" fill="none" xmlns="http://www.w3.org/2000/svg">
-            <circle cx="10" cy="10" r="8" stroke="currentColor" stroke-width="2"/>
-            <path d="M10 6v4M10 14h.01" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
+        return self._svg_to_icon(ICON_SVGS['info'], size=20)
 
 
-    def _create_settings_icon(self): #vers 1
+    def _create_settings_icon(self): #vers 2
         """Settings/gear icon"""
-        svg_data = b'''<svg width="20" height="20" viewBox="0 0 20 20" fill="none" xmlns="http://www.w3.org/2000/svg">
-            <circle cx="10" cy="10" r="3" stroke="currentColor" stroke-width="2"/>
-            <path d="M10 2v2M10 16v2M2 10h2M16 10h2M4.93 4.93l1.41 1.41M13.66 13.66l1.41 1.41M4.93 15.07l1.41-1.41M13.66 6.34l1.41-1.41" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
+        return self._svg_to_icon(ICON_SVGS['settings'], size=20)
 
-    def _create_theme_icon(self): #vers 1
+    def _create_theme_icon(self): #vers 2
         """Theme/palette icon"""
-        svg_data = b'''<svg width="20" height="20" viewBox="0 0 20 20" fill="none" xmlns="http://www.w3.org/2000/svg">
-            <path d="M10 2C5.58 2 2 5.58 2 10c0 4.42 3.58 8 8 8 .5 0 1-.4 1-1 0-.25-.1-.48-.24-.65-.14-.17-.24-.42-.24-.65 0-.55.45-1 1-1h1.5c2.48 0 4.5-2.02 4.5-4.5C17.52 5.58 14.42 2 10 2z" stroke="currentColor" stroke-width="1.5" fill="none"/>
-            <circle cx="5.5" cy="10" r="1" fill="currentColor"/>
-            <circle cx="8" cy="7" r="1" fill="currentColor"/>
-            <circle cx="12" cy="7" r="1" fill="currentColor"/>
-            <circle cx="14.5" cy="10" r="1" fill="currentColor"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _create_minimize_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['theme'], size=20)
+
+    def _create_minimize_icon(self): #vers 2
         """Minimize - Horizontal line icon"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <line x1="5" y1="12" x2="19" y2="12"
-                stroke="currentColor" stroke-width="2"
-                stroke-linecap="round"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
+        return self._svg_to_icon(ICON_SVGS['minimize'], size=20)
 
 
-    def _create_maximize_icon(self): #vers 1
+    def _create_maximize_icon(self): #vers 2
         """Maximize - Square icon"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <rect x="5" y="5" width="14" height="14"
-                stroke="currentColor" stroke-width="2"
-                fill="none" rx="2"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
+        return self._svg_to_icon(ICON_SVGS['maximize'], size=20)
 
 
-    def _create_close_icon(self): #vers 1
+    def _create_close_icon(self): #vers 2
         """Close - X icon"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <line x1="6" y1="6" x2="18" y2="18"
-                stroke="currentColor" stroke-width="2"
-                stroke-linecap="round"/>
-            <line x1="18" y1="6" x2="6" y2="18"
-                stroke="currentColor" stroke-width="2"
-                stroke-linecap="round"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-
-    def _create_import_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['close'], size=20)
+
+
+    def _create_import_icon(self): #vers 2
         """Import - Download arrow icon"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"
-                stroke="currentColor" stroke-width="2"
-                fill="none" stroke-linecap="round" stroke-linejoin="round"/>
-            <polyline points="7 10 12 15 17 10"
-                    stroke="currentColor" stroke-width="2"
-                    fill="none" stroke-linecap="round" stroke-linejoin="round"/>
-            <line x1="12" y1="15" x2="12" y2="3"
-                stroke="currentColor" stroke-width="2"
-                stroke-linecap="round"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-
-    def _create_export_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['import'], size=20)
+
+
+    def _create_export_icon(self): #vers 2
         """Export - Upload arrow icon"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"
-                stroke="currentColor" stroke-width="2"
-                fill="none" stroke-linecap="round" stroke-linejoin="round"/>
-            <polyline points="17 8 12 3 7 8"
-                    stroke="currentColor" stroke-width="2"
-                    fill="none" stroke-linecap="round" stroke-linejoin="round"/>
-            <line x1="12" y1="3" x2="12" y2="15"
-                stroke="currentColor" stroke-width="2"
-                stroke-linecap="round"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _create_rename_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['export'], size=20)
+
+    def _create_rename_icon(self): #vers 2
         """Rename icon - pencil/edit"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <path d="M11 4H4a2 2 0 00-2 2v14a2 2 0 002 2h14a2 2 0 002-2v-7"
-                stroke="currentColor" stroke-width="2" fill="none"/>
-            <path d="M18.5 2.5a2.121 2.121 0 013 3L12 15l-4 1 1-4 9.5-9.5z"
-                stroke="currentColor" stroke-width="2" fill="none"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _create_ignore_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['rename'], size=20)
+
+    def _create_ignore_icon(self): #vers 2
         """Ignore icon - eye with slash"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <path d="M1 12s4-8 11-8 11 8 11 8-4 8-11 8-11-8-11-8z"
-                stroke="currentColor" stroke-width="2" fill="none"/>
-            <circle cx="12" cy="12" r="3" stroke="currentColor" stroke-width="2" fill="none"/>
-            <line x1="1" y1="1" x2="23" y2="23" stroke="currentColor" stroke-width="2"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _create_find_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['ignore'], size=20)
+
+    def _create_find_icon(self): #vers 2
         """Find icon - magnifying glass"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <circle cx="11" cy="11" r="8" stroke="currentColor" stroke-width="2" fill="none"/>
-            <line x1="21" y1="21" x2="16.65" y2="16.65" stroke="currentColor" stroke-width="2"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
+        return self._svg_to_icon(ICON_SVGS['find'], size=20)
 
-    def _create_replace_icon(self): #vers 1
+    def _create_replace_icon(self): #vers 2
         """Replace icon - swap arrows"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <polyline points="17 1 21 5 17 9" stroke="currentColor" stroke-width="2" fill="none"/>
-            <path d="M3 11V9a4 4 0 014-4h14" stroke="currentColor" stroke-width="2" fill="none"/>
-            <polyline points="7 23 3 19 7 15" stroke="currentColor" stroke-width="2" fill="none"/>
-            <path d="M21 13v2a4 4 0 01-4 4H3" stroke="currentColor" stroke-width="2" fill="none"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _create_adddir_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['replace'], size=20)
+
+    def _create_adddir_icon(self): #vers 2
         """Add Directory icon - folder with plus"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <path d="M22 19a2 2 0 01-2 2H4a2 2 0 01-2-2V5a2 2 0 012-2h5l2 3h9a2 2 0 012 2z"
-                stroke="currentColor" stroke-width="2" fill="none"/>
-            <line x1="12" y1="11" x2="12" y2="17" stroke="currentColor" stroke-width="2"/>
-            <line x1="9" y1="14" x2="15" y2="14" stroke="currentColor" stroke-width="2"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _create_delete_icon(self): #vers 1
+        return self._svg_to_icon(ICON_SVGS['adddir'], size=20)
+
+    def _create_delete_icon(self): #vers 2
         """Delete icon - trash can"""
-        svg_data = b'''<svg viewBox="0 0 24 24">
-            <polyline points="3 6 5 6 21 6" stroke="currentColor" stroke-width="2" fill="none"/>
-            <path d="M19 6v14a2 2 0 01-2 2H7a2 2 0 01-2-2V6m3 0V4a2 2 0 012-2h4a2 2 0 012 2v2"
-                stroke="currentColor" stroke-width="2" fill="none"/>
-            <line x1="10" y1="11" x2="10" y2="17" stroke="currentColor" stroke-width="2"/>
-            <line x1="14" y1="11" x2="14" y2="17" stroke="currentColor" stroke-width="2"/>
-        </svg>'''
-        return self._svg_to_icon(svg_data, size=20)
-
-    def _svg_to_icon(self, svg_data, size=24): #vers 1
-        """Convert SVG data to QIcon with theme color support"""
-        from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
-        from PyQt6.QtSvg import QSvgRenderer
-        from PyQt6.QtCore import QByteArray
+        return self._svg_to_icon(ICON_SVGS['delete'], size=20)
 
+    def _svg_to_icon(self, svg_data, size=24): #vers 2
+        """Convert SVG data to QIcon with theme color support - shared via the icon cache"""
         try:
-            # Get current text color from palette
-            text_color = self.palette().color(self.foregroundRole())
-
-            # Replace currentColor with actual color
-            svg_str = svg_data.decode('utf-8')
-            svg_str = svg_str.replace('currentColor', text_color.name())
-            svg_data = svg_str.encode('utf-8')
-
-            renderer = QSvgRenderer(QByteArray(svg_data))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
-
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-
-            return QIcon(pixmap)
-        except:
+            return cached_icon(svg_data, self._icon_color(), size, self.devicePixelRatioF())
+        except Exception:
             # Fallback to no icon if SVG fails
             return QIcon()
 
-    def _create_app_icon_pixmap(self, size=32): #vers 2
-        """Create app icon pixmap - SSH/Sync symbol"""
-        svg_data = b'''<svg viewBox="0 0 32 32" xmlns="http://www.w3.org/2000/svg">
-            <!-- Computer 1 -->
-            <rect x="2" y="8" width="10" height="8" stroke="currentColor" stroke-width="1.5" fill="none" rx="1"/>
-            <line x1="4" y1="16" x2="10" y2="16" stroke="currentColor" stroke-width="1"/>
-            
-            <!-- Computer 2 -->
-            <rect x="20" y="8" width="10" height="8" stroke="currentColor" stroke-width="1.5" fill="none" rx="1"/>
-            <line x1="22" y1="16" x2="28" y2="16" stroke="currentColor" stroke-width="1"/>
-            
-            <!-- Sync arrows -->
-            <path d="M 12 10 L 19 10" stroke="currentColor" stroke-width="1.5" fill="none"/>
-            <path d="M 17 8 L 19 10 L 17 12" stroke="currentColor" stroke-width="1.5" fill="none"/>
-            
-            <path d="M 20 14 L 13 14" stroke="currentColor" stroke-width="1.5" fill="none"/>
-            <path d="M 15 12 L 13 14 L 15 16" stroke="currentColor" stroke-width="1.5" fill="none"/>
-            
-            <!-- Lock symbol (security) -->
-            <rect x="14" y="22" width="4" height="4" stroke="currentColor" stroke-width="1" fill="none" rx="0.5"/>
-            <path d="M 15 22 L 15 20 Q 15 19 16 19 Q 17 19 17 20 L 17 22" stroke="currentColor" stroke-width="1" fill="none"/>
-        </svg>'''
-        
+    def _icon_color(self): #vers 1
+        """Theme text color icons are drawn in - same lookup as _apply_theme"""
+        if self.icon_color is None:
+            text_color = '#e0e0e0'
+            if self.app_settings and hasattr(self.app_settings, 'current_settings'):
+                theme_name = self.app_settings.current_settings.get('theme', 'dark')
+                if hasattr(self.app_settings, 'themes') and theme_name in self.app_settings.themes:
+                    text_color = self.app_settings.themes[theme_name].get('colors', {}).get('text_primary', text_color)
+            self.icon_color = QColor(text_color).name()
+            set_theme_color(self.icon_color)
+        return self.icon_color
+
+    def _set_themed_icon(self, setter, factory): #vers 1
+        """Set an icon from factory and remember the pair for theme color changes"""
+        setter(factory())
+        self.themed_icons.append((setter, factory))
+
+    def _ensure_icon_atlas(self): #vers 1
+        """First run (or changed icons) - render the icon atlas used from the next start"""
         try:
-            text_color = self.palette().color(self.foregroundRole())
-            svg_str = svg_data.decode('utf-8')
-            svg_str = svg_str.replace('currentColor', text_color.name())
-            svg_data = svg_str.encode('utf-8')
+            built = ensure_icon_atlas()
+        except OSError as e:
+            self._log_status(f"[WARN] Icon atlas not written: {e}")
+            return
+        if built:
+            path, count, skipped = built
+            self._log_status(f"[OK] Icon atlas built - {count} masks, {len(skipped)} left "
+                f"to runtime rendering ({path})")
 
-            renderer = QSvgRenderer(QByteArray(svg_data))
-            pixmap = QPixmap(size, size)
-            pixmap.fill(QColor(0, 0, 0, 0))
 
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
+    def _refresh_themed_icons(self): #vers 1
+        """Redraw every themed icon in the current icon color"""
+        for setter, factory in self.themed_icons:
+            try:
+                setter(factory())
+            except RuntimeError:
+                # Widget already deleted
+                pass
 
-            return pixmap
-        except:
+    def _create_app_icon_pixmap(self, size=32): #vers 4
+        """Create app icon pixmap - SSH/Sync symbol"""
+        try:
+            return cached_pixmap(ICON_SVGS['app'], self._icon_color(), size, self.devicePixelRatioF())
+        except Exception:
             # Return blank pixmap on error
             pixmap = QPixmap(size, size)
             pixmap.fill(QColor(0, 0, 0, 0))
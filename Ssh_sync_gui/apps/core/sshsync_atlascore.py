@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Icon Atlas Core - version 2
+this belongs in apps/core/sshsync_atlascore.py
+
+Pre-rendered icon masks in one memory-mapped file - every icon in sshsync_iconcore
+is rendered at the standard sizes and device pixel ratios and stored as its 8-bit
+alpha mask; the GUI slices a mask out of the map and tints it with the theme text
+color instead of parsing the SVG. Icons are drawn in a single color, so one mask
+serves every theme.
+
+The atlas is a local build artifact, not shipped: the window builds it on first
+run (and again when the icon set changes) into apps/, or the user cache directory
+when apps/ is read-only; build_icon_atlas.py builds it ahead of time, e.g. when
+packaging.
+
+Layout: magic, version, table length, JSON table, then the masks (rows padded to
+4 bytes). Table keys are "<sha1 of svg>:<size>:<dpr>", so an edited SVG simply
+misses and falls back to runtime rendering; the table's "source" is the digest of
+the icon set it was built from.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+
+APPS_DIR = Path(__file__).resolve().parent.parent
+ATLAS_FILE = APPS_DIR / "icons.atlas"
+
+ATLAS_MAGIC = b'SSIA'
+ATLAS_VERSION = 1
+ATLAS_HEADER = struct.Struct('<4sII')
+
+# Device pixel ratios pre-rendered - other ratios render at runtime
+ATLAS_DPRS = (1.0, 1.25, 1.5, 2.0)
+
+
+def atlas_key(svg_data, size, dpr): #vers 1
+    """Table key for one rendering of an SVG"""
+    return f"{hashlib.sha1(svg_data).hexdigest()}:{size}:{dpr:g}"
+
+
+def user_atlas_file(): #vers 1
+    """Per-user atlas location (XDG cache home) for installs where apps/ is read-only"""
+    base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / ".cache")
+    return Path(base) / "sshsync" / "icons.atlas"
+
+
+def atlas_write_path(): #vers 1
+    """Where a new atlas goes - next to the app when writable, else the user cache"""
+    if os.access(APPS_DIR, os.W_OK):
+        return ATLAS_FILE
+    path = user_atlas_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_atlas(masks, path=ATLAS_FILE, source=""): #vers 2
+    """Write masks - {key: (width, height, bytes_per_line, data)} - atomically
+
+    source is the digest of the icon set the masks were rendered from.
+    """
+    table = {}
+    blobs = []
+    offset = 0
+    for key, (width, height, bytes_per_line, data) in sorted(masks.items()):
+        table[key] = [offset, width, height, bytes_per_line]
+        blobs.append(data)
+        offset += len(data)
+
+    table_data = json.dumps({'masks': table, 'source': source},
+        separators=(',', ':')).encode('utf-8')
+    table_data += b' ' * (-(ATLAS_HEADER.size + len(table_data)) % 4)
+
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, len(table_data)))
+            f.write(table_data)
+            for data in blobs:
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return ATLAS_HEADER.size + len(table_data) + offset
+
+
+class IconAtlas:
+    """Read-only view of an atlas file - empty when missing, stale or unreadable"""
+
+    def __init__(self, path=ATLAS_FILE): #vers 2
+        self.path = Path(path)
+        self.masks = {}
+        self.source = ""
+        self._map = None
+        self._data_start = 0
+        try:
+            with open(self.path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, table_len = ATLAS_HEADER.unpack_from(self._map, 0)
+            if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+                raise ValueError(f"not a version {ATLAS_VERSION} icon atlas")
+            table_end = ATLAS_HEADER.size + table_len
+            table = json.loads(self._map[ATLAS_HEADER.size:table_end])
+            self.masks = table['masks']
+            self.source = table.get('source', "")
+            self._data_start = table_end
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            if self.path.exists():
+                print(f"[WARN] Icon atlas not used: {e}")
+            self.masks = {}
+
+    def __len__(self): #vers 1
+        return len(self.masks)
+
+    def mask(self, svg_data, size, dpr): #vers 1
+        """(bytes, width, height, bytes_per_line) of a pre-rendered mask, or None"""
+        entry = self.masks.get(atlas_key(svg_data, size, dpr))
+        if entry is None:
+            return None
+        offset, width, height, bytes_per_line = entry
+        start = self._data_start + offset
+        return self._map[start:start + bytes_per_line * height], width, height, bytes_per_line
+
+
+_atlas = None
+
+
+def get_icon_atlas(source=None): #vers 2
+    """Process-wide atlas, mapped on first use - the app's own, else the user cache's
+
+    With source, an atlas built from that icon set is preferred over a stale one.
+    """
+    global _atlas
+    if _atlas is None:
+        candidates = [IconAtlas(path) for path in (ATLAS_FILE, user_atlas_file())]
+        current = [atlas for atlas in candidates if len(atlas) and atlas.source == source]
+        _atlas = (current or [atlas for atlas in candidates if len(atlas)] or candidates)[0]
+    return _atlas
+
+
+def reset_icon_atlas(): #vers 1
+    """Forget the mapped atlas - the next get_icon_atlas() maps the files again"""
+    global _atlas
+    _atlas = None
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Two-Way Sync Core - version 3
+this belongs in apps/core/sshsync_bisynccore.py
+
+Three-way bidirectional sync of one local / remote directory pair - the last synced
+snapshot (base) is kept per profile in SQLite; local and remote are compared against
+it in one pass, only net changes move in each direction and files changed on both
+sides are reported as conflicts instead of being overwritten
+"""
+
+import os
+import sqlite3
+import time
+
+from core.sshsync_manifestcore import get_manifest_dir
+from core.sshsync_rsynccore import PARTIAL_DIR, build_batch_cmd, encode_file_list, run_rsync
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS base (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Deletion guard - a run that would delete more than this share of the synced
+# files (and more than DELETE_GUARD_MIN of them) is refused as a likely bad scan
+# unless the caller confirms it (allow_deletions)
+DELETE_GUARD_FRACTION = 0.5
+DELETE_GUARD_MIN = 20
+
+# Conflict resolutions
+KEEP_LOCAL = 'local'
+KEEP_REMOTE = 'remote'
+
+
+def get_state_path(key): #vers 1
+    """Two-way sync state database for a profile key (next to the manifests)"""
+    return get_manifest_dir() / f"{key}.bisync.db"
+
+
+def _skipped(path): #vers 1
+    """rsync partial directories never take part in the comparison"""
+    return PARTIAL_DIR in path.split('/')
+
+
+def scan_local_files(root, token=None): #vers 2
+    """{relative path: (size, mtime seconds)} for every regular file under root
+
+    Raises OSError on any unreadable directory or file - a skipped directory
+    would look like its files were deleted.
+    """
+    files = {}
+    stack = [""]
+    while stack:
+        if token and token.cancelled:
+            break
+        relative = stack.pop()
+        with os.scandir(os.path.join(root, relative) if relative else root) as entries:
+            for entry in entries:
+                path = f"{relative}/{entry.name}" if relative else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != PARTIAL_DIR:
+                        stack.append(path)
+                elif entry.is_file(follow_symlinks=False):
+                    info = entry.stat(follow_symlinks=False)
+                    files[path] = (info.st_size, info.st_mtime_ns // 1_000_000_000)
+    return files
+
+
+def index_file_states(index): #vers 1
+    """{relative path: (size, mtime seconds)} for the regular files of a RemoteIndex"""
+    return {entry.path: (entry.size, int(entry.mtime)) for entry in index
+        if entry.kind == 'f' and not _skipped(entry.path)}
+
+
+def three_way_diff(base, local, remote): #vers 1
+    """Compare both sides with the last synced snapshot
+
+    All three map path -> (size, mtime). Returns a dict of sorted path lists:
+    push / pull (changed on one side only), delete_remote / delete_local (deleted
+    on one side, untouched on the other), settled (both sides already agree, base
+    just needs updating), forget (gone on both sides) and conflicts as
+    (path, local state or None, remote state or None).
+    """
+    result = {'push': [], 'pull': [], 'delete_remote': [], 'delete_local': [],
+        'settled': [], 'forget': [], 'conflicts': []}
+    for path in sorted(set(base) | set(local) | set(remote)):
+        was, here, there = base.get(path), local.get(path), remote.get(path)
+        local_changed, remote_changed = here != was, there != was
+        if not local_changed and not remote_changed:
+            continue
+        if here == there:
+            result['settled' if here else 'forget'].append(path)
+        elif not remote_changed:
+            result['push' if here else 'delete_remote'].append(path)
+        elif not local_changed:
+            result['pull' if there else 'delete_local'].append(path)
+        else:
+            result['conflicts'].append((path, here, there))
+    return result
+
+
+class SyncState:
+    """Last synced snapshot of one directory pair"""
+
+    def __init__(self, db_path): #vers 1
+        self.db = sqlite3.connect(str(db_path), timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self): #vers 1
+        self.db.close()
+
+    def load(self): #vers 1
+        return {path: (size, mtime) for path, size, mtime in
+            self.db.execute("SELECT path, size, mtime FROM base")}
+
+    def record(self, states): #vers 1
+        """Store {path: (size, mtime) or None} as synced - None removes the path
+
+        States are the ones seen when scanning, never re-read after the transfer, so
+        a file modified mid-transfer shows up as changed again on the next run.
+        """
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO base (path, size, mtime) VALUES (?, ?, ?)",
+                [(path, state[0], state[1]) for path, state in states.items() if state])
+            self.db.executemany("DELETE FROM base WHERE path = ?",
+                [(path,) for path, state in states.items() if not state])
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_sync', ?)",
+                (str(time.time()),))
+
+    def last_sync(self): #vers 1
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'last_sync'").fetchone()
+        return float(row[0]) if row else None
+
+
+def check_deletions(base, local, remote, diff): #vers 1
+    """Error text when the diff looks like a bad scan rather than real deletions, else None"""
+    if not base:
+        return None
+    for side, files in (("Local", local), ("Remote", remote)):
+        if not files:
+            return f"{side} side is empty but {len(base):,} file(s) were synced - refusing (unmounted or missing folder?)"
+    deletions = len(diff['delete_remote']) + len(diff['delete_local'])
+    if deletions > DELETE_GUARD_MIN and deletions > len(base) * DELETE_GUARD_FRACTION:
+        return (f"{deletions:,} of {len(base):,} synced file(s) would be deleted - refusing; "
+            "check both folders")
+    return None
+
+
+def _send(token, progress, ssh_option, source_dir, dest_dir, paths): #vers 1
+    """One rsync over exactly paths - those missing at the source are deleted at dest"""
+    if not paths:
+        return True, {'bytes': 0, 'changed': [], 'deleted': []}
+    return run_rsync(build_batch_cmd(ssh_option, source_dir, dest_dir,
+        extra_args=["--delete-missing-args"]), token, progress, input_data=encode_file_list(paths))
+
+
+def _exchange(token, progress, state, ssh_option, local_dir, remote_dir, outgoing, incoming): #vers 1
+    """Push outgoing, pull incoming ({path: state to record}) - returns (success, summary or error)"""
+    summary = {'bytes': 0, 'changed': [], 'deleted': [], 'transport': "three-way"}
+    for label, source, dest, states in (("push", local_dir, remote_dir, outgoing),
+            ("pull", remote_dir, local_dir, incoming)):
+        success, result = _send(token, progress, ssh_option, source, dest, sorted(states))
+        if not success:
+            return False, f"{label} failed: {result}"
+        state.record(states)
+        summary['bytes'] += result['bytes']
+        summary['changed'].extend(result['changed'])
+        summary['deleted'].extend(result['deleted'])
+    return True, summary
+
+
+def run_bisync_job(token, progress, state_path, ssh_option, local_dir, remote_dir, lister,
+    allow_deletions=False): #vers 3
+    """Job body - three-way sync local_dir with remote_dir ("user@host:path")
+
+    lister(token) returns (success, RemoteIndex of the remote tree) and must fail
+    on a partial listing. Nothing is transferred or recorded when either scan is
+    incomplete, or when check_deletions() objects and allow_deletions is False -
+    that failure is {'refused': text, 'delete_local': n, 'delete_remote': n} so the
+    caller can confirm and rerun with allow_deletions=True. The summary carries
+    'conflicts' for the caller to resolve.
+    """
+    if not os.path.isdir(local_dir):
+        return False, f"Local directory does not exist: {local_dir}"
+    progress({'file': "Scanning both sides...", 'percent': 0})
+    success, index = lister(token)
+    if not success:
+        return False, f"Remote listing failed: {index}"
+    remote = index_file_states(index)
+    try:
+        local = scan_local_files(local_dir, token)
+    except OSError as e:
+        return False, f"Local scan failed: {e}"
+    if token.cancelled:
+        return False, "Cancelled"
+
+    state = SyncState(state_path)
+    try:
+        base = state.load()
+        diff = three_way_diff(base, local, remote)
+        refused = None if allow_deletions else check_deletions(base, local, remote, diff)
+        if refused:
+            return False, {'refused': refused, 'delete_local': len(diff['delete_local']),
+                'delete_remote': len(diff['delete_remote'])}
+        state.record({path: local.get(path) for path in diff['settled'] + diff['forget']})
+        success, summary = _exchange(token, progress, state, ssh_option, local_dir, remote_dir,
+            {path: local.get(path) for path in diff['push'] + diff['delete_remote']},
+            {path: remote.get(path) for path in diff['pull'] + diff['delete_local']})
+    finally:
+        state.close()
+    if not success:
+        return False, summary
+    summary['conflicts'] = diff['conflicts']
+    summary['pushed'] = len(diff['push']) + len(diff['delete_remote'])
+    summary['pulled'] = len(diff['pull']) + len(diff['delete_local'])
+    return True, summary
+
+
+def run_resolve_job(token, progress, state_path, ssh_option, local_dir, remote_dir,
+    resolutions): #vers 1
+    """Job body - apply conflict resolutions [(path, KEEP_LOCAL or KEEP_REMOTE, local, remote)]
+
+    local / remote are the states reported with the conflict. The kept side wins
+    outright, including a deletion.
+    """
+    state = SyncState(state_path)
+    try:
+        return _exchange(token, progress, state, ssh_option, local_dir, remote_dir,
+            {path: here for path, keep, here, _ in resolutions if keep == KEEP_LOCAL},
+            {path: there for path, keep, _, there in resolutions if keep == KEEP_REMOTE})
+    finally:
+        state.close()
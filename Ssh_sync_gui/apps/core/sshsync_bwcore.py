@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Bandwidth Core - version 3
+this belongs in apps/core/sshsync_bwcore.py
+
+Bandwidth scheduler - time-of-day limit rules, one global budget shared by every
+running stream (rsync --bwlimit, token bucket for tar streams). Each profile can
+carry its own schedule on top: a stream takes the smaller of its share of the
+global cap and its share of its profile's cap. Streams are matched to a profile
+by the job's cancel token; streams of unregistered jobs belong to the active
+profile.
+
+rsync cannot change --bwlimit while running, so run_rsync restarts a stream at its
+new share when it takes more than the share for RETHROTTLE_GRACE seconds (more
+streams started, or a tighter window began) or could run RETHROTTLE_GAIN times
+faster. The partial dir keeps the restart from resending data, but the stream's
+file list is compared again. Until then, and when cap / streams falls below
+MIN_BWLIMIT, the total may briefly exceed the cap.
+"""
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+DAY_NAMES = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+# "Mon-Fri 09:00-18:00 2048" - days (optional), time range, limit in KB/s (0 = unlimited)
+RULE_RE = re.compile(
+    r"^\s*(?:(?P<days>[A-Za-z]{3}(?:-[A-Za-z]{3})?(?:,[A-Za-z]{3}(?:-[A-Za-z]{3})?)*)\s+)?"
+    r"(?P<start>\d{1,2}:\d{2})-(?P<end>\d{1,2}:\d{2})\s+(?P<limit>\d+)\s*$")
+
+MIN_BWLIMIT = 16  # KB/s - below this rsync stalls rather than trickles
+
+RETHROTTLE_CHECK = 1.0   # seconds between share checks of a running rsync
+RETHROTTLE_GRACE = 5.0   # seconds over its share before a stream restarts - absorbs bursts of starts
+RETHROTTLE_GAIN = 2      # restart an under-using stream only once its share at least doubled
+
+
+def _parse_days(text): #vers 1
+    """Weekday numbers (0 = Monday) from "Mon-Fri,Sun" style text"""
+    if not text:
+        return set(range(7))
+    days = set()
+    for part in text.lower().split(','):
+        first, _, last = part.partition('-')
+        if first not in DAY_NAMES or (last and last not in DAY_NAMES):
+            raise ValueError(f"Unknown day: {part}")
+        start = DAY_NAMES.index(first)
+        end = DAY_NAMES.index(last) if last else start
+        day = start
+        while True:
+            days.add(day)
+            if day == end:
+                break
+            day = (day + 1) % 7
+    return days
+
+
+def _minutes(text): #vers 1
+    hours, minutes = (int(part) for part in text.split(':'))
+    if hours > 24 or minutes > 59:
+        raise ValueError(f"Bad time: {text}")
+    return hours * 60 + minutes
+
+
+class BandwidthRule:
+    """One time window with its limit in KB/s"""
+
+    def __init__(self, days, start, end, limit, text=""): #vers 1
+        self.days = days
+        self.start = start
+        self.end = end
+        self.limit = limit
+        self.text = text
+
+    def matches(self, when): #vers 1
+        """True if when falls in the window - windows may wrap past midnight"""
+        minute = when.hour * 60 + when.minute
+        if self.start <= self.end:
+            return when.weekday() in self.days and self.start <= minute < self.end
+        if minute >= self.start:
+            return when.weekday() in self.days
+        return (when.weekday() - 1) % 7 in self.days and minute < self.end
+
+
+def parse_schedule(text): #vers 1
+    """Parse one rule per line (blank lines and # comments ignored), returns (success, rules or error)"""
+    rules = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        match = RULE_RE.match(line)
+        if not match:
+            return False, f"Line {number}: expected e.g. 'Mon-Fri 09:00-18:00 2048'"
+        try:
+            rules.append(BandwidthRule(_parse_days(match.group('days')),
+                _minutes(match.group('start')), _minutes(match.group('end')),
+                int(match.group('limit')), line))
+        except ValueError as e:
+            return False, f"Line {number}: {e}"
+    return True, rules
+
+
+class BandwidthSchedule:
+    """Ordered rules - the first matching rule wins, otherwise the default limit"""
+
+    def __init__(self, rules=None, default_limit=0): #vers 1
+        self.rules = list(rules or [])
+        self.default_limit = default_limit
+
+    def current(self, when=None): #vers 1
+        """(limit KB/s, matching rule text or "default") - limit 0 means unlimited"""
+        when = when or datetime.now()
+        for rule in self.rules:
+            if rule.matches(when):
+                return rule.limit, rule.text
+        return self.default_limit, "default"
+
+
+class TokenBucket:
+    """Byte-rate limiter whose rate (bytes/s, 0 = unlimited) is re-read on every call"""
+
+    def __init__(self, rate_fn, burst_seconds=0.5): #vers 1
+        self.rate_fn = rate_fn
+        self.burst_seconds = burst_seconds
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+
+    def consume(self, nbytes, token=None): #vers 1
+        """Block until nbytes may pass, returns False if cancelled meanwhile"""
+        while True:
+            rate = self.rate_fn()
+            now = time.monotonic()
+            if not rate:
+                self.updated = now
+                return True
+            self.tokens = min(self.tokens + (now - self.updated) * rate,
+                max(rate * self.burst_seconds, nbytes))
+            self.updated = now
+            if self.tokens >= nbytes:
+                self.tokens -= nbytes
+                return True
+            wait = (nbytes - self.tokens) / rate
+            if token is not None:
+                if token.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class BandwidthBudget:
+    """Global cap from the schedule, split evenly across running streams, and per
+    profile caps split across that profile's streams"""
+
+    def __init__(self): #vers 2
+        self.schedule = BandwidthSchedule()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.profiles = {None: [BandwidthSchedule(), 0]}  # job token -> [schedule, streams]; None = active profile
+
+    def set_schedule(self, schedule): #vers 1
+        with self.lock:
+            self.schedule = schedule
+
+    def set_profile_schedule(self, schedule): #vers 1
+        """Cap of the active profile - streams of jobs not run under profile()"""
+        with self.lock:
+            self.profiles[None][0] = schedule
+
+    @contextmanager
+    def profile(self, token, schedule): #vers 1
+        """Cap the streams a job runs with token (and its shard / host streams) by schedule"""
+        with self.lock:
+            self.profiles[token] = [schedule, 0]
+        try:
+            yield
+        finally:
+            with self.lock:
+                del self.profiles[token]
+
+    def _profile(self, token): #vers 1
+        """[schedule, streams] of the profile a job token runs for (lock held)"""
+        return self.profiles.get(token) or self.profiles[None]
+
+    def current_cap(self): #vers 1
+        """(cap KB/s, rule) right now - 0 means unlimited"""
+        with self.lock:
+            return self.schedule.current()
+
+    def share(self, token=None): #vers 2
+        """KB/s for one stream of the job token given the streams running now"""
+        with self.lock:
+            cap, _ = self.schedule.current()
+            schedule, streams = self._profile(token)
+            limit, _ = schedule.current()
+            shares = []
+            if cap:
+                shares.append(cap // max(self.active, 1))
+            if limit:
+                shares.append(limit // max(streams, 1))
+        return max(MIN_BWLIMIT, min(shares)) if shares else 0
+
+    def rethrottle(self, limit, token=None): #vers 2
+        """True when a stream running at limit KB/s should restart at the current share -
+        it takes more than its share, or the share grew RETHROTTLE_GAIN times"""
+        share = self.share(token)
+        if share == limit:
+            return False
+        if not limit or not share:
+            return True
+        return limit > share or share >= limit * RETHROTTLE_GAIN
+
+    @contextmanager
+    def stream(self, token=None): #vers 2
+        """Register a running stream of the job token, yields its KB/s share at start (0 = unlimited)"""
+        with self.lock:
+            profile = self._profile(token)
+            self.active += 1
+            profile[1] += 1
+        try:
+            yield self.share(token)
+        finally:
+            with self.lock:
+                self.active -= 1
+                profile[1] -= 1
+
+    def bucket(self, token=None): #vers 2
+        """Token bucket following this stream's share as the schedule and stream count change"""
+        return TokenBucket(lambda: self.share(token) * 1024)
+
+
+def apply_bwlimit(cmd, limit): #vers 1
+    """rsync argv with --bwlimit (KB/s) added, unchanged when unlimited"""
+    if not limit:
+        return cmd
+    return cmd[:1] + [f"--bwlimit={int(limit)}"] + cmd[1:]
+
+
+def format_cap(limit): #vers 1
+    """Human readable cap"""
+    if not limit:
+        return "unlimited"
+    if limit >= 1024:
+        return f"{limit / 1024:.1f} MB/s"
+    return f"{limit} KB/s"
+
+
+_budget = None
+
+
+def get_bandwidth_budget(): #vers 1
+    """Process-wide bandwidth budget"""
+    global _budget
+    if _budget is None:
+        _budget = BandwidthBudget()
+    return _budget
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Headless CLI Core - version 3
+this belongs in apps/core/sshsync_clicore.py
+
+Headless push / pull / mirror / bisync / watch / status for cron, systemd timers and scripts -
+run through the root sshsync.py (python -m sshsync). Settings come from the saved
+profiles (the active one unless --profile is given), with --host / --user / --port /
+--key / --local / --remote overriding them. Results are JSON on stdout - one object
+per command, one line per push for watch. Password profiles read the password from
+SSHSYNC_PASSWORD; it is never stored. Imports no Qt, and only what a command needs
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+from core.sshsync_profilecore import (ProfileScheduler, ProfileStore, default_profile,
+    get_profiles_path)
+from core.sshsync_runcore import CancelToken
+
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+WATCH_RETRY_DELAY = 10  # seconds before a failed watch push is retried
+
+
+class UsageError(Exception):
+    """Bad arguments or incomplete settings - exit code 2"""
+
+
+def emit(result): #vers 1
+    """One JSON object per line on stdout"""
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+
+
+def load_profile(args, store): #vers 1
+    """The selected profile with command line overrides applied"""
+    name = args.profile or store.settings().get('active')
+    profile = store.get(name) if name else None
+    if profile is None:
+        if args.profile:
+            raise UsageError(f"No such profile: {args.profile}")
+        profile = default_profile()
+        profile['name'] = None
+    for key, value in (('remote_host', args.host), ('remote_user', args.user),
+            ('remote_port', args.port), ('ssh_key_path', args.key)):
+        if value is not None:
+            profile[key] = value
+    if not profile['remote_host'] or not profile['remote_user']:
+        raise UsageError("No host / user - save a profile in the GUI or pass --host and --user")
+    return profile
+
+
+def ssh_option_for(profile): #vers 1
+    from core.sshsync_core import build_rsync_ssh_option
+
+    password = None
+    if profile['use_password']:
+        password = os.environ.get('SSHSYNC_PASSWORD')
+        if not password:
+            raise UsageError("Password profile - set SSHSYNC_PASSWORD")
+    return build_rsync_ssh_option(profile['use_password'], password, profile['ssh_key_path'],
+        profile['remote_port'])
+
+
+def apply_saved_options(store, args, profile): #vers 2
+    """Bandwidth schedules (global and the profile's) and compression mode as saved in
+    the GUI - --bwlimit replaces both"""
+    from core.sshsync_bwcore import BandwidthSchedule, get_bandwidth_budget, parse_schedule
+    from core.sshsync_compresscore import get_compression_policy
+    from core.sshsync_profilecore import profile_bandwidth
+
+    options = store.settings().get('options', {})
+    get_compression_policy().mode = options.get('compression_mode', 'adaptive')
+    success, rules = parse_schedule(options.get('bandwidth_schedule', ""))
+    limit = options.get('bandwidth_limit', 0)
+    budget = get_bandwidth_budget()
+    if args.bwlimit is not None:
+        success, rules, limit = True, [], args.bwlimit
+    else:
+        budget.set_profile_schedule(profile_bandwidth(profile))
+    budget.set_schedule(BandwidthSchedule(rules if success else [], limit))
+
+
+def endpoints(profile, args, direction): #vers 1
+    """(local dir, "user@host:path") of the folder pair a direction uses"""
+    if direction == 'push':
+        local, remote = profile['local_export_path'], profile['remote_import_path']
+    else:
+        local, remote = profile['local_import_path'], profile['remote_export_path']
+    local, remote = args.local or local, args.remote or remote
+    return (os.path.expanduser(local.rstrip('/') or '/'),
+        f"{profile['remote_user']}@{profile['remote_host']}:{remote.rstrip('/')}")
+
+
+def make_progress(args): #vers 1
+    """Progress callback - JSON lines on stderr with --progress, silent otherwise"""
+    if not args.progress:
+        return lambda info: None
+    return lambda info: sys.stderr.write(json.dumps({'progress': info}) + "\n")
+
+
+def transfer_result(command, profile, source, dest, success, result, started): #vers 1
+    summary = {'command': command, 'profile': profile['name'], 'source': source, 'dest': dest,
+        'success': success, 'seconds': round(time.monotonic() - started, 3)}
+    if success:
+        summary.update(bytes=result['bytes'], changed=result['changed'],
+            deleted=result['deleted'], transport=result.get('transport', "rsync"))
+    else:
+        summary['error'] = result
+    return summary
+
+
+def cmd_transfer(args, store, token): #vers 2
+    """push: local export -> remote import, pull: remote export -> local import"""
+    from core.sshsync_opscore import ensure_directory_exists
+    from core.sshsync_rsynccore import run_transfer_job
+
+    profile = load_profile(args, store)
+    ssh_option = ssh_option_for(profile)
+    local, remote = endpoints(profile, args, args.command)
+    if args.command == 'push':
+        if not os.path.isdir(local):
+            raise UsageError(f"Local directory does not exist: {local}")
+        source, dest = f"{local}/", f"{remote}/"
+    else:
+        success, message = ensure_directory_exists(local)
+        if not success:
+            raise UsageError(message)
+        source, dest = f"{remote}/", f"{local}/"
+    delete = profile['delete_extra_files'] if args.delete is None else args.delete
+
+    apply_saved_options(store, args, profile)
+    started = time.monotonic()
+    success, result = run_transfer_job(token, make_progress(args), ssh_option, source, dest, delete)
+    emit(transfer_result(args.command, profile, source, dest, success, result, started))
+    return EXIT_OK if success else EXIT_FAILED
+
+
+def cmd_mirror(args, store, token): #vers 2
+    """Make remote import identical to local export - plan first, execute only with --yes"""
+    from core.sshsync_plancore import plan_file_list, run_plan_job, run_planned_job, summarize_plan
+
+    profile = load_profile(args, store)
+    ssh_option = ssh_option_for(profile)
+    local, remote = endpoints(profile, args, 'push')
+    if not os.path.isdir(local):
+        raise UsageError(f"Local directory does not exist: {local}")
+    source, dest = f"{local}/", f"{remote}/"
+
+    apply_saved_options(store, args, profile)
+    progress = make_progress(args)
+    started = time.monotonic()
+    success, plan = run_plan_job(token, progress, ssh_option, source, dest, True)
+    if not success:
+        emit(transfer_result('mirror', profile, source, dest, False, plan, started))
+        return EXIT_FAILED
+    if not args.yes:
+        emit({'command': 'mirror', 'profile': profile['name'], 'source': source, 'dest': dest,
+            'success': True, 'executed': False, 'plan': summarize_plan(plan),
+            'paths': plan_file_list(plan), 'deleting': plan['deleted'],
+            'seconds': round(time.monotonic() - started, 3)})
+        return EXIT_OK
+    success, result = run_planned_job(token, progress, ssh_option, source, dest, plan)
+    summary = transfer_result('mirror', profile, source, dest, success, result, started)
+    summary.update(executed=success, plan=summarize_plan(plan))
+    emit(summary)
+    return EXIT_OK if success else EXIT_FAILED
+
+
+def cmd_bisync(args, store, token): #vers 2
+    """Three-way sync local export <-> remote import - shares its state with the GUI Sync Both
+
+    A run the deletion guard refuses exits 1 with the counts; --allow-deletions
+    confirms it. Conflicts are reported, never resolved.
+    """
+    from core.sshsync_bisynccore import get_state_path, run_bisync_job
+    from core.sshsync_core import list_remote_index
+    from core.sshsync_manifestcore import profile_key
+
+    profile = load_profile(args, store)
+    ssh_option = ssh_option_for(profile)
+    local, remote = endpoints(profile, args, 'push')
+    remote_path = args.remote or profile['remote_import_path']
+    state_path = get_state_path(profile_key(profile['remote_user'], profile['remote_host'],
+        profile['remote_port'], local, remote_path))
+    password = os.environ.get('SSHSYNC_PASSWORD') if profile['use_password'] else None
+
+    def lister(token):
+        return list_remote_index(profile['remote_host'], profile['remote_user'], remote_path,
+            profile['remote_port'], profile['use_password'], password, profile['ssh_key_path'],
+            max_depth=None, token=token, strict=True)
+
+    apply_saved_options(store, args, profile)
+    started = time.monotonic()
+    success, result = run_bisync_job(token, make_progress(args), state_path, ssh_option, local,
+        remote, lister, args.allow_deletions)
+    if not success and isinstance(result, dict):
+        emit({'command': 'bisync', 'profile': profile['name'], 'source': local, 'dest': remote,
+            'success': False, 'error': result['refused'],
+            'delete_local': result['delete_local'], 'delete_remote': result['delete_remote'],
+            'hint': "rerun with --allow-deletions to delete them",
+            'seconds': round(time.monotonic() - started, 3)})
+        return EXIT_FAILED
+    summary = transfer_result('bisync', profile, local, remote, success, result, started)
+    if success:
+        summary.update(pushed=result['pushed'], pulled=result['pulled'],
+            conflicts=[path for path, _, _ in result['conflicts']])
+    emit(summary)
+    return EXIT_OK if success else EXIT_FAILED
+
+
+def cmd_watch(args, store, token): #vers 2
+    """Push local export changes as they happen until interrupted - one JSON line per push"""
+    from core.sshsync_rsynccore import run_paths_job, run_transfer_job
+    from core.sshsync_watchcore import LocalWatcher, PendingChanges
+
+    profile = load_profile(args, store)
+    ssh_option = ssh_option_for(profile)
+    local, remote = endpoints(profile, args, 'push')
+    delete = profile['delete_extra_files'] if args.delete is None else args.delete
+    apply_saved_options(store, args, profile)
+    progress = make_progress(args)
+
+    pending = PendingChanges()
+    lock = threading.Lock()
+    wake = threading.Event()
+
+    def on_changes(paths):
+        with lock:
+            pending.add(paths)
+        wake.set()
+
+    watcher = LocalWatcher(local, on_changes, args.latency)
+    success, result = watcher.start()
+    if not success:
+        raise UsageError(f"Watch unavailable: {result}")
+    emit({'command': 'watch', 'profile': profile['name'], 'event': 'started', 'source': local,
+        'dest': remote, 'directories': result})
+    if not args.no_initial:
+        on_changes(None)
+
+    failed = False
+    try:
+        while not token.cancelled:
+            wake.wait(1.0)
+            wake.clear()
+            with lock:
+                batch = pending.take()
+            if batch is None:
+                continue
+            full, paths = batch
+            started = time.monotonic()
+            if full:
+                success, result = run_transfer_job(token, progress, ssh_option, f"{local}/",
+                    f"{remote}/", delete)
+            else:
+                success, result = run_paths_job(token, progress, ssh_option, local, remote,
+                    paths, delete)
+            with lock:
+                pending.finish()
+            if token.cancelled:
+                break
+            summary = transfer_result('watch', profile, f"{local}/", f"{remote}/", success,
+                result, started)
+            summary['event'] = 'full' if full else 'paths'
+            summary['paths'] = len(paths)
+            emit(summary)
+            failed = failed or not success
+            if not success:
+                with lock:
+                    pending.add(None if full else paths)  # retried with the next batch
+                token.wait(WATCH_RETRY_DELAY)
+    finally:
+        watcher.stop()
+    emit({'command': 'watch', 'profile': profile['name'], 'event': 'stopped'})
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def cmd_status(args, store, token): #vers 1
+    """Profiles with schedule and last result, pending resumes, tools - JSON"""
+    from core.sshsync_core import check_rsync_installed, check_sshpass_installed
+    from core.sshsync_resumecore import TransferJournal, get_journal_path
+
+    next_runs = {profile['name']: when for profile, when in ProfileScheduler(store).upcoming()}
+    pending = {}
+    for entry in TransferJournal(get_journal_path()).entries.values():
+        pending[entry['connection']] = pending.get(entry['connection'], 0) + 1
+    status = {
+        'command': 'status', 'success': True,
+        'active': store.settings().get('active'),
+        'profiles': [{
+            'name': profile['name'],
+            'host': f"{profile['remote_user']}@{profile['remote_host']}:{profile['remote_port']}",
+            'direction': profile['direction'], 'schedule': profile['schedule'],
+            'priority': profile['priority'], 'enabled': profile['enabled'],
+            'last_run': profile['last_run'], 'last_result': profile['last_result'],
+            'next_run': next_runs.get(profile['name']),
+        } for profile in store.profiles()],
+        'resume_pending': pending,
+        'tools': {'rsync': check_rsync_installed(), 'sshpass': check_sshpass_installed()},
+    }
+    if args.connect:
+        from core.sshsync_core import test_ssh_connection
+
+        profile = load_profile(args, store)
+        password = os.environ.get('SSHSYNC_PASSWORD') if profile['use_password'] else None
+        success, error = test_ssh_connection(profile['remote_host'], profile['remote_user'],
+            profile['remote_port'], profile['use_password'], password, profile['ssh_key_path'])
+        status['connection'] = {'profile': profile['name'], 'success': success,
+            'error': "" if success else error.strip()}
+        status['success'] = success
+    emit(status)
+    return EXIT_OK if status['success'] else EXIT_FAILED
+
+
+COMMANDS = {'push': cmd_transfer, 'pull': cmd_transfer, 'mirror': cmd_mirror,
+    'bisync': cmd_bisync, 'watch': cmd_watch, 'status': cmd_status}
+
+
+def build_parser(): #vers 2
+    parser = argparse.ArgumentParser(prog="python -m sshsync",
+        description="Headless SSH File Sync - JSON results on stdout")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--profile', help="saved profile (default: the active one)")
+    common.add_argument('--host')
+    common.add_argument('--user')
+    common.add_argument('--port', type=int)
+    common.add_argument('--key', help="ssh private key")
+
+    transfer = argparse.ArgumentParser(add_help=False, parents=[common])
+    transfer.add_argument('--local', help="local directory (default: from the profile)")
+    transfer.add_argument('--remote', help="remote path (default: from the profile)")
+    transfer.add_argument('--bwlimit', type=int, help="KB/s, 0 = unlimited (default: saved schedule)")
+    transfer.add_argument('--progress', action='store_true', help="JSON progress lines on stderr")
+
+    for name, text in (('push', "local export -> remote import"),
+            ('pull', "remote export -> local import")):
+        command = commands.add_parser(name, parents=[transfer], help=text)
+        command.add_argument('--delete', action=argparse.BooleanOptionalAction, default=None,
+            help="delete files missing from the source (default: from the profile)")
+
+    mirror = commands.add_parser('mirror', parents=[transfer],
+        help="make remote import identical to local export")
+    mirror.add_argument('--yes', action='store_true', help="execute - without it only the plan is shown")
+
+    bisync = commands.add_parser('bisync', parents=[transfer],
+        help="three-way sync local export <-> remote import")
+    bisync.add_argument('--allow-deletions', action='store_true',
+        help="confirm a run the deletion guard refuses")
+
+    watch = commands.add_parser('watch', parents=[transfer], help="push local changes as they happen")
+    watch.add_argument('--delete', action=argparse.BooleanOptionalAction, default=None)
+    watch.add_argument('--latency', type=float, default=2.0, help="seconds from first change to push")
+    watch.add_argument('--no-initial', action='store_true', help="skip the full push on start")
+
+    status = commands.add_parser('status', parents=[common], help="profiles, schedules, pending resumes")
+    status.add_argument('--connect', action='store_true', help="also test the ssh connection")
+    return parser
+
+
+def main(argv=None): #vers 1
+    args = build_parser().parse_args(argv)
+    token = CancelToken()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: token.cancel())
+    try:
+        return COMMANDS[args.command](args, store=ProfileStore(get_profiles_path()), token=token)
+    except UsageError as e:
+        emit({'command': args.command, 'success': False, 'error': str(e)})
+        return EXIT_USAGE
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Compression Policy Core - version 2
+this belongs in apps/core/sshsync_compresscore.py
+
+Adaptive rsync compression - picks --compress-choice / --compress-level / --skip-compress
+(or no compression) per transfer from sampled compressibility, measured link
+throughput and local CPU headroom
+"""
+
+import os
+import re
+import subprocess
+import threading
+import time
+import zlib
+
+from core.sshsync_runcore import run_process
+
+
+# rsync's own default skip list plus common game / media asset containers
+ALREADY_COMPRESSED = frozenset((
+    "3g2 3gp 7z aac ace apk avi bz2 deb dmg ear f4v flac flv gpg gz iso jar jpeg jpg lrz lz "
+    "lz4 lzma lzo m1a m1v m2a m2ts m2v m4a m4b m4p m4r m4v mka mkv mov mp1 mp2 mp3 mp4 mpa "
+    "mpeg mpg mpv mts odb odf odg odi odm odp ods odt oga ogg ogm ogv ogx opus otg oth otp "
+    "ots ott oxt png qt rar rpm rz rzip spx squashfs sxc sxd sxg sxm sxw sz tbz tbz2 tgz tlz "
+    "ts txz tzo vob war webm webp xz z zip zst "
+    "avif heic jxl ktx2 basis crn bik bk2 wem fsb usm pak vpk pk3 pk4 cab msi whl"
+).split())
+SKIP_COMPRESS = "/".join(sorted(ALREADY_COMPRESSED))
+
+COMPRESSION_MODES = ('adaptive', 'always', 'off')
+
+SAMPLE_FILES = 32            # files read per compressibility sample
+SAMPLE_BYTES = 64 * 1024     # bytes read from each sampled file
+SAMPLE_SCAN = 2000           # directory entries looked at per sample
+SAMPLE_TTL = 600             # seconds a directory sample stays valid
+PROBE_BYTES = 1024 * 1024    # first payload of the link throughput probe
+PROBE_MAX_BYTES = 64 * 1024 ** 2  # largest payload - ~0.5s at gigabit
+PROBE_MIN_SECONDS = 0.5      # payload grows until its transfer time (beyond the baseline) reaches this
+PROBE_GROWTH = 8
+
+FAST_LINK = 60 * 1024 ** 2   # bytes/s - compression only costs time above this
+MEDIUM_LINK = 20 * 1024 ** 2
+SLOW_LINK = 4 * 1024 ** 2    # bytes/s - heavier compression pays off below this
+INCOMPRESSIBLE = 0.9         # sampled compressed/original ratio above which -z is skipped
+
+VERSION_RE = re.compile(r"version\s+(\d+)\.(\d+)\.(\d+)")
+
+
+def parse_rsync_version(text): #vers 1
+    """(major, minor, patch) from `rsync --version` output, or None"""
+    match = VERSION_RE.search(text or "")
+    return tuple(int(part) for part in match.groups()) if match else None
+
+
+_local_version = []
+
+
+def local_rsync_version(): #vers 1
+    """Version of the local rsync, cached for the process"""
+    if not _local_version:
+        try:
+            result = subprocess.run(["rsync", "--version"], capture_output=True, text=True,
+                timeout=10)
+            _local_version.append(parse_rsync_version(result.stdout))
+        except (OSError, subprocess.SubprocessError):
+            _local_version.append(None)
+    return _local_version[0]
+
+
+def cpu_headroom(): #vers 1
+    """Idle share of local CPU (0..1) from the 1-minute load average"""
+    try:
+        load = os.getloadavg()[0]
+    except (OSError, AttributeError):
+        return 0.5
+    cpus = os.cpu_count() or 1
+    return max(0.0, min(1.0, 1.0 - load / cpus))
+
+
+def sample_compressibility(root): #vers 1
+    """Estimate how well root compresses, returns (ratio, precompressed share) or None
+
+    Looks at up to SAMPLE_SCAN entries breadth-first; files with known compressed
+    extensions count as ratio 1.0, others are sampled with zlib level 1.
+    """
+    scanned = precompressed = 0
+    raw = packed = 0
+    sampled = 0
+    queue = [root]
+    while queue and scanned < SAMPLE_SCAN:
+        try:
+            with os.scandir(queue.pop(0)) as entries:
+                for entry in entries:
+                    if scanned >= SAMPLE_SCAN:
+                        break
+                    if entry.is_dir(follow_symlinks=False):
+                        queue.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    scanned += 1
+                    extension = entry.name.rsplit('.', 1)[-1].lower() if '.' in entry.name else ""
+                    if extension in ALREADY_COMPRESSED:
+                        precompressed += 1
+                        continue
+                    if sampled >= SAMPLE_FILES:
+                        continue
+                    try:
+                        with open(entry.path, 'rb') as f:
+                            data = f.read(SAMPLE_BYTES)
+                    except OSError:
+                        continue
+                    if data:
+                        sampled += 1
+                        raw += len(data)
+                        packed += len(zlib.compress(data, 1))
+        except OSError:
+            continue
+    if not scanned:
+        return None
+    share = precompressed / scanned
+    ratio = packed / raw if raw else 1.0
+    # Pre-compressed files are skipped by --skip-compress, so they weigh in at 1.0
+    return share + (1 - share) * ratio, share
+
+
+def choose_compression(rate_bps, ratio, headroom, modern): #vers 1
+    """rsync compression arguments for the measured conditions ([] = no compression)
+
+    modern means both ends run rsync >= 3.2 (--compress-choice, zstd/lz4).
+    """
+    if ratio is not None and ratio >= INCOMPRESSIBLE:
+        return []
+    if rate_bps is not None and rate_bps >= FAST_LINK:
+        return []
+
+    slow = rate_bps is not None and rate_bps < SLOW_LINK
+    quick = (rate_bps is not None and rate_bps >= MEDIUM_LINK) or headroom < 0.2
+    if modern:
+        if quick:
+            args = ["--compress", "--compress-choice=lz4"]
+        elif slow and headroom >= 0.5:
+            args = ["--compress", "--compress-choice=zstd", "--compress-level=9"]
+        else:
+            args = ["--compress", "--compress-choice=zstd", "--compress-level=3"]
+    else:
+        level = 1 if quick else 9 if slow and headroom >= 0.5 else 6
+        args = ["-z", f"--compress-level={level}"]
+    return args + [f"--skip-compress={SKIP_COMPRESS}"]
+
+
+def describe_compression(args): #vers 1
+    """Short label for a set of compression arguments"""
+    if not args:
+        return "none"
+    choice = next((arg.split('=', 1)[1] for arg in args if arg.startswith("--compress-choice=")),
+        "zlib")
+    level = next((arg.split('=', 1)[1] for arg in args if arg.startswith("--compress-level=")), "")
+    return f"{choice}-{level}" if level else choice
+
+
+class CompressionPolicy:
+    """Per-process compression decisions - link probe per connection, samples per directory"""
+
+    def __init__(self): #vers 1
+        self.mode = 'adaptive'
+        self.ssh_prefix = None
+        self.target = None
+        self.rate_bps = None
+        self.remote_version = None
+        self.samples = {}  # directory -> (sampled at, ratio)
+        self.lock = threading.Lock()
+
+    def configure(self, ssh_prefix, target): #vers 1
+        """Point the policy at a new connection - forgets the previous link measurement"""
+        with self.lock:
+            self.ssh_prefix = list(ssh_prefix)
+            self.target = target
+            self.rate_bps = None
+            self.remote_version = None
+
+    def _timed_sink(self, ssh_prefix, target, payload, token): #vers 1
+        """Seconds to push payload into `cat > /dev/null` on target, returns (success, seconds or error)"""
+        started = time.monotonic()
+        returncode, _, stderr = run_process(ssh_prefix + [target, "cat > /dev/null"], token,
+            timeout=60, input_data=payload)
+        if returncode != 0:
+            return False, stderr.strip() or f"Exit code {returncode}"
+        return True, time.monotonic() - started
+
+    def probe(self, token=None): #vers 2
+        """Measure link throughput and read the remote rsync version
+
+        The version is a call of its own (it also warms the ssh master). A zero-payload
+        run of the same sink command gives the per-call baseline - session setup and
+        round trip - which is subtracted from each timed payload; the payload grows
+        from PROBE_BYTES until it takes PROBE_MIN_SECONDS, so fast links are not
+        measured by their ssh setup time. Returns (success, rate in bytes/s or error).
+        """
+        with self.lock:
+            ssh_prefix, target = self.ssh_prefix, self.target
+        if not ssh_prefix:
+            return False, "Not configured"
+        returncode, stdout, stderr = run_process(ssh_prefix + [target,
+            "rsync --version 2>/dev/null | head -n 1"], token, timeout=30)
+        if returncode != 0:
+            return False, stderr.strip() or f"Exit code {returncode}"
+        with self.lock:
+            self.remote_version = parse_rsync_version(stdout)
+
+        success, baseline = self._timed_sink(ssh_prefix, target, b"", token)
+        if not success:
+            return False, baseline
+        size = PROBE_BYTES
+        while True:
+            success, elapsed = self._timed_sink(ssh_prefix, target, os.urandom(size), token)
+            if not success:
+                return False, elapsed
+            transfer = max(elapsed - baseline, 0.001)
+            if transfer >= PROBE_MIN_SECONDS or size >= PROBE_MAX_BYTES:
+                break
+            size = min(size * PROBE_GROWTH, PROBE_MAX_BYTES)
+        with self.lock:
+            self.rate_bps = size / transfer
+        return True, self.rate_bps
+
+    def _ratio(self, directory): #vers 1
+        if not directory or not os.path.isdir(directory):
+            return None
+        now = time.monotonic()
+        with self.lock:
+            cached = self.samples.get(directory)
+        if cached and now - cached[0] < SAMPLE_TTL:
+            return cached[1]
+        sample = sample_compressibility(directory)
+        ratio = sample[0] if sample else None
+        with self.lock:
+            self.samples[directory] = (now, ratio)
+        return ratio
+
+    def rsync_args(self, source, dest): #vers 1
+        """Compression arguments for one rsync from source to dest
+
+        Samples whichever side is local - a pull samples the local destination,
+        whose earlier copies are the best cheap guess at what is coming.
+        """
+        if self.mode == 'off':
+            return []
+        if self.mode == 'always':
+            return ["-z", f"--skip-compress={SKIP_COMPRESS}"]
+        local = dest if ':' in source.split('/', 1)[0] else source
+        ratio = self._ratio(local.rstrip('/'))
+        local_version = local_rsync_version()
+        with self.lock:
+            rate, remote_version = self.rate_bps, self.remote_version
+        modern = bool(local_version and remote_version
+            and local_version >= (3, 2, 0) and remote_version >= (3, 2, 0))
+        return choose_compression(rate, ratio, cpu_headroom(), modern)
+
+
+_policy = None
+
+
+def get_compression_policy(): #vers 1
+    """Process-wide compression policy"""
+    global _policy
+    if _policy is None:
+        _policy = CompressionPolicy()
+    return _policy
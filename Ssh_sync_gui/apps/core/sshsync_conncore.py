@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Connection Manager Core - version 1
+this belongs in apps/core/sshsync_conncore.py
+
+Persistent multiplexed SSH master connections (ControlMaster/ControlPath/ControlPersist)
+shared by every ssh and rsync invocation, with a small LRU pool across profiles
+"""
+
+import hashlib
+import os
+import subprocess
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+
+CONTROL_PERSIST = 600  # seconds an idle master stays alive
+MAX_MASTERS = 4        # masters kept open across profiles
+
+
+def get_control_dir(): #vers 1
+    """Private per-user directory holding the control sockets"""
+    control_dir = Path(tempfile.gettempdir()) / f"sshsync-{os.getuid()}"
+    control_dir.mkdir(mode=0o700, exist_ok=True)
+    return control_dir
+
+
+def get_control_path(remote_host, remote_user, remote_port): #vers 1
+    """Short, deterministic socket path for a host/user/port (unix sockets max ~104 chars)"""
+    key = f"{remote_user}@{remote_host}:{remote_port}".encode('utf-8')
+    digest = hashlib.sha1(key).hexdigest()[:16]
+    return str(get_control_dir() / f"cm-{digest}")
+
+
+def build_master_options(control_path): #vers 1
+    """SSH -o options for a client that rides an existing master (falls back to direct)"""
+    return [
+        "-o", "ControlMaster=no",
+        "-o", f"ControlPath={control_path}"
+    ]
+
+
+def open_master(remote_host, remote_user, remote_port, use_password, password=None,
+    ssh_key_path=None, control_path=None, connect_timeout=5): #vers 1
+    """Start a background ControlMaster for host, returns (success, error)"""
+    if control_path is None:
+        control_path = get_control_path(remote_host, remote_user, remote_port)
+
+    cmd = []
+    if use_password and password:
+        cmd += ["sshpass", "-p", password]
+    cmd += ["ssh", "-M", "-N", "-f"]
+    if not (use_password and password):
+        cmd += ["-i", ssh_key_path]
+    cmd += [
+        "-p", str(remote_port),
+        "-o", "StrictHostKeyChecking=no",
+        "-o", f"ConnectTimeout={connect_timeout}",
+        "-o", "ControlMaster=yes",
+        "-o", f"ControlPath={control_path}",
+        "-o", f"ControlPersist={CONTROL_PERSIST}",
+        f"{remote_user}@{remote_host}"
+    ]
+
+    # The backgrounded master inherits stderr - a pipe would keep run() waiting
+    # until ControlPersist expires, so collect it through a temp file instead
+    try:
+        with tempfile.TemporaryFile() as err_file:
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                stderr=err_file, timeout=connect_timeout + 10)
+            err_file.seek(0)
+            error = err_file.read().decode('utf-8', errors='replace')
+        return result.returncode == 0, error
+
+    except subprocess.TimeoutExpired:
+        return False, "Connection timeout"
+    except FileNotFoundError as e:
+        return False, f"{e.filename}: command not found"
+    except Exception as e:
+        return False, str(e)
+
+
+def check_master(remote_host, remote_user, remote_port, control_path=None): #vers 1
+    """Check whether a master is alive on control_path"""
+    if control_path is None:
+        control_path = get_control_path(remote_host, remote_user, remote_port)
+    if not os.path.exists(control_path):
+        return False
+    try:
+        result = subprocess.run(
+            ["ssh", "-o", f"ControlPath={control_path}", "-O", "check",
+             f"{remote_user}@{remote_host}"],
+            capture_output=True, text=True, timeout=5)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def close_master(remote_host, remote_user, remote_port, control_path=None): #vers 1
+    """Ask the master on control_path to exit"""
+    if control_path is None:
+        control_path = get_control_path(remote_host, remote_user, remote_port)
+    if not os.path.exists(control_path):
+        return True, ""
+    try:
+        result = subprocess.run(
+            ["ssh", "-o", f"ControlPath={control_path}", "-O", "exit",
+             f"{remote_user}@{remote_host}"],
+            capture_output=True, text=True, timeout=5)
+        return result.returncode == 0, result.stderr
+    except Exception as e:
+        return False, str(e)
+
+
+class SSHMasterPool:
+    """LRU pool of ControlMaster connections keyed by (user, host, port)"""
+
+    def __init__(self, max_masters=MAX_MASTERS): #vers 1
+        self.max_masters = max_masters
+        self.masters = OrderedDict()  # key -> control_path
+
+    def acquire(self, remote_host, remote_user, remote_port, use_password, password=None,
+        ssh_key_path=None): #vers 1
+        """Return (success, control_path or error), opening a master if needed"""
+        key = (remote_user, remote_host, int(remote_port))
+
+        control_path = self.masters.get(key)
+        if control_path and check_master(remote_host, remote_user, remote_port, control_path):
+            self.masters.move_to_end(key)
+            return True, control_path
+
+        control_path = get_control_path(remote_host, remote_user, remote_port)
+        if not check_master(remote_host, remote_user, remote_port, control_path):
+            success, error = open_master(remote_host, remote_user, remote_port, use_password,
+                password, ssh_key_path, control_path)
+            if not success:
+                self.masters.pop(key, None)
+                return False, error
+
+        self.masters[key] = control_path
+        self.masters.move_to_end(key)
+
+        while len(self.masters) > self.max_masters:
+            (user, host, port), old_path = self.masters.popitem(last=False)
+            close_master(host, user, port, old_path)
+
+        return True, control_path
+
+    def get(self, remote_host, remote_user, remote_port): #vers 1
+        """Control path for an open master, or None"""
+        return self.masters.get((remote_user, remote_host, int(remote_port)))
+
+    def release(self, remote_host, remote_user, remote_port): #vers 1
+        """Tear down the master for one profile"""
+        control_path = self.masters.pop((remote_user, remote_host, int(remote_port)), None)
+        if control_path:
+            return close_master(remote_host, remote_user, remote_port, control_path)
+        return True, ""
+
+    def release_all(self): #vers 1
+        """Tear down every pooled master"""
+        while self.masters:
+            (user, host, port), control_path = self.masters.popitem(last=False)
+            close_master(host, user, port, control_path)
+
+
+_master_pool = None
+
+
+def get_master_pool(): #vers 1
+    """Process-wide master pool"""
+    global _master_pool
+    if _master_pool is None:
+        _master_pool = SSHMasterPool()
+    return _master_pool
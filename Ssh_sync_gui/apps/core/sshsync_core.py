@@ -1,46 +1,80 @@
 #!/usr/bin/env python3
 """
-X-Seti - July03 2023 - SSH File Sync - Core SSH Functionse - version 1
+X-Seti - July03 2023 - SSH File Sync - Core SSH Functionse - version 10
 this belongs in apps/core/sshsync_core.py
 
 Single-purpose functions for SSH operations
 """
 
+import os
+import posixpath
+import shlex
 import subprocess
-from pathlib import Path
 
+from core.sshsync_compresscore import get_compression_policy
+from core.sshsync_conncore import build_master_options
+from core.sshsync_indexcore import RemoteIndex, build_listing_command, stream_remote_index
+from core.sshsync_rsynccore import PARTIAL_DIR
+from core.sshsync_runcore import run_process
 
-def build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port): #vers 1
-    """Build SSH command prefix based on authentication method"""
+
+# Remote side of remote_batch_ops - reads (op, arg1, arg2) NUL-delimited triples from
+# stdin, answers each with (op, exit code, output) NUL-delimited on stdout.
+# list answers with newline-terminated sshsync_indexcore.LISTING_FIELDS records
+BATCH_OPS_SCRIPT = r"""
+cd -- "$1" || exit 3
+while IFS= read -r -d '' op && IFS= read -r -d '' a && IFS= read -r -d '' b; do
+  case "$op" in
+    delete) out=$(rm -rf -- "$a" 2>&1) ;;
+    mkdir)  out=$(mkdir -p -- "$a" 2>&1) ;;
+    rename) out=$(mv -- "$a" "$b" 2>&1) ;;
+    stat)   out=$(stat -- "$a" 2>&1) ;;
+    list)   out=$(find "$a"/ -mindepth 1 -maxdepth 1 -printf '%y\t%s\t%T@\t%i\t%P\n' 2>&1) ;;
+    *)      out="Unknown operation: $op"; false ;;
+  esac
+  rc=$?
+  printf '%s\0%s\0%s\0' "$op" "$rc" "$out"
+done
+"""
+
+BATCH_OPS = ('delete', 'mkdir', 'rename', 'stat', 'list')
+
+
+def build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+    control_path=None): #vers 2
+    """Build SSH command prefix based on authentication method, riding the master if given"""
     if use_password and password:
-        return [
+        cmd = [
             "sshpass", "-p", password,
             "ssh",
             "-p", str(remote_port),
             "-o", "StrictHostKeyChecking=no"
         ]
     else:
-        return [
+        cmd = [
             "ssh",
             "-i", ssh_key_path,
             "-p", str(remote_port),
             "-o", "StrictHostKeyChecking=no"
         ]
+    if control_path:
+        cmd.extend(build_master_options(control_path))
+    return cmd
 
 
-def build_rsync_ssh_option(use_password, password, ssh_key_path, remote_port): #vers 1
-    """Build rsync SSH option based on authentication method"""
-    if use_password and password:
-        return f"sshpass -p {password} ssh -p {remote_port} -o StrictHostKeyChecking=no"
-    else:
-        return f"ssh -i {ssh_key_path} -p {remote_port} -o StrictHostKeyChecking=no"
+def build_rsync_ssh_option(use_password, password, ssh_key_path, remote_port,
+    control_path=None): #vers 2
+    """Build rsync SSH option based on authentication method, riding the master if given"""
+    return " ".join(shlex.quote(part) for part in build_ssh_cmd_prefix(
+        use_password, password, ssh_key_path, remote_port, control_path))
 
 
 def test_ssh_connection(remote_host, remote_user, remote_port, use_password, password=None,
-    ssh_key_path=None): #vers 1
+    ssh_key_path=None, control_path=None): #vers 2
     """Test SSH connection to remote host"""
     try:
-        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port)
+        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+            control_path)
         cmd.extend([
             f"{remote_user}@{remote_host}",
             "echo 'OK'"
@@ -55,36 +89,61 @@ def test_ssh_connection(remote_host, remote_user, remote_port, use_password, pas
         return False, str(e)
 
 
+def list_remote_index(remote_host, remote_user, remote_path, remote_port, use_password,
+    password=None, ssh_key_path=None, control_path=None, max_depth=1, token=None,
+    on_entries=None, strict=False): #vers 2
+    """Stream a metadata listing of remote_path into a RemoteIndex in one round trip
+
+    max_depth=1 lists the directory itself, None the whole tree. on_entries gets
+    batches of RemoteEntry while the listing is still running. strict fails on
+    any listing error instead of keeping a partial index.
+    Returns (success, RemoteIndex or error).
+    """
+    cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+        control_path)
+    cmd.extend([
+        f"{remote_user}@{remote_host}",
+        build_listing_command(quote_remote_path(remote_path), max_depth)
+    ])
+    return stream_remote_index(cmd, RemoteIndex(remote_path, max_depth), token, on_entries,
+        strict=strict)
+
+
 def list_remote_files(remote_host, remote_user, remote_path, remote_port, use_password,
-    password=None, ssh_key_path=None): #vers 1
+    password=None, ssh_key_path=None, control_path=None): #vers 3
     """List files in remote directory"""
-    try:
-        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port)
-        cmd.extend([
-            f"{remote_user}@{remote_host}",
-            f"ls -1 {remote_path}"
-        ])
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            files = [f.strip() for f in result.stdout.split('\n') if f.strip()]
-            return True, files
-        else:
-            return False, result.stderr
-            
-    except Exception as e:
-        return False, str(e)
+    success, result = list_remote_index(remote_host, remote_user, remote_path, remote_port,
+        use_password, password, ssh_key_path, control_path)
+    if not success:
+        return False, result
+    return True, [entry.name for entry in result.children()]
+
+
+def list_remote_tree(remote_host, remote_user, remote_path, remote_port, use_password,
+    password=None, ssh_key_path=None, control_path=None): #vers 3
+    """List every file, symlink and directory under remote_path as (relative path, size)
+    in one round trip"""
+    success, result = list_remote_index(remote_host, remote_user, remote_path, remote_port,
+        use_password, password, ssh_key_path, control_path, max_depth=None)
+    if not success:
+        return False, result
+    return True, result.tree()
 
 
 def rsync_to_remote(local_path, remote_host, remote_user, remote_path, remote_port,
-    use_password, delete_extra=False, password=None, ssh_key_path=None): #vers 1
-    """Sync files to remote using rsync"""
+    use_password, delete_extra=False, password=None, ssh_key_path=None, control_path=None,
+    compress_args=None): #vers 4
+    """Sync files to remote using rsync - compression from the adaptive policy unless compress_args is given"""
     try:
+        if compress_args is None:
+            compress_args = get_compression_policy().rsync_args(f"{local_path}/", f"{remote_user}@{remote_host}:{remote_path}/")
         cmd = [
             "rsync",
-            "-avz",
-            "-e", build_rsync_ssh_option(use_password, password, ssh_key_path, remote_port)
+            "-av",
+            *compress_args,
+            f"--partial-dir={PARTIAL_DIR}",
+            "-e", build_rsync_ssh_option(use_password, password, ssh_key_path,
+                remote_port, control_path)
         ]
         
         if delete_extra:
@@ -103,13 +162,19 @@ def rsync_to_remote(local_path, remote_host, remote_user, remote_path, remote_po
 
 
 def rsync_from_remote(remote_host, remote_user, remote_path, local_path, remote_port,
-    use_password, delete_extra=False, password=None, ssh_key_path=None): #vers 1
-    """Sync files from remote using rsync"""
+    use_password, delete_extra=False, password=None, ssh_key_path=None, control_path=None,
+    compress_args=None): #vers 4
+    """Sync files from remote using rsync - compression from the adaptive policy unless compress_args is given"""
     try:
+        if compress_args is None:
+            compress_args = get_compression_policy().rsync_args(f"{remote_user}@{remote_host}:{remote_path}/", f"{local_path}/")
         cmd = [
             "rsync",
-            "-avz",
-            "-e", build_rsync_ssh_option(use_password, password, ssh_key_path, remote_port)
+            "-av",
+            *compress_args,
+            f"--partial-dir={PARTIAL_DIR}",
+            "-e", build_rsync_ssh_option(use_password, password, ssh_key_path,
+                remote_port, control_path)
         ]
         
         if delete_extra:
@@ -128,10 +193,11 @@ def rsync_from_remote(remote_host, remote_user, remote_path, local_path, remote_
 
 
 def remote_rename_file(remote_host, remote_user, remote_path, old_name, new_name, 
-    remote_port, use_password, password=None, ssh_key_path=None): #vers 1
+    remote_port, use_password, password=None, ssh_key_path=None, control_path=None): #vers 2
     """Rename file on remote host"""
     try:
-        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port)
+        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+            control_path)
         cmd.extend([
             f"{remote_user}@{remote_host}",
             f"cd {remote_path} && mv '{old_name}' '{new_name}'"
@@ -145,10 +211,11 @@ def remote_rename_file(remote_host, remote_user, remote_path, old_name, new_name
 
 
 def remote_delete_file(remote_host, remote_user, remote_path, filename,
-    remote_port, use_password, password=None, ssh_key_path=None): #vers 1
+    remote_port, use_password, password=None, ssh_key_path=None, control_path=None): #vers 2
     """Delete file on remote host"""
     try:
-        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port)
+        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+            control_path)
         cmd.extend([
             f"{remote_user}@{remote_host}",
             f"rm -rf {remote_path}/{filename}"
@@ -162,10 +229,11 @@ def remote_delete_file(remote_host, remote_user, remote_path, filename,
 
 
 def remote_create_directory(remote_host, remote_user, remote_path, dirname,
-    remote_port, use_password, password=None, ssh_key_path=None): #vers 1
+    remote_port, use_password, password=None, ssh_key_path=None, control_path=None): #vers 2
     """Create directory on remote host"""
     try:
-        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port)
+        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+            control_path)
         cmd.extend([
             f"{remote_user}@{remote_host}",
             f"mkdir -p {remote_path}/{dirname}"
@@ -179,10 +247,11 @@ def remote_create_directory(remote_host, remote_user, remote_path, dirname,
 
 
 def remote_file_info(remote_host, remote_user, remote_path, filename,
-    remote_port, use_password, password=None, ssh_key_path=None): #vers 1
+    remote_port, use_password, password=None, ssh_key_path=None, control_path=None): #vers 2
     """Get file information from remote host"""
     try:
-        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port)
+        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+            control_path)
         cmd.extend([
             f"{remote_user}@{remote_host}",
             f"stat {remote_path}/{filename}"
@@ -198,6 +267,92 @@ def remote_file_info(remote_host, remote_user, remote_path, filename,
         return False, str(e)
 
 
+def quote_remote_path(remote_path): #vers 1
+    """Shell-quote a remote path while keeping a leading ~/ expandable"""
+    if remote_path == "~":
+        return "~"
+    if remote_path.startswith("~/"):
+        return "~/" + shlex.quote(remote_path[2:])
+    return shlex.quote(remote_path)
+
+
+def _contains(outer, inner): #vers 1
+    """True when inner is outer or lies below it - both normalized, same separator"""
+    return inner == outer or inner.startswith(outer.rstrip('/') + '/')
+
+
+def local_paths_overlap(first, second): #vers 1
+    """True when one local folder is, or lies inside, the other - ~ and symlinks resolved"""
+    first, second = (os.path.realpath(os.path.expanduser(path)) for path in (first, second))
+    return _contains(first, second) or _contains(second, first)
+
+
+def _remote_base(remote_path): #vers 1
+    """(base, normalized absolute path under it) - base is '/' or the ~ / ~user it starts from"""
+    path = remote_path.strip()
+    if path.startswith('/'):
+        base, rest = '/', path
+    elif path.startswith('~'):
+        base, _, rest = path.partition('/')
+    else:
+        base, rest = '~', path  # ssh starts in the home directory
+    return base, posixpath.normpath('/' + rest)
+
+
+def remote_paths_overlap(first, second): #vers 1
+    """True when one remote folder is, or may be, inside the other
+
+    Without asking the remote, ~/x and /home/user/x cannot be told apart, so paths
+    from different bases (home vs absolute) count as overlapping; remote symlinks
+    are not resolved.
+    """
+    (first_base, first), (second_base, second) = _remote_base(first), _remote_base(second)
+    if first_base != second_base:
+        return True
+    return _contains(first, second) or _contains(second, first)
+
+
+def remote_batch_ops(remote_host, remote_user, remote_path, operations, remote_port,
+    use_password, password=None, ssh_key_path=None, control_path=None, token=None): #vers 1
+    """Run many file operations in one ssh round trip
+
+    operations is a list of (op, arg1, arg2) with op in BATCH_OPS, paths relative
+    to remote_path. Returns (success, [(op, ok, output), ...]) in request order.
+    """
+    for operation in operations:
+        if operation[0] not in BATCH_OPS:
+            return False, f"Unknown operation: {operation[0]}"
+    try:
+        cmd = build_ssh_cmd_prefix(use_password, password, ssh_key_path, remote_port,
+            control_path)
+        cmd.extend([
+            f"{remote_user}@{remote_host}",
+            f"bash -c {shlex.quote(BATCH_OPS_SCRIPT)} sshsync-batch {quote_remote_path(remote_path)}"
+        ])
+
+        request = b"".join(
+            b"".join(str(field).encode('utf-8', errors='surrogateescape') + b"\0"
+                for field in (op, arg1, arg2))
+            for op, arg1, arg2 in ((list(operation) + ["", ""])[:3] for operation in operations))
+
+        returncode, stdout, stderr = run_process(cmd, token, timeout=300, input_data=request)
+        if token and token.cancelled:
+            return False, "Cancelled"
+
+        fields = stdout.split('\0')
+        results = []
+        for index in range(0, len(fields) - 2, 3):
+            op, code, output = fields[index:index + 3]
+            results.append((op, code == "0", output.strip()))
+
+        if returncode != 0 and not results:
+            return False, stderr.strip() or f"Exit code {returncode}"
+        return True, results
+
+    except Exception as e:
+        return False, str(e)
+
+
 def check_sshpass_installed(): #vers 1
     """Check if sshpass is installed"""
     try:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Fan-out Core - version 1
+this belongs in apps/core/sshsync_fanoutcore.py
+
+Multi-host fan-out - the local export tree is scanned once and its file list is fed
+to one rsync per host, several hosts at a time, with per-host progress and results
+"""
+
+import re
+import threading
+import time
+
+from core.sshsync_rsynccore import build_batch_cmd, encode_file_list, run_rsync
+from core.sshsync_shardcore import prune_extraneous, walk_local_tree
+
+
+# "user@host:port", "user@host", "host:port" or "host" - user and port default to the profile
+HOST_RE = re.compile(r"^(?:(?P<user>[^@\s]+)@)?(?P<host>[^:@\s]+)(?::(?P<port>\d+))?$")
+
+
+def parse_host_group(text, default_user, default_port): #vers 1
+    """One host per line (blank lines and # comments ignored)
+
+    Returns (success, [(user, host, port)] or error).
+    """
+    hosts = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        match = HOST_RE.match(line)
+        if not match:
+            return False, f"Line {number}: expected user@host[:port]"
+        host = (match.group('user') or default_user, match.group('host'),
+            int(match.group('port') or default_port))
+        if host not in hosts:
+            hosts.append(host)
+    return True, hosts
+
+
+def host_label(user, host, port): #vers 1
+    return f"{user}@{host}" if port == 22 else f"{user}@{host}:{port}"
+
+
+def run_fanout_job(token, progress, source_dir, hosts, remote_path, delete, max_parallel,
+    ssh_option_for): #vers 1
+    """Job body - push source_dir to remote_path on every host
+
+    ssh_option_for(port) returns the rsync -e option for a host. At most
+    max_parallel hosts run at once. Returns (success, [result dict per host]) -
+    host failures are reported in the results, not as a job failure.
+    """
+    progress({'file': "Scanning export tree...", 'percent': 0})
+    files = walk_local_tree(source_dir)
+    if token.cancelled:
+        return False, "Cancelled"
+    file_list = encode_file_list(sorted(path for path, _ in files))
+
+    lock = threading.Lock()
+    slots = threading.Semaphore(max(1, max_parallel))
+    states = {host_label(*host): {'state': "queued", 'percent': 0, 'rate_bps': 0.0}
+        for host in hosts}
+    results = []
+
+    def push(user, host, port):
+        label = host_label(user, host, port)
+        with slots:
+            if token.cancelled:
+                return
+            with lock:
+                states[label]['state'] = "running"
+            started = time.monotonic()
+            ssh_option = ssh_option_for(port)
+            target = f"{user}@{host}:{remote_path}"
+
+            def on_progress(info):
+                with lock:
+                    states[label]['percent'] = info.get('percent', 0)
+                    states[label]['rate_bps'] = info.get('rate_bps', 0.0)
+
+            success, result = run_rsync(build_batch_cmd(ssh_option, source_dir, target),
+                token, on_progress, interval=0.5, input_data=file_list)
+            summary = {'host': label, 'success': success, 'bytes': 0, 'changed': 0,
+                'deleted': 0, 'error': "", 'seconds': 0.0}
+            if success:
+                summary['bytes'], summary['changed'] = result['bytes'], len(result['changed'])
+                if delete:
+                    success, deleted = prune_extraneous(ssh_option, f"{source_dir}/",
+                        f"{target}/", token)
+                    if success:
+                        summary['deleted'] = len(deleted)
+                    else:
+                        summary.update(success=False, error=f"Prune failed: {deleted}")
+            else:
+                summary['error'] = result
+            summary['seconds'] = time.monotonic() - started
+            with lock:
+                states[label].update(state="done" if summary['success'] else "failed",
+                    percent=100 if summary['success'] else states[label]['percent'])
+                results.append(summary)
+
+    threads = [threading.Thread(target=push, args=host, daemon=True) for host in hosts]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        time.sleep(0.5)
+        with lock:
+            snapshot = {label: dict(state) for label, state in states.items()}
+            finished = sum(state['state'] in ("done", "failed") for state in snapshot.values())
+        progress({
+            'percent': int(sum(state['percent'] for state in snapshot.values()) / max(len(hosts), 1)),
+            'rate_bps': sum(state['rate_bps'] for state in snapshot.values()
+                if state['state'] == "running"),
+            'file': f"{finished}/{len(hosts)} hosts done",
+            'hosts': snapshot,
+        })
+
+    if token.cancelled:
+        return False, "Cancelled"
+    order = [host_label(*host) for host in hosts]
+    return True, sorted(results, key=lambda summary: order.index(summary['host']))
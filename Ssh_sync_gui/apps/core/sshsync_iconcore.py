@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Icon SVG Core - version 2
+this belongs in apps/core/sshsync_iconcore.py
+
+The GUI's SVG icons in one Qt-free table - the window's _create_*_icon methods and
+build_icon_atlas.py both read it, so the atlas always covers what the window draws.
+currentColor is replaced with the theme text color when an icon is drawn.
+"""
+
+import hashlib
+
+
+# Sizes (logical px) each icon is drawn at - the atlas pre-renders exactly these
+DEFAULT_ICON_SIZES = (20,)
+ICON_SIZES = {
+    'app': (32, 64),
+}
+
+ICON_SVGS = {
+    'info': b'''<svg width="20" height="20" viewBox="0 0 20 20" fill="none" xmlns="http://www.w3.org/2000/svg">
+        <circle cx="10" cy="10" r="8" stroke="currentColor" stroke-width="2"/>
+        <path d="M10 6v4M10 14h.01" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
+    </svg>''',
+
+    'settings': b'''<svg width="20" height="20" viewBox="0 0 20 20" fill="none" xmlns="http://www.w3.org/2000/svg">
+        <circle cx="10" cy="10" r="3" stroke="currentColor" stroke-width="2"/>
+        <path d="M10 2v2M10 16v2M2 10h2M16 10h2M4.93 4.93l1.41 1.41M13.66 13.66l1.41 1.41M4.93 15.07l1.41-1.41M13.66 6.34l1.41-1.41" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
+    </svg>''',
+
+    'theme': b'''<svg width="20" height="20" viewBox="0 0 20 20" fill="none" xmlns="http://www.w3.org/2000/svg">
+        <path d="M10 2C5.58 2 2 5.58 2 10c0 4.42 3.58 8 8 8 .5 0 1-.4 1-1 0-.25-.1-.48-.24-.65-.14-.17-.24-.42-.24-.65 0-.55.45-1 1-1h1.5c2.48 0 4.5-2.02 4.5-4.5C17.52 5.58 14.42 2 10 2z" stroke="currentColor" stroke-width="1.5" fill="none"/>
+        <circle cx="5.5" cy="10" r="1" fill="currentColor"/>
+        <circle cx="8" cy="7" r="1" fill="currentColor"/>
+        <circle cx="12" cy="7" r="1" fill="currentColor"/>
+        <circle cx="14.5" cy="10" r="1" fill="currentColor"/>
+    </svg>''',
+
+    'minimize': b'''<svg viewBox="0 0 24 24">
+        <line x1="5" y1="12" x2="19" y2="12"
+            stroke="currentColor" stroke-width="2"
+            stroke-linecap="round"/>
+    </svg>''',
+
+    'maximize': b'''<svg viewBox="0 0 24 24">
+        <rect x="5" y="5" width="14" height="14"
+            stroke="currentColor" stroke-width="2"
+            fill="none" rx="2"/>
+    </svg>''',
+
+    'close': b'''<svg viewBox="0 0 24 24">
+        <line x1="6" y1="6" x2="18" y2="18"
+            stroke="currentColor" stroke-width="2"
+            stroke-linecap="round"/>
+        <line x1="18" y1="6" x2="6" y2="18"
+            stroke="currentColor" stroke-width="2"
+            stroke-linecap="round"/>
+    </svg>''',
+
+    'import': b'''<svg viewBox="0 0 24 24">
+        <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"
+            stroke="currentColor" stroke-width="2"
+            fill="none" stroke-linecap="round" stroke-linejoin="round"/>
+        <polyline points="7 10 12 15 17 10"
+                stroke="currentColor" stroke-width="2"
+                fill="none" stroke-linecap="round" stroke-linejoin="round"/>
+        <line x1="12" y1="15" x2="12" y2="3"
+            stroke="currentColor" stroke-width="2"
+            stroke-linecap="round"/>
+    </svg>''',
+
+    'export': b'''<svg viewBox="0 0 24 24">
+        <path d="M21 15v4a2 2 0 01-2 2H5a2 2 0 01-2-2v-4"
+            stroke="currentColor" stroke-width="2"
+            fill="none" stroke-linecap="round" stroke-linejoin="round"/>
+        <polyline points="17 8 12 3 7 8"
+                stroke="currentColor" stroke-width="2"
+                fill="none" stroke-linecap="round" stroke-linejoin="round"/>
+        <line x1="12" y1="3" x2="12" y2="15"
+            stroke="currentColor" stroke-width="2"
+            stroke-linecap="round"/>
+    </svg>''',
+
+    'rename': b'''<svg viewBox="0 0 24 24">
+        <path d="M11 4H4a2 2 0 00-2 2v14a2 2 0 002 2h14a2 2 0 002-2v-7"
+            stroke="currentColor" stroke-width="2" fill="none"/>
+        <path d="M18.5 2.5a2.121 2.121 0 013 3L12 15l-4 1 1-4 9.5-9.5z"
+            stroke="currentColor" stroke-width="2" fill="none"/>
+    </svg>''',
+
+    'ignore': b'''<svg viewBox="0 0 24 24">
+        <path d="M1 12s4-8 11-8 11 8 11 8-4 8-11 8-11-8-11-8z"
+            stroke="currentColor" stroke-width="2" fill="none"/>
+        <circle cx="12" cy="12" r="3" stroke="currentColor" stroke-width="2" fill="none"/>
+        <line x1="1" y1="1" x2="23" y2="23" stroke="currentColor" stroke-width="2"/>
+    </svg>''',
+
+    'find': b'''<svg viewBox="0 0 24 24">
+        <circle cx="11" cy="11" r="8" stroke="currentColor" stroke-width="2" fill="none"/>
+        <line x1="21" y1="21" x2="16.65" y2="16.65" stroke="currentColor" stroke-width="2"/>
+    </svg>''',
+
+    'replace': b'''<svg viewBox="0 0 24 24">
+        <polyline points="17 1 21 5 17 9" stroke="currentColor" stroke-width="2" fill="none"/>
+        <path d="M3 11V9a4 4 0 014-4h14" stroke="currentColor" stroke-width="2" fill="none"/>
+        <polyline points="7 23 3 19 7 15" stroke="currentColor" stroke-width="2" fill="none"/>
+        <path d="M21 13v2a4 4 0 01-4 4H3" stroke="currentColor" stroke-width="2" fill="none"/>
+    </svg>''',
+
+    'adddir': b'''<svg viewBox="0 0 24 24">
+        <path d="M22 19a2 2 0 01-2 2H4a2 2 0 01-2-2V5a2 2 0 012-2h5l2 3h9a2 2 0 012 2z"
+            stroke="currentColor" stroke-width="2" fill="none"/>
+        <line x1="12" y1="11" x2="12" y2="17" stroke="currentColor" stroke-width="2"/>
+        <line x1="9" y1="14" x2="15" y2="14" stroke="currentColor" stroke-width="2"/>
+    </svg>''',
+
+    'delete': b'''<svg viewBox="0 0 24 24">
+        <polyline points="3 6 5 6 21 6" stroke="currentColor" stroke-width="2" fill="none"/>
+        <path d="M19 6v14a2 2 0 01-2 2H7a2 2 0 01-2-2V6m3 0V4a2 2 0 012-2h4a2 2 0 012 2v2"
+            stroke="currentColor" stroke-width="2" fill="none"/>
+        <line x1="10" y1="11" x2="10" y2="17" stroke="currentColor" stroke-width="2"/>
+        <line x1="14" y1="11" x2="14" y2="17" stroke="currentColor" stroke-width="2"/>
+    </svg>''',
+
+    'app': b'''<svg viewBox="0 0 32 32" xmlns="http://www.w3.org/2000/svg">
+        <!-- Computer 1 -->
+        <rect x="2" y="8" width="10" height="8" stroke="currentColor" stroke-width="1.5" fill="none" rx="1"/>
+        <line x1="4" y1="16" x2="10" y2="16" stroke="currentColor" stroke-width="1"/>
+
+        <!-- Computer 2 -->
+        <rect x="20" y="8" width="10" height="8" stroke="currentColor" stroke-width="1.5" fill="none" rx="1"/>
+        <line x1="22" y1="16" x2="28" y2="16" stroke="currentColor" stroke-width="1"/>
+
+        <!-- Sync arrows -->
+        <path d="M 12 10 L 19 10" stroke="currentColor" stroke-width="1.5" fill="none"/>
+        <path d="M 17 8 L 19 10 L 17 12" stroke="currentColor" stroke-width="1.5" fill="none"/>
+
+        <path d="M 20 14 L 13 14" stroke="currentColor" stroke-width="1.5" fill="none"/>
+        <path d="M 15 12 L 13 14 L 15 16" stroke="currentColor" stroke-width="1.5" fill="none"/>
+
+        <!-- Lock symbol (security) -->
+        <rect x="14" y="22" width="4" height="4" stroke="currentColor" stroke-width="1" fill="none" rx="0.5"/>
+        <path d="M 15 22 L 15 20 Q 15 19 16 19 Q 17 19 17 20 L 17 22" stroke="currentColor" stroke-width="1" fill="none"/>
+    </svg>''',
+}
+
+
+def icon_sizes(name): #vers 1
+    """Logical sizes the named icon is drawn at"""
+    return ICON_SIZES.get(name, DEFAULT_ICON_SIZES)
+
+
+def icon_set_digest(dprs): #vers 1
+    """sha1 over every icon, its sizes and the given ratios - an atlas built for another set is stale"""
+    digest = hashlib.sha1(repr(tuple(dprs)).encode('ascii'))
+    for name in sorted(ICON_SVGS):
+        digest.update(f"{name}:{icon_sizes(name)}:".encode('ascii'))
+        digest.update(ICON_SVGS[name])
+    return digest.hexdigest()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Remote Index Core - version 3
+this belongs in apps/core/sshsync_indexcore.py
+
+In-memory index of a remote tree, filled from one streamed `find -printf` listing
+(type, size, mtime, inode, path) so lists, info and compares need no further ssh calls
+"""
+
+import time
+
+from core.sshsync_runcore import stream_process
+
+
+# type, size, mtime (epoch, fractional), inode, path relative to the listed root
+LISTING_FIELDS = r"%y\t%s\t%T@\t%i\t%P"
+
+ENTRY_TYPES = {'f': "File", 'd': "Directory", 'l': "Symlink", 'p': "FIFO",
+    's': "Socket", 'b': "Block device", 'c': "Character device"}
+
+
+class RemoteEntry:
+    """One remote file system entry"""
+    __slots__ = ('path', 'kind', 'size', 'mtime', 'inode')
+
+    def __init__(self, path, kind, size, mtime, inode): #vers 1
+        self.path = path
+        self.kind = kind
+        self.size = size
+        self.mtime = mtime
+        self.inode = inode
+
+    @property
+    def name(self): #vers 1
+        return self.path.rsplit('/', 1)[-1]
+
+    @property
+    def is_dir(self): #vers 1
+        return self.kind == 'd'
+
+    @property
+    def modified(self): #vers 1
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.mtime))
+
+    def summary(self): #vers 1
+        """One-line type, size and modification time"""
+        return f"{ENTRY_TYPES.get(self.kind, self.kind)} - {self.size:,} bytes - {self.modified}"
+
+
+def build_listing_command(quoted_path, max_depth=None, terminator="\\0"): #vers 1
+    """Remote shell command listing quoted_path as LISTING_FIELDS records
+
+    quoted_path must already be shell-quoted. max_depth=1 lists one directory level,
+    None the whole tree.
+    """
+    depth = f" -maxdepth {int(max_depth)}" if max_depth else ""
+    return f"find {quoted_path}/ -mindepth 1{depth} -printf '{LISTING_FIELDS}{terminator}'"
+
+
+def parse_listing_record(record): #vers 1
+    """Parse one listing record into a RemoteEntry, or None if malformed"""
+    parts = record.split('\t', 4)
+    if len(parts) != 5 or not parts[4]:
+        return None
+    kind, size, mtime, inode, path = parts
+    try:
+        return RemoteEntry(path, kind, int(size), float(mtime), int(inode))
+    except ValueError:
+        return None
+
+
+class RemoteIndex:
+    """Remote entries keyed by relative path"""
+
+    def __init__(self, root="", max_depth=None): #vers 1
+        self.root = root
+        self.max_depth = max_depth
+        self.entries = {}
+        self.listed_at = 0.0
+
+    def __len__(self): #vers 1
+        return len(self.entries)
+
+    def __contains__(self, path): #vers 1
+        return path in self.entries
+
+    def __iter__(self): #vers 1
+        return iter(self.entries.values())
+
+    def add(self, entry): #vers 1
+        self.entries[entry.path] = entry
+
+    def get(self, path): #vers 1
+        return self.entries.get(path)
+
+    def remove(self, path): #vers 1
+        """Drop path and anything below it"""
+        prefix = path + '/'
+        for key in [key for key in self.entries if key == path or key.startswith(prefix)]:
+            del self.entries[key]
+
+    def files(self): #vers 1
+        """Regular files as (relative path, size)"""
+        return [(entry.path, entry.size) for entry in self.entries.values() if entry.kind == 'f']
+
+    def tree(self): #vers 1
+        """Every entry rsync transfers as (relative path, size) - directories count 0"""
+        return [(entry.path, 0 if entry.kind == 'd' else entry.size)
+            for entry in self.entries.values() if entry.kind in ('f', 'd', 'l')]
+
+    def children(self, directory=""): #vers 1
+        """Sorted entries directly inside directory"""
+        prefix = directory.rstrip('/') + '/' if directory else ""
+        return sorted((entry for entry in self.entries.values()
+            if entry.path.startswith(prefix) and '/' not in entry.path[len(prefix):]),
+            key=lambda entry: entry.path)
+
+    def compare(self, local_files): #vers 1
+        """Compare against local (relative path, size) files
+
+        Returns a dict of sorted path lists: only_local, only_remote, differs (size mismatch).
+        """
+        local = dict(local_files)
+        remote = {entry.path: entry.size for entry in self.entries.values() if entry.kind == 'f'}
+        return {
+            'only_local': sorted(path for path in local if path not in remote),
+            'only_remote': sorted(path for path in remote if path not in local),
+            'differs': sorted(path for path, size in local.items()
+                if path in remote and remote[path] != size),
+        }
+
+    def describe(self, path): #vers 1
+        """Human readable summary of one entry, or None if not indexed"""
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        return (f"File: {entry.path}\n"
+            f"Type: {ENTRY_TYPES.get(entry.kind, entry.kind)}\n"
+            f"Size: {entry.size:,} bytes ({entry.size / 1024:.2f} KB)\n"
+            f"Modified: {entry.modified}\n"
+            f"Inode: {entry.inode}\n"
+            f"Path: {self.root.rstrip('/')}/{entry.path}")
+
+
+def load_listing_text(index, text): #vers 1
+    """Add newline-terminated listing records (batched ops output) to index"""
+    for record in text.split('\n'):
+        entry = parse_listing_record(record)
+        if entry:
+            index.add(entry)
+    index.listed_at = time.time()
+    return index
+
+
+def stream_remote_index(cmd, index, token=None, on_entries=None, batch_size=500,
+    strict=False): #vers 2
+    """Run a NUL-terminated listing cmd, adding entries to index as they arrive
+
+    on_entries receives lists of new entries (at most batch_size, at least every
+    0.2 seconds) so a view can fill in before the listing completes. strict fails
+    on any non-zero exit - callers that treat a missing path as deleted need a
+    complete listing, not a partial one.
+    Returns (success, index or error).
+    """
+    pending = []
+    last_emit = [time.monotonic()]
+
+    def flush():
+        if pending and on_entries:
+            on_entries(list(pending))
+        pending.clear()
+        last_emit[0] = time.monotonic()
+
+    def on_record(record):
+        entry = parse_listing_record(record)
+        if entry is None:
+            return
+        index.add(entry)
+        pending.append(entry)
+        if len(pending) >= batch_size or time.monotonic() - last_emit[0] >= 0.2:
+            flush()
+
+    try:
+        returncode, stderr = stream_process(cmd, token, on_record, delimiter=b"\0")
+    except FileNotFoundError as e:
+        return False, f"{e.filename}: command not found"
+    except Exception as e:
+        return False, str(e)
+    flush()
+
+    if token and token.cancelled:
+        return False, "Cancelled"
+    # find exits 1 on unreadable subdirectories - keep what was listed
+    if returncode != 0 and (strict or not len(index)):
+        return False, stderr.strip() or f"Exit code {returncode}"
+    index.listed_at = time.time()
+    return True, index
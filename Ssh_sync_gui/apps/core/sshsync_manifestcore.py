@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Local Manifest Core - version 3
+this belongs in apps/core/sshsync_manifestcore.py
+
+Persistent SQLite manifest of a local tree (path, size, mtime, inode, optional hash)
+per sync profile - answers "what changed since the last successful sync" so a
+push can hand rsync only those paths
+"""
+
+import hashlib
+import os
+import sqlite3
+import stat
+import time
+from pathlib import Path
+
+from core.sshsync_rsynccore import build_paths_cmd, build_rsync_cmd, encode_file_list, run_rsync
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    hash TEXT,
+    synced INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS files_unsynced ON files(synced) WHERE synced = 0;
+CREATE TABLE IF NOT EXISTS deleted (path TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+HASH_CHUNK = 1024 * 1024
+
+
+def get_manifest_dir(): #vers 1
+    """Per-user manifest directory (XDG config home)"""
+    base = os.environ.get('XDG_CONFIG_HOME') or str(Path.home() / ".config")
+    path = Path(base) / "sshsync" / "manifests"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def profile_key(remote_user, remote_host, remote_port, local_path, remote_path): #vers 1
+    """Stable id for one local tree synced to one remote destination"""
+    ident = f"{remote_user}@{remote_host}:{remote_port}|{os.path.abspath(local_path)}|{remote_path}"
+    return hashlib.sha1(ident.encode('utf-8', errors='surrogateescape')).hexdigest()[:16]
+
+
+def get_manifest_path(key): #vers 1
+    return get_manifest_dir() / f"{key}.db"
+
+
+def hash_file(path): #vers 1
+    """blake2b digest of a file, or None if unreadable"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def walk_stat_tree(root, token=None): #vers 1
+    """Yield (relative path, size, mtime_ns, inode) for every non-directory under root"""
+    stack = [""]
+    while stack:
+        if token and token.cancelled:
+            return
+        relative = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, relative) if relative else root) as entries:
+                for entry in entries:
+                    path = f"{relative}/{entry.name}" if relative else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(path)
+                            continue
+                        info = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    yield path, info.st_size, info.st_mtime_ns, info.st_ino
+        except OSError:
+            continue
+
+
+class LocalManifest:
+    """SQLite manifest of one local tree - rows are marked synced after a successful push"""
+
+    def __init__(self, db_path, root, with_hash=False): #vers 1
+        self.db_path = str(db_path)
+        self.root = str(root)
+        self.with_hash = with_hash
+        self.db = sqlite3.connect(self.db_path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self): #vers 1
+        self.db.close()
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, *exc): #vers 1
+        self.close()
+
+    def get_meta(self, key, default=None): #vers 1
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value): #vers 1
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(value)))
+
+    @property
+    def last_sync(self): #vers 1
+        """Epoch seconds of the last successful sync, 0 if never"""
+        return float(self.get_meta('last_sync', 0))
+
+    def _upsert(self, rows, stored): #vers 1
+        """Write (path, size, mtime_ns, inode) rows that differ from stored, returns count"""
+        updates = []
+        for path, size, mtime_ns, inode in rows:
+            old = stored.get(path)
+            if old and old[:3] == (size, mtime_ns, inode):
+                continue
+            digest = None
+            synced = 0
+            if self.with_hash:
+                digest = hash_file(os.path.join(self.root, path))
+                # Touched but identical content keeps its synced state
+                if old and old[0] == size and digest and old[3] == digest:
+                    synced = old[4]
+            updates.append((path, size, mtime_ns, inode, digest, synced))
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)", updates)
+            self.db.executemany("DELETE FROM deleted WHERE path = ?",
+                [(update[0],) for update in updates])
+        return len(updates)
+
+    def _forget(self, paths, stored): #vers 1
+        """Drop vanished paths, remembering the synced ones as pending deletions"""
+        with self.db:
+            self.db.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in paths])
+            self.db.executemany("INSERT OR IGNORE INTO deleted VALUES (?)",
+                [(path,) for path in paths if stored[path][4]])
+
+    def _load(self, paths=None): #vers 1
+        """path -> (size, mtime_ns, inode, hash, synced) for all rows or the given paths"""
+        if paths is None:
+            cursor = self.db.execute("SELECT path, size, mtime_ns, inode, hash, synced FROM files")
+            return {row[0]: row[1:] for row in cursor}
+        stored = {}
+        for path in paths:
+            row = self.db.execute("SELECT size, mtime_ns, inode, hash, synced FROM files "
+                "WHERE path = ?", (path,)).fetchone()
+            if row:
+                stored[path] = row
+        return stored
+
+    def scan(self, token=None): #vers 1
+        """Re-stat the whole tree and record differences, returns (updated, removed)"""
+        stored = self._load()
+        seen = set()
+        rows = []
+        updated = 0
+        for row in walk_stat_tree(self.root, token):
+            seen.add(row[0])
+            rows.append(row)
+            if len(rows) >= 5000:
+                updated += self._upsert(rows, stored)
+                rows = []
+        if token and token.cancelled:
+            return updated, 0
+        updated += self._upsert(rows, stored)
+        removed = [path for path in stored if path not in seen]
+        self._forget(removed, stored)
+        return updated, len(removed)
+
+    def _load_below(self, directory): #vers 1
+        """Rows under directory/ - a range scan on the primary key"""
+        cursor = self.db.execute("SELECT path, size, mtime_ns, inode, hash, synced FROM files "
+            "WHERE path > ? AND path < ?", (directory + '/', directory + '0'))
+        return {row[0]: row[1:] for row in cursor}
+
+    def update_paths(self, paths): #vers 2
+        """Re-stat only the given relative paths (e.g. reported by a file watcher)
+
+        Directory paths are re-walked, so a created, moved or deleted directory
+        updates everything below it.
+        """
+        stored = self._load(paths)
+        rows, removed = [], []
+        for path in paths:
+            below = self._load_below(path)
+            stored.update(below)
+            try:
+                info = os.lstat(os.path.join(self.root, path))
+            except OSError:
+                removed.extend(below)
+                if path in stored:
+                    removed.append(path)
+                continue
+            if stat.S_ISDIR(info.st_mode):
+                seen = set()
+                for row in walk_stat_tree(os.path.join(self.root, path)):
+                    row = (f"{path}/{row[0]}",) + row[1:]
+                    seen.add(row[0])
+                    rows.append(row)
+                removed.extend(key for key in below if key not in seen)
+                if path in stored:
+                    removed.append(path)  # was a file, now a directory
+                continue
+            removed.extend(below)  # was a directory, now a file
+            rows.append((path, info.st_size, info.st_mtime_ns, info.st_ino))
+        updated = self._upsert(rows, stored)
+        self._forget(removed, stored)
+        return updated, len(removed)
+
+    def changed_paths(self): #vers 1
+        """Paths added or modified since the last successful sync"""
+        return [row[0] for row in self.db.execute("SELECT path FROM files WHERE synced = 0")]
+
+    def deleted_paths(self): #vers 1
+        """Paths synced before and gone locally since"""
+        return [row[0] for row in self.db.execute("SELECT path FROM deleted")]
+
+    def commit_sync(self, paths=None, deleted=None): #vers 1
+        """Mark paths (default: everything) as synced and clear the given deletions"""
+        with self.db:
+            if paths is None:
+                self.db.execute("UPDATE files SET synced = 1 WHERE synced = 0")
+                self.db.execute("DELETE FROM deleted")
+            else:
+                self.db.executemany("UPDATE files SET synced = 1 WHERE path = ?",
+                    [(path,) for path in paths])
+                self.db.executemany("DELETE FROM deleted WHERE path = ?",
+                    [(path,) for path in deleted or []])
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('last_sync', ?)",
+                (str(time.time()),))
+
+
+def run_manifest_scan_job(token, progress, manifest_path, source_dir): #vers 1
+    """Job body - bring the manifest up to date with one full scan, without pushing
+
+    Run when a file watcher starts: from then on the watcher reports every change,
+    so pushes re-stat only reported paths. Returns (success, (updated, removed)).
+    """
+    if not os.path.isdir(source_dir):
+        return False, f"Local path does not exist: {source_dir}"
+    progress({'file': "Scanning local manifest...", 'percent': 0})
+    try:
+        manifest = LocalManifest(manifest_path, source_dir)
+    except sqlite3.Error as e:
+        return False, f"Manifest error: {e}"
+    with manifest:
+        result = manifest.scan(token)
+    if token.cancelled:
+        return False, "Cancelled"
+    return True, result
+
+
+def run_incremental_push_job(token, progress, manifest_path, source_dir, dest_dir,
+    ssh_option, delete, paths=None): #vers 3
+    """Job body - push only what the manifest records as changed since the last sync
+
+    The first sync of a profile (no recorded sync) runs a full rsync. Deleted paths
+    are sent with --delete-missing-args when delete is set. Assumes the destination
+    is only changed through this profile - Mirror still runs a full comparison.
+    paths=None re-stats the whole tree; a list (from a file watcher - empty when it
+    has nothing new) re-stats only those paths and trusts the manifest for the rest.
+    """
+    # An unmounted or missing tree would otherwise read as "everything deleted"
+    if not os.path.isdir(source_dir):
+        return False, f"Local path does not exist: {source_dir}"
+    progress({'file': "Scanning local manifest...", 'percent': 0})
+    try:
+        manifest = LocalManifest(manifest_path, source_dir)
+    except sqlite3.Error as e:
+        return False, f"Manifest error: {e}"
+    with manifest:
+        started = time.monotonic()
+        if paths is not None and manifest.last_sync:
+            manifest.update_paths(paths)
+        else:
+            manifest.scan(token)
+        if token.cancelled:
+            return False, "Cancelled"
+
+        if not manifest.last_sync:
+            cmd = build_rsync_cmd(ssh_option, f"{source_dir}/", f"{dest_dir}/", delete=delete)
+            success, result = run_rsync(cmd, token, progress)
+            if success:
+                manifest.commit_sync()
+            return success, result
+
+        changed = manifest.changed_paths()
+        deleted = manifest.deleted_paths() if delete else []
+        summary = {'bytes': 0, 'changed': [], 'deleted': [],
+            'scan_seconds': time.monotonic() - started}
+        if not changed and not deleted:
+            manifest.commit_sync([], [])
+            return True, summary
+
+        # A file vanishing between scan and transfer is not an error
+        cmd = build_paths_cmd(ssh_option, source_dir, dest_dir, delete=bool(deleted))
+        success, result = run_rsync(cmd, token, progress,
+            input_data=encode_file_list(changed + deleted))
+        if not success:
+            return False, result
+        manifest.commit_sync(changed, deleted)
+        result['scan_seconds'] = summary['scan_seconds']
+        return True, result
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Sync Plan Core - version 3
+this belongs in apps/core/sshsync_plancore.py
+
+Precomputed sync plans - a dry-run itemizes what a transfer would send, update and
+delete; the confirmed plan is executed as-is from --files-from, so the real run
+does not walk and compare both trees a second time
+"""
+
+import threading
+import time
+
+from core.sshsync_rsynccore import build_rsync_cmd, encode_file_list, plan_transfer, run_rsync
+
+
+PLAN_TTL = 120          # seconds a cached plan may be reused without re-planning
+DETAIL_LIMIT = 500      # plan lines shown in the confirmation details
+
+
+def summarize_plan(plan): #vers 1
+    """Counts for a plan - new / updated files, new directories, deletions and bytes to send"""
+    summary = {'new': 0, 'updated': 0, 'dirs': 0, 'deleted': len(plan['deleted']),
+        'bytes': plan['bytes']}
+    for flags, _, _ in plan['items']:
+        if flags[1] == 'f' and flags[0] in '<>':
+            if flags[2:].strip('+'):
+                summary['updated'] += 1
+            else:
+                summary['new'] += 1
+        elif flags[1] == 'd' and flags[0] == 'c':
+            summary['dirs'] += 1
+    return summary
+
+
+def format_size(size): #vers 1
+    """Human readable byte count"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def display_path(path): #vers 1
+    """Plan path safe to show - undecodable bytes (kept as surrogate escapes) become U+FFFD"""
+    return path.encode('utf-8', errors='surrogateescape').decode('utf-8', errors='replace')
+
+
+def describe_plan(plan): #vers 2
+    """(summary text, detail text) for showing a plan before it runs"""
+    summary = summarize_plan(plan)
+    text = (f"{summary['new']:,} new file(s), {summary['updated']:,} updated, "
+        f"{summary['dirs']:,} new folder(s) - {format_size(summary['bytes'])} to send\n"
+        f"{summary['deleted']:,} item(s) will be DELETED")
+    lines = [f"- {display_path(path)}" for path in plan['deleted']]
+    for flags, size, path in plan['items']:
+        if flags[0] in '<>c':
+            mark = '+' if flags[0] == 'c' or not flags[2:].strip('+') else '~'
+            lines.append(f"{mark} {display_path(path)}" + (f" ({format_size(size)})" if flags[1] == 'f' else ""))
+    if len(lines) > DETAIL_LIMIT:
+        lines = lines[:DETAIL_LIMIT] + [f"... and {len(lines) - DETAIL_LIMIT:,} more"]
+    return text, "\n".join(lines)
+
+
+def plan_file_list(plan): #vers 1
+    """Every path the plan touches - items to send or update, then deletions"""
+    return [path for _, _, path in plan['items']] + plan['deleted']
+
+
+def plan_resume_paths(plan): #vers 1
+    """Non-directory paths the plan sends - what an interrupted run may resend without
+    confirmation; deletions and directory entries (which would recurse) are left out"""
+    return [path for flags, _, path in plan['items'] if flags[0] in '<>c' and flags[1] != 'd']
+
+
+def build_planned_cmd(ssh_option, source, dest, delete=True): #vers 2
+    """rsync over exactly the listed paths - no recursion
+
+    With delete, listed paths missing from the source are deleted (the plan's
+    deletions); without, a path that vanished since planning is skipped.
+    """
+    if delete:
+        missing = ["--delete-missing-args", "--force"]
+    else:
+        missing = ["--ignore-missing-args"]
+    return build_rsync_cmd(ssh_option, source, dest,
+        extra_args=["--files-from=-", "--from0"] + missing)
+
+
+def run_plan_job(token, progress, ssh_option, source, dest, delete): #vers 1
+    """Job body - dry-run the transfer and return its plan"""
+    progress({'file': "Planning transfer...", 'percent': 0})
+    return plan_transfer(ssh_option, source, dest, delete, token)
+
+
+def run_planned_job(token, progress, ssh_option, source, dest, plan, delete=True): #vers 2
+    """Job body - execute a plan; delete=False for plans that must never delete"""
+    paths = plan_file_list(plan)
+    if not paths:
+        return True, {'bytes': 0, 'changed': [], 'deleted': []}
+    return run_rsync(build_planned_cmd(ssh_option, source, dest, delete), token, progress,
+        input_data=encode_file_list(paths))
+
+
+class PlanCache:
+    """Recent plans keyed by (source, dest, delete) - cleared whenever either side changes"""
+
+    def __init__(self, ttl=PLAN_TTL): #vers 1
+        self.ttl = ttl
+        self.plans = {}
+        self.lock = threading.Lock()
+
+    def get(self, source, dest, delete): #vers 1
+        with self.lock:
+            cached = self.plans.get((source, dest, delete))
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        return None
+
+    def put(self, source, dest, delete, plan): #vers 1
+        with self.lock:
+            self.plans[(source, dest, delete)] = (time.monotonic(), plan)
+
+    def take(self, source, dest, delete): #vers 1
+        """Remove and return a cached plan - a plan is executed at most once"""
+        with self.lock:
+            cached = self.plans.pop((source, dest, delete), None)
+        return cached[1] if cached else None
+
+    def clear(self): #vers 1
+        with self.lock:
+            self.plans.clear()
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Sync Profiles Core - version 3
+this belongs in apps/core/sshsync_profilecore.py
+
+Named sync profiles - each carries its own host, folder pairs, bandwidth cap, direction,
+schedule (interval or cron expression) and priority; profiles are persisted as JSON and run
+by a scheduler that starts due profiles in priority order under a global cap
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.sshsync_bwcore import BandwidthSchedule, get_bandwidth_budget, parse_schedule
+from core.sshsync_rsynccore import run_transfer_job
+
+
+STORE_VERSION = 1
+DIRECTIONS = ('push', 'pull', 'both')
+
+# Settings a profile carries - the names match the SSHSyncGUI attributes they fill
+PROFILE_SETTINGS = {
+    'remote_host': "",
+    'remote_user': "",
+    'remote_port': 22,
+    'use_password': False,
+    'ssh_key_path': str(Path.home() / ".ssh" / "id_ed25519"),
+    'local_export_path': str(Path.home() / "Desktop" / "export"),
+    'local_import_path': str(Path.home() / "Desktop" / "import"),
+    'remote_export_path': "~/Desktop/export",
+    'remote_import_path': "~/Desktop/import",
+    'delete_extra_files': False,
+    'profile_bandwidth_limit': 0,      # KB/s for this profile's transfers, 0 = global cap only
+    'profile_bandwidth_schedule': "",  # time-of-day rules as for the global schedule
+}
+
+# Scheduling fields of a profile
+PROFILE_SCHEDULING = {
+    'direction': 'both',  # push = local export -> remote import, pull = remote export -> local import
+    'schedule': "",       # "" = manual only, "15m" / "3600" = interval, 5 fields = cron
+    'priority': 0,        # higher runs first when more profiles are due than slots
+    'enabled': True,
+    'last_run': None,     # epoch seconds of the last scheduled run
+    'last_result': "",
+}
+
+INTERVAL_RE = re.compile(r"^(\d+)\s*([smhd]?)$", re.IGNORECASE)
+INTERVAL_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+CRON_ALIASES = {
+    '@hourly': "0 * * * *",
+    '@daily': "0 0 * * *",
+    '@weekly': "0 0 * * 0",
+    '@monthly': "0 0 1 * *",
+}
+CRON_NAMES = {
+    3: ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'],
+    4: ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'],
+}
+# (low, high) per field - minute, hour, day of month, month, day of week (7 = Sunday too)
+CRON_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+CRON_SEARCH_DAYS = 366 * 5  # a cron expression that never fires (Feb 30) stops here
+
+
+def get_profiles_path(): #vers 1
+    """Per-user profile store (XDG config home)"""
+    base = os.environ.get('XDG_CONFIG_HOME') or str(Path.home() / ".config")
+    path = Path(base) / "sshsync"
+    path.mkdir(parents=True, exist_ok=True)
+    return path / "profiles.json"
+
+
+def default_profile(): #vers 1
+    profile = dict(PROFILE_SETTINGS)
+    profile.update(PROFILE_SCHEDULING)
+    return profile
+
+
+class IntervalSchedule:
+    """Runs every N seconds, counted from the end of the previous run"""
+
+    def __init__(self, seconds): #vers 1
+        self.seconds = seconds
+
+    def next_run(self, last_run, now): #vers 1
+        return last_run + self.seconds if last_run else now
+
+    def __str__(self): #vers 1
+        return f"every {self.seconds}s"
+
+
+class CronExpression:
+    """Standard 5-field cron expression - minute hour day-of-month month day-of-week
+
+    Fields take *, N, N-M, lists and /step; months and weekdays also take names.
+    As in cron, when both day fields are restricted a day matching either one fires.
+    """
+
+    def __init__(self, text): #vers 1
+        self.text = text.strip()
+        fields = CRON_ALIASES.get(self.text.lower(), self.text).split()
+        if len(fields) != 5:
+            raise ValueError("expected 5 fields: minute hour day month weekday")
+        self.sets = [self._parse_field(field, index) for index, field in enumerate(fields)]
+        if 7 in self.sets[4]:
+            self.sets[4].add(0)
+        self.dom_any, self.dow_any = fields[2] == '*', fields[4] == '*'
+
+    @staticmethod
+    def _value(text, index): #vers 1
+        names = CRON_NAMES.get(index)
+        if names and text.lower() in names:
+            return names.index(text.lower()) + (1 if index == 3 else 0)
+        if not text.isdigit():
+            raise ValueError(f"bad value '{text}'")
+        return int(text)
+
+    def _parse_field(self, field, index): #vers 1
+        low, high = CRON_RANGES[index]
+        values = set()
+        for part in field.split(','):
+            body, _, step = part.partition('/')
+            step = int(step) if step.isdigit() else (1 if not step else 0)
+            if step < 1:
+                raise ValueError(f"bad step in '{part}'")
+            if body == '*':
+                start, end = low, high
+            elif '-' in body:
+                start, end = (self._value(value, index) for value in body.split('-', 1))
+            else:
+                start = self._value(body, index)
+                end = high if step > 1 or '/' in part else start
+            if not (low <= start <= end <= high):
+                raise ValueError(f"'{part}' out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment): #vers 1
+        dom = moment.day in self.sets[2]
+        dow = (moment.weekday() + 1) % 7 in self.sets[4]
+        if self.dom_any or self.dow_any:
+            return dom and dow
+        return dom or dow
+
+    def next_after(self, when): #vers 1
+        """First matching minute strictly after epoch seconds when (local time), or None"""
+        moment = datetime.fromtimestamp(when).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=CRON_SEARCH_DAYS)
+        minutes, hours, _, months, _ = self.sets
+        while moment < limit:
+            if moment.month not in months:
+                year, month = divmod(moment.month, 12)
+                moment = moment.replace(year=moment.year + year, month=month + 1, day=1,
+                    hour=0, minute=0)
+            elif not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+            elif moment.hour not in hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        return None
+
+    def next_run(self, last_run, now): #vers 1
+        """A run missed while nothing was running happens once, straight away"""
+        return self.next_after(last_run if last_run else now)
+
+    def __str__(self): #vers 1
+        return f"cron {self.text}"
+
+
+def parse_profile_schedule(text): #vers 1
+    """Returns (success, IntervalSchedule / CronExpression / None for manual, or error)"""
+    text = (text or "").strip()
+    if not text:
+        return True, None
+    match = INTERVAL_RE.match(text)
+    if match:
+        seconds = int(match.group(1)) * INTERVAL_UNITS[match.group(2).lower()]
+        if seconds < 10:
+            return False, "Interval must be at least 10 seconds"
+        return True, IntervalSchedule(seconds)
+    try:
+        return True, CronExpression(text)
+    except ValueError as e:
+        return False, f"Invalid schedule '{text}': {e}"
+
+
+class ProfileStore:
+    """JSON store of named profiles plus the app settings that are not per profile
+
+    Settings hold the active profile name, the scheduler switch and cap and the
+    GUI's global options. Writes are atomic (temporary file fsynced and renamed).
+    Every call re-reads the file first when another process (the CLI, or a second
+    window) replaced it, so a write here never reverts theirs.
+    """
+
+    def __init__(self, path): #vers 2
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.stamp = self._stamp()
+        self.data = self._load()
+
+    def _stamp(self): #vers 1
+        """Identity of the file on disk - changes whenever it is replaced"""
+        try:
+            info = os.stat(self.path)
+        except OSError:
+            return None
+        return info.st_ino, info.st_mtime_ns, info.st_size
+
+    def _refresh(self): #vers 1
+        """Re-read the file if it changed since it was last read or written (lock held)"""
+        stamp = self._stamp()
+        if stamp != self.stamp:
+            self.stamp = stamp
+            self.data = self._load()
+
+    def _load(self): #vers 1
+        empty = {'version': STORE_VERSION, 'settings': {}, 'profiles': {}}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if not isinstance(data, dict) or data.get('version') != STORE_VERSION:
+            return empty
+        data.setdefault('settings', {})
+        data.setdefault('profiles', {})
+        return data
+
+    def _write(self): #vers 2
+        """Atomically replace the store file (lock held) - returns (success, error)"""
+        temp = self.path.with_suffix(".tmp")
+        try:
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, self.path)
+        except OSError as e:
+            return False, str(e)
+        self.stamp = self._stamp()
+        return True, None
+
+    def reload(self): #vers 2
+        """Re-read the file unconditionally"""
+        with self.lock:
+            self.stamp = self._stamp()
+            self.data = self._load()
+
+    def names(self): #vers 2
+        with self.lock:
+            self._refresh()
+            return sorted(self.data['profiles'], key=str.lower)
+
+    def get(self, name): #vers 2
+        """Profile with defaults filled in, or None"""
+        with self.lock:
+            self._refresh()
+            stored = self.data['profiles'].get(name)
+        if stored is None:
+            return None
+        profile = default_profile()
+        profile.update(stored)
+        profile['name'] = name
+        return profile
+
+    def profiles(self): #vers 1
+        return [self.get(name) for name in self.names()]
+
+    def put(self, name, profile): #vers 2
+        with self.lock:
+            self._refresh()
+            stored = {key: value for key, value in profile.items() if key != 'name'}
+            self.data['profiles'][name] = stored
+            return self._write()
+
+    def remove(self, name): #vers 2
+        with self.lock:
+            self._refresh()
+            if self.data['profiles'].pop(name, None) is None:
+                return True, None
+            if self.data['settings'].get('active') == name:
+                del self.data['settings']['active']
+            return self._write()
+
+    def record_run(self, name, when, result): #vers 2
+        with self.lock:
+            self._refresh()
+            stored = self.data['profiles'].get(name)
+            if stored is None:
+                return
+            stored['last_run'] = when
+            stored['last_result'] = result
+            self._write()
+
+    def settings(self): #vers 2
+        with self.lock:
+            self._refresh()
+            return dict(self.data['settings'])
+
+    def update_settings(self, **values): #vers 2
+        with self.lock:
+            self._refresh()
+            self.data['settings'].update(values)
+            return self._write()
+
+
+class ProfileScheduler:
+    """Decides which profiles run when - no threads of its own
+
+    The owner calls take() on a timer, starts the returned profiles and calls
+    finish() as each completes. A profile never overlaps itself; when more are
+    due than the cap allows, higher priority goes first, then the longest overdue.
+    """
+
+    def __init__(self, store, max_concurrent=2): #vers 1
+        self.store = store
+        self.max_concurrent = max_concurrent
+        self.next_runs = {}  # name -> (schedule text it was computed from, epoch or None)
+        self.running = set()
+        self.lock = threading.Lock()
+
+    def _next_run(self, profile, now): #vers 1
+        """Next run time of a profile, cached until its schedule text changes"""
+        cached = self.next_runs.get(profile['name'])
+        if cached and cached[0] == profile['schedule']:
+            return cached[1]
+        success, schedule = parse_profile_schedule(profile['schedule'])
+        when = schedule.next_run(profile['last_run'], now) if success and schedule else None
+        self.next_runs[profile['name']] = (profile['schedule'], when)
+        return when
+
+    def upcoming(self, now=None): #vers 1
+        """[(profile, next run epoch)] of every scheduled, enabled profile, soonest first"""
+        now = now or time.time()
+        with self.lock:
+            pairs = [(profile, self._next_run(profile, now)) for profile in self.store.profiles()
+                if profile['enabled']]
+        return sorted(((profile, when) for profile, when in pairs if when is not None),
+            key=lambda pair: pair[1])
+
+    def take(self, now=None): #vers 1
+        """Due profiles to start now, marked running - at most the free slots"""
+        now = now or time.time()
+        with self.lock:
+            free = self.max_concurrent - len(self.running)
+            if free <= 0:
+                return []
+            due = []
+            for profile in self.store.profiles():
+                if not profile['enabled'] or profile['name'] in self.running:
+                    continue
+                when = self._next_run(profile, now)
+                if when is not None and when <= now:
+                    due.append((-profile['priority'], when, profile['name'], profile))
+            due.sort(key=lambda item: item[:3])
+            chosen = [profile for *_, profile in due[:free]]
+            self.running.update(profile['name'] for profile in chosen)
+            return chosen
+
+    def finish(self, name, result, now=None): #vers 1
+        """A profile run ended - record it and schedule the next run from now"""
+        now = now or time.time()
+        self.store.record_run(name, now, result)
+        with self.lock:
+            self.running.discard(name)
+            self.next_runs.pop(name, None)
+
+    def forget(self, name): #vers 1
+        """Drop cached state of a profile that was edited or removed"""
+        with self.lock:
+            self.next_runs.pop(name, None)
+
+
+def profile_transfers(profile): #vers 1
+    """(label, source, dest) rsync endpoints of a profile's direction, push before pull"""
+    remote = f"{profile['remote_user']}@{profile['remote_host']}:"
+    transfers = []
+    if profile['direction'] in ('push', 'both'):
+        transfers.append(("push", f"{profile['local_export_path']}/",
+            f"{remote}{profile['remote_import_path']}/"))
+    if profile['direction'] in ('pull', 'both'):
+        transfers.append(("pull", f"{remote}{profile['remote_export_path']}/",
+            f"{profile['local_import_path']}/"))
+    return transfers
+
+
+def profile_bandwidth(profile): #vers 1
+    """BandwidthSchedule capping a profile's own transfers - a bad rule set keeps only the limit"""
+    success, rules = parse_schedule(profile['profile_bandwidth_schedule'])
+    return BandwidthSchedule(rules if success else [], profile['profile_bandwidth_limit'])
+
+
+def run_profile_job(token, progress, profile, ssh_option): #vers 2
+    """Job body - run a profile's push and/or pull under the profile's bandwidth cap
+
+    Returns (success, summary) with the totals of both halves and their
+    transports; a failed half fails the job without running the other.
+    """
+    summary = {'bytes': 0, 'changed': [], 'deleted': []}
+    with get_bandwidth_budget().profile(token, profile_bandwidth(profile)):
+        for label, source, dest in profile_transfers(profile):
+            if label == "push" and not os.path.isdir(profile['local_export_path']):
+                return False, f"Local directory does not exist: {profile['local_export_path']}"
+            success, result = run_transfer_job(token, progress, ssh_option, source, dest,
+                profile['delete_extra_files'])
+            if not success:
+                return False, f"{label} failed: {result}"
+            summary['bytes'] += result['bytes']
+            summary['changed'].extend(result['changed'])
+            summary['deleted'].extend(result['deleted'])
+    return True, summary
+
+
+def describe_result(success, result): #vers 1
+    """One-line outcome stored as a profile's last_result"""
+    if not success:
+        return f"failed: {result}"
+    return (f"ok: {len(result['changed'])} changed, {len(result['deleted'])} deleted, "
+        f"{result['bytes']:,} bytes")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Remote Watcher Core - version 2
+this belongs in apps/core/sshsync_remotewatchcore.py
+
+Remote change feed over one long-lived ssh session - `inotifywait -m` when the remote
+has it, `find -cnewer` polling otherwise - delivered as debounced batches of paths
+"""
+
+import shlex
+import threading
+import time
+
+from core.sshsync_runcore import CancelToken, stream_process
+from core.sshsync_watchcore import DEBOUNCE
+
+
+# Remote side - $1 directory, $2 poll interval. Prints "MODE <name>" first, then one
+# "<events>|<path>" line per change (paths relative, "./" prefixed)
+REMOTE_WATCH_SCRIPT = r"""
+cd -- "$1" || exit 3
+if command -v inotifywait >/dev/null 2>&1; then
+  echo "MODE inotify"
+  exec inotifywait -m -r -q --format '%e|%w%f' \
+    -e close_write -e attrib -e create -e delete -e moved_from -e moved_to .
+fi
+echo "MODE poll"
+stamp=$(mktemp) && next=$(mktemp) || exit 4
+trap 'rm -f "$stamp" "$next"' EXIT
+touch "$stamp"
+while sleep "$2"; do
+  touch "$next"
+  # ctime catches renames and moved-in files; a deletion changes its directory,
+  # which may be the watched directory itself (reported as "./")
+  find . -cnewer "$stamp" -printf 'POLL|./%P\n'
+  mv -f "$next" "$stamp" && next=$(mktemp) || exit 4
+done
+"""
+
+RETRY_DELAYS = (5, 10, 30, 60)  # seconds between reconnect attempts
+POLL_INTERVAL = 10
+
+
+def build_remote_watch_cmd(ssh_prefix, target, quoted_path, poll_interval=POLL_INTERVAL): #vers 1
+    """ssh command running the watch script on target for an already quoted path"""
+    return ssh_prefix + [target,
+        f"bash -c {shlex.quote(REMOTE_WATCH_SCRIPT)} sshsync-watch {quoted_path} "
+        f"{int(poll_interval)}"]
+
+
+def parse_watch_line(line): #vers 2
+    """Parse one event line into a relative path ("." for the watched directory), or None"""
+    events, sep, path = line.partition('|')
+    if not sep or not events:
+        return None
+    if path in (".", "./"):
+        return "."
+    if path.startswith("./"):
+        path = path[2:]
+    return path.rstrip('/') or None
+
+
+class RemoteWatcher:
+    """Keeps the remote watch session running and reports changed paths in batches
+
+    on_changes(paths) gets a set of paths relative to the watched directory,
+    on_status(message) the mode in use and connection problems, on_stopped(watcher)
+    is called once if the watcher gives up (the directory is gone) - not after
+    stop(). All run on watcher threads. The session is re-opened with back-off if
+    ssh drops.
+    """
+
+    def __init__(self, cmd, on_changes, on_status=None, latency=2.0, on_stopped=None): #vers 2
+        self.cmd = cmd
+        self.on_changes = on_changes
+        self.on_status = on_status
+        self.on_stopped = on_stopped
+        self.latency = max(latency, DEBOUNCE)
+        self.mode = None
+        self.token = CancelToken()
+        self.lock = threading.Lock()
+        self.changed = set()
+        self.first_event = self.last_event = 0.0
+        self.threads = []
+
+    def start(self): #vers 1
+        """Start the session and batch threads"""
+        for target in (self._session_loop, self._batch_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self): #vers 1
+        """End the ssh session and stop both threads"""
+        self.token.cancel()
+        for thread in self.threads:
+            thread.join(2)
+        self.threads = []
+
+    def _status(self, message): #vers 1
+        if self.on_status:
+            try:
+                self.on_status(message)
+            except Exception:
+                pass
+
+    def _on_line(self, line): #vers 1
+        if line.startswith("MODE "):
+            self.mode = line[5:].strip()
+            self._status(f"Remote watch active ({self.mode})")
+            return
+        path = parse_watch_line(line)
+        if path is None:
+            return
+        now = time.monotonic()
+        with self.lock:
+            self.changed.add(path)
+            if not self.first_event:
+                self.first_event = now
+            self.last_event = now
+
+    def _session_loop(self): #vers 2
+        """Run the remote watch session, reconnecting after failures"""
+        attempt = 0
+        while not self.token.cancelled:
+            started = time.monotonic()
+            try:
+                returncode, stderr = stream_process(self.cmd, self.token, self._on_line)
+            except Exception as e:
+                returncode, stderr = -1, str(e)
+            if self.token.cancelled:
+                return
+            if returncode == 3:
+                self._status(f"[FAIL] Remote watch: directory not found ({stderr.strip()})")
+                self.token.cancel()  # ends the batch thread too
+                if self.on_stopped:
+                    try:
+                        self.on_stopped(self)
+                    except Exception:
+                        pass
+                return
+            # A session that ran for a while resets the back-off
+            if time.monotonic() - started > 60:
+                attempt = 0
+            delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+            attempt += 1
+            self._status(f"[WARN] Remote watch ended ({stderr.strip() or returncode}) - "
+                f"reconnecting in {delay}s")
+            if self.token.wait(delay):
+                return
+
+    def _batch_loop(self): #vers 1
+        """Release collected paths after DEBOUNCE seconds of quiet or at latency"""
+        while not self.token.wait(0.1):
+            now = time.monotonic()
+            with self.lock:
+                if not self.first_event or (now - self.last_event < DEBOUNCE
+                        and now - self.first_event < self.latency):
+                    continue
+                batch = self.changed
+                self.changed = set()
+                self.first_event = self.last_event = 0.0
+            try:
+                self.on_changes(batch)
+            except Exception:
+                pass
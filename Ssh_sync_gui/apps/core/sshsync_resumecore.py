@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Resume Journal Core - version 2
+this belongs in apps/core/sshsync_resumecore.py
+
+Crash-safe journal of in-flight transfers - each entry is written before its rsync
+starts and removed once it succeeds, so transfers cut off by a dropped link or an
+app restart are resumed from rsync's partial files. There is one entry per
+(connection, source, dest, paths); a later success of the same pair retires it and
+failures that are not interruptions (permissions, bad paths) are not kept.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from core.sshsync_rsynccore import (build_batch_cmd, encode_file_list, run_paths_job, run_rsync,
+    run_transfer_job)
+
+
+JOURNAL_VERSION = 1
+CHECKPOINT_INTERVAL = 5.0  # seconds between progress checkpoints written to disk
+MAX_ATTEMPTS = 3           # resumes tried before an entry is given up
+
+
+# rsync exit codes of a cut-off run - socket / protocol stream errors (10, 12),
+# signalled (20), timeouts (30, 35) and ssh failing (255). Anything else would
+# fail the same way again when resumed.
+INTERRUPTED_CODES = {10, 12, 20, 30, 35, 255}
+INTERRUPTED_MARKERS = ("connection unexpectedly closed", "broken pipe", "connection reset",
+    "connection timed out", "connection closed", "no route to host", "network is unreachable",
+    "connection refused")
+
+
+def is_interrupted(error): #vers 1
+    """True when a failed transfer's error means the link dropped or the run was cancelled"""
+    text = str(error)
+    if text == "Cancelled":
+        return True
+    lowered = text.lower()
+    if any(marker in lowered for marker in INTERRUPTED_MARKERS):
+        return True
+    codes = re.findall(r"\(code (\d+)\)|exit code (\d+)", text)
+    return any(int(code or bare) in INTERRUPTED_CODES for code, bare in codes)
+
+
+def entry_key(connection, spec): #vers 1
+    """Journal id of a transfer - the same connection, endpoints and paths share one entry"""
+    paths = sorted(spec['paths']) if spec.get('paths') is not None else None
+    data = json.dumps([connection, spec['source'], spec['dest'], paths])
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()[:12]
+
+
+def get_journal_path(): #vers 1
+    """Per-user transfer journal (XDG config home)"""
+    base = os.environ.get('XDG_CONFIG_HOME') or str(Path.home() / ".config")
+    path = Path(base) / "sshsync"
+    path.mkdir(parents=True, exist_ok=True)
+    return path / "journal.json"
+
+
+def connection_key(remote_user, remote_host, remote_port): #vers 1
+    """Entries are resumed only on the connection that started them"""
+    return f"{remote_user}@{remote_host}:{remote_port}"
+
+
+class TransferJournal:
+    """JSON journal of transfers that have started but not finished
+
+    An entry's spec holds only plain values - name, source, dest, delete and an
+    optional path list - so it can be rebuilt after a restart. Every write goes
+    to a temporary file that is fsynced and renamed over the journal.
+    """
+
+    def __init__(self, path): #vers 1
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        self.last_write = 0.0
+
+    def _load(self): #vers 2
+        """Saved entries re-keyed by entry_key() - duplicates of one transfer keep the newest"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != JOURNAL_VERSION:
+            return {}
+        entries = {}
+        for entry in sorted(data.get('entries', {}).values(), key=lambda entry: entry['started']):
+            entries[entry_key(entry['connection'], entry['spec'])] = entry
+        return entries
+
+    def _write(self): #vers 1
+        """Atomically replace the journal file (lock held)"""
+        temp = self.path.with_suffix(".tmp")
+        try:
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({'version': JOURNAL_VERSION, 'entries': self.entries}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, self.path)
+        except OSError:
+            pass
+        self.last_write = time.monotonic()
+
+    def begin(self, connection, spec): #vers 2
+        """Record a transfer about to start, returns its entry id
+
+        A new run of a transfer already in the journal replaces its entry.
+        """
+        entry_id = entry_key(connection, spec)
+        with self.lock:
+            self.entries[entry_id] = {
+                'connection': connection, 'spec': spec, 'started': time.time(),
+                'attempts': 0, 'file': '', 'bytes': 0,
+            }
+            self._write()
+        return entry_id
+
+    def checkpoint(self, entry_id, info): #vers 1
+        """Note the file in flight and bytes so far - written at most every CHECKPOINT_INTERVAL
+
+        Only transfer progress (dicts carrying 'bytes') counts, not status messages.
+        """
+        with self.lock:
+            entry = self.entries.get(entry_id)
+            if entry is None or 'bytes' not in info:
+                return
+            if info.get('file'):
+                entry['file'] = info['file']
+            entry['bytes'] = max(entry['bytes'], info.get('bytes', 0))
+            if time.monotonic() - self.last_write >= CHECKPOINT_INTERVAL:
+                self._write()
+
+    def retry(self, entry_id): #vers 1
+        """Count a resume attempt, returns the entry or None once MAX_ATTEMPTS is used up"""
+        with self.lock:
+            entry = self.entries.get(entry_id)
+            if entry is None:
+                return None
+            entry['attempts'] += 1
+            if entry['attempts'] > MAX_ATTEMPTS:
+                del self.entries[entry_id]
+                entry = None
+            self._write()
+            return entry
+
+    def finish(self, entry_id): #vers 2
+        """Drop a transfer that completed, and every entry of the same pair it covers
+
+        A full transfer covers all entries with the same connection, source and dest;
+        a path transfer covers those whose paths are a subset of its own.
+        """
+        with self.lock:
+            entry = self.entries.pop(entry_id, None)
+            if entry is None:
+                return
+            spec = entry['spec']
+            paths = set(spec['paths']) if spec.get('paths') is not None else None
+            for other_id, other in list(self.entries.items()):
+                other_spec = other['spec']
+                if (other['connection'] != entry['connection'] or other_spec['source'] != spec['source']
+                        or other_spec['dest'] != spec['dest']):
+                    continue
+                if paths is None or (other_spec.get('paths') is not None
+                        and set(other_spec['paths']) <= paths):
+                    del self.entries[other_id]
+            self._write()
+
+    def drop(self, entry_id): #vers 1
+        """Forget one transfer that failed in a way resuming would not fix"""
+        with self.lock:
+            if self.entries.pop(entry_id, None) is not None:
+                self._write()
+
+    def discard(self, connection): #vers 1
+        """Drop every entry of a connection"""
+        with self.lock:
+            stale = [entry_id for entry_id, entry in self.entries.items()
+                if entry['connection'] == connection]
+            for entry_id in stale:
+                del self.entries[entry_id]
+            if stale:
+                self._write()
+
+    def __contains__(self, entry_id): #vers 1
+        with self.lock:
+            return entry_id in self.entries
+
+    def pending(self, connection): #vers 1
+        """(entry id, entry) pairs waiting for connection, oldest first"""
+        with self.lock:
+            return sorted(((entry_id, dict(entry)) for entry_id, entry in self.entries.items()
+                if entry['connection'] == connection), key=lambda item: item[1]['started'])
+
+
+def transfer_spec(name, source, dest, delete, paths=None): #vers 1
+    """Journal spec for a transfer - source/dest are rsync endpoints with trailing slashes"""
+    return {'name': name, 'source': source, 'dest': dest, 'delete': bool(delete),
+        'paths': list(paths) if paths is not None else None}
+
+
+def run_resume_job(token, progress, ssh_option, spec, in_flight=""): #vers 1
+    """Job body - resume a journaled transfer
+
+    The file that was in flight is first completed with --append-verify (the
+    partial data is reused and the whole file checksummed), then the original
+    transfer runs again - rsync finds the other partial files in --partial-dir
+    and uses them as delta basis, so nothing already sent is sent twice.
+    """
+    source_dir, dest_dir = spec['source'].rstrip('/'), spec['dest'].rstrip('/')
+    if in_flight and not in_flight.endswith('/'):
+        progress({'file': f"Resuming {in_flight}", 'percent': 0})
+        success, result = run_rsync(build_batch_cmd(ssh_option, source_dir, dest_dir,
+            extra_args=["--append-verify", "--ignore-missing-args"]), token, progress,
+            input_data=encode_file_list([in_flight]))
+        if not success and token.cancelled:
+            return False, result
+    if spec['paths'] is not None:
+        return run_paths_job(token, progress, ssh_option, source_dir, dest_dir, spec['paths'],
+            spec['delete'])
+    return run_transfer_job(token, progress, ssh_option, spec['source'], spec['dest'],
+        spec['delete'])
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Rsync Core - version 13
+this belongs in apps/core/sshsync_rsynccore.py
+
+Rsync command construction and live output parsing (--info=progress2 / --itemize-changes)
+"""
+
+import re
+import threading
+import time
+
+from core.sshsync_bwcore import (RETHROTTLE_CHECK, RETHROTTLE_GRACE, apply_bwlimit,
+    get_bandwidth_budget)
+from core.sshsync_compresscore import get_compression_policy
+from core.sshsync_runcore import CancelToken, run_process, stream_process
+
+
+# "  1,234,567  45%   12.34MB/s    0:00:12 (xfr#3, to-chk=10/20)"
+PROGRESS_RE = re.compile(
+    r"^\s*([\d,]+)\s+(\d+)%\s+([\d.]+)([kMGT]?B|bytes)/s\s+(\d+:\d{2}:\d{2})"
+    r"(?:\s+\(xfr#(\d+), (?:to|ir)-chk=(\d+)/(\d+)\))?")
+
+# ">f+++++++++ path/to/file" or "*deleting   path/to/file"
+ITEMIZE_RE = re.compile(r"^([<>ch.*][fdLDS][.+?a-zA-Z]{7,9}|\*deleting)\s+(.+)$")
+
+# --out-format for dry-run plans: itemized flags, file length, name
+PLAN_FORMAT = "%i|%l|%n"
+# rsync's escape for unprintable bytes in names: backslash, '#', three octal digits
+ESCAPED_RE = re.compile(r"\\#([0-7]{3})")
+
+RATE_UNITS = {'bytes': 1, 'B': 1, 'kB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+# Relative to each destination directory - rsync excludes it from transfers and --delete
+PARTIAL_DIR = ".sshsync-partial"
+
+
+def build_rsync_cmd(ssh_option, source, dest, delete=False, extra_args=None,
+    compress_args=None): #vers 3
+    """Build an rsync command that reports live progress and itemized changes
+
+    Compression comes from the process-wide policy unless compress_args is given.
+    Interrupted files are kept in PARTIAL_DIR so the next run resumes them.
+    """
+    if compress_args is None:
+        compress_args = get_compression_policy().rsync_args(source, dest)
+    cmd = [
+        "rsync",
+        "-av",
+        *compress_args,
+        "--info=progress2",
+        "--itemize-changes",
+        "--outbuf=L",
+        f"--partial-dir={PARTIAL_DIR}",
+    ]
+    if delete:
+        cmd.append("--delete")
+    if extra_args:
+        cmd.extend(extra_args)
+    cmd.extend(["-e", ssh_option, source, dest])
+    return cmd
+
+
+def encode_file_list(paths): #vers 1
+    """NUL-separated file list for --files-from=- --from0"""
+    return b"".join(path.encode('utf-8', errors='surrogateescape') + b"\0" for path in paths)
+
+
+def build_batch_cmd(ssh_option, source_dir, dest_dir, extra_args=None): #vers 1
+    """One rsync for an explicit selection read from stdin - directories recurse"""
+    return build_rsync_cmd(ssh_option, f"{source_dir}/", f"{dest_dir}/",
+        extra_args=["--files-from=-", "--from0", "-r"] + (extra_args or []))
+
+
+def build_paths_cmd(ssh_option, source_dir, dest_dir, delete=False): #vers 4
+    """Batch rsync for explicit changed paths - missing ones are deleted (delete) or skipped
+
+    With delete, listed directories are also cleaned of extraneous files - a
+    directory moved in over an older copy ends up identical to the source.
+    """
+    if delete:
+        extra = ["--delete-missing-args", "--delete"]
+    else:
+        extra = ["--ignore-missing-args"]
+    return build_batch_cmd(ssh_option, source_dir, dest_dir, extra_args=extra)
+
+
+def build_plan_cmd(ssh_option, source, dest, delete=False, extra_args=None): #vers 3
+    """Dry-run rsync listing what a transfer would change, one PLAN_FORMAT line per item
+
+    -8 leaves non-ASCII names as raw bytes; rsync still escapes control characters
+    (and newlines) as \\#ooo, which parse_plan_line() decodes.
+    """
+    cmd = ["rsync", "-a", "-8", "--dry-run", f"--out-format={PLAN_FORMAT}",
+        f"--exclude={PARTIAL_DIR}/"]
+    if delete:
+        cmd.append("--delete")
+    if extra_args:
+        cmd.extend(extra_args)
+    cmd.extend(["-e", ssh_option, source, dest])
+    return cmd
+
+
+def unescape_rsync_name(name): #vers 1
+    """Undo rsync's \\#ooo output escaping - bytes above 0x7f become surrogate escapes
+    so encode_file_list() writes the name back byte for byte"""
+    def byte(match):
+        value = int(match.group(1), 8)
+        return chr(value) if value < 0x80 else chr(0xDC00 + value)
+    return ESCAPED_RE.sub(byte, name)
+
+
+def parse_plan_line(line): #vers 2
+    """Parse a dry-run line into (flags, size, path), or None - the path unescaped"""
+    if line.startswith("*deleting"):
+        path = line[len("*deleting"):].lstrip(" |")
+        if '|' in path:
+            path = path.split('|', 1)[1]
+        return ("*deleting", 0, unescape_rsync_name(path)) if path else None
+    parts = line.split('|', 2)
+    if len(parts) != 3 or not ITEMIZE_RE.match(f"{parts[0]} x"):
+        return None
+    try:
+        size = int(parts[1])
+    except ValueError:
+        size = 0
+    return parts[0], size, unescape_rsync_name(parts[2])
+
+
+def plan_transfer(ssh_option, source, dest, delete=False, token=None, extra_args=None): #vers 2
+    """Dry-run a transfer, returns (success, plan dict or error)
+
+    The plan holds 'items' [(flags, size, path)] for everything that would be sent
+    or created, 'deleted' paths, and 'files' / 'bytes' totals for regular files.
+    """
+    try:
+        returncode, stdout, stderr = run_process(
+            build_plan_cmd(ssh_option, source, dest, delete, extra_args), token,
+            errors='surrogateescape')
+    except FileNotFoundError as e:
+        return False, f"{e.filename}: command not found"
+    except Exception as e:
+        return False, str(e)
+    if token and token.cancelled:
+        return False, "Cancelled"
+    if returncode != 0:
+        return False, stderr.strip() or f"rsync exit code {returncode}"
+
+    plan = {'items': [], 'deleted': [], 'files': 0, 'bytes': 0}
+    for line in stdout.splitlines():
+        item = parse_plan_line(line)
+        if item is None:
+            continue
+        flags, size, path = item
+        if flags == "*deleting":
+            plan['deleted'].append(path)
+            continue
+        plan['items'].append(item)
+        if flags[1] == 'f' and flags[0] in '<>':
+            plan['files'] += 1
+            plan['bytes'] += size
+    return True, plan
+
+
+def parse_progress_line(line): #vers 1
+    """Parse a --info=progress2 line into a dict, or None"""
+    match = PROGRESS_RE.match(line)
+    if not match:
+        return None
+    rate = float(match.group(3)) * RATE_UNITS.get(match.group(4), 1)
+    info = {
+        'bytes': int(match.group(1).replace(',', '')),
+        'percent': int(match.group(2)),
+        'rate_bps': rate,
+        'eta': match.group(5),
+    }
+    if match.group(6):
+        info['files_done'] = int(match.group(6))
+        info['files_left'] = int(match.group(7))
+        info['files_total'] = int(match.group(8))
+    return info
+
+
+def parse_itemize_line(line): #vers 1
+    """Parse an --itemize-changes line into (flags, path), or None"""
+    match = ITEMIZE_RE.match(line)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+def format_rate(rate_bps): #vers 1
+    """Human readable transfer rate"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if rate_bps < 1024:
+            return f"{rate_bps:.1f} {unit}/s"
+        rate_bps /= 1024
+    return f"{rate_bps:.1f} TB/s"
+
+
+def _watch_share(budget, token, limit, attempt, done, restart): #vers 2
+    """Cancel attempt (setting restart) once the stream stays off its share past the grace period"""
+    off_since = None
+    while not done.wait(RETHROTTLE_CHECK):
+        if not budget.rethrottle(limit, token):
+            off_since = None
+            continue
+        now = time.monotonic()
+        if off_since is None:
+            off_since = now
+        elif now - off_since >= RETHROTTLE_GRACE:
+            restart.set()
+            attempt.cancel()
+            return
+
+
+def run_rsync(cmd, token=None, progress=None, interval=0.25, input_data=None): #vers 5
+    """Run rsync streaming its output, returns (success, summary dict or error)
+
+    progress receives dicts with bytes, percent, rate_bps, eta and the current file,
+    throttled to one update per interval seconds. The stream's share of the global
+    bandwidth budget (and of its profile's cap, found by token) is applied as --bwlimit; when the share moves (streams start or
+    finish, the schedule window changes) rsync is restarted at the new limit.
+    """
+    state = {
+        'bytes': 0, 'percent': 0, 'rate_bps': 0.0, 'eta': '',
+        'file': '', 'changed': [], 'deleted': []
+    }
+    last_emit = [0.0]
+
+    def on_line(line):
+        info = parse_progress_line(line)
+        if info:
+            state.update(info)
+        else:
+            item = parse_itemize_line(line)
+            if not item:
+                return
+            flags, path = item
+            state['file'] = path
+            if flags == '*deleting':
+                state['deleted'].append(path)
+            else:
+                state['changed'].append(path)
+        now = time.monotonic()
+        if progress and now - last_emit[0] >= interval:
+            last_emit[0] = now
+            progress({key: value for key, value in state.items()
+                if key not in ('changed', 'deleted')})
+
+    budget = get_bandwidth_budget()
+    try:
+        with budget.stream(token) as limit:
+            while True:
+                attempt = token.child() if token else CancelToken()
+                done, restart = threading.Event(), threading.Event()
+                watcher = threading.Thread(target=_watch_share,
+                    args=(budget, token, limit, attempt, done, restart), daemon=True)
+                watcher.start()
+                try:
+                    returncode, stderr = stream_process(apply_bwlimit(cmd, limit), attempt,
+                        on_line, input_data)
+                finally:
+                    done.set()
+                    watcher.join()
+                    if token:
+                        token.release(attempt)
+                if not restart.is_set() or (token and token.cancelled):
+                    break
+                limit = budget.share(token)
+                state['file'] = f"Bandwidth limit now {limit or 'unlimited'} KB/s - restarting"
+    except FileNotFoundError as e:
+        return False, f"{e.filename}: command not found"
+    except Exception as e:
+        return False, str(e)
+
+    if token and token.cancelled:
+        return False, "Cancelled"
+    if returncode != 0:
+        return False, stderr.strip() or f"rsync exit code {returncode}"
+    return True, state
+
+
+def run_rsync_job(token, progress, cmd, input_data=None): #vers 2
+    """Job body for a streamed rsync transfer"""
+    return run_rsync(cmd, token, progress, input_data=input_data)
+
+
+def run_paths_job(token, progress, ssh_option, source_dir, dest_dir, paths, delete=False): #vers 1
+    """Job body - push only the given relative paths (directories recurse)"""
+    return run_rsync(build_paths_cmd(ssh_option, source_dir, dest_dir, delete), token,
+        progress, input_data=encode_file_list(paths))
+
+
+def run_transfer_job(token, progress, ssh_option, source, dest, delete=False): #vers 1
+    """Job body - build the rsync on the worker (compression sampling can touch disk) and run it"""
+    return run_rsync(build_rsync_cmd(ssh_option, source, dest, delete), token, progress)
+
+
+def run_batch_job(token, progress, ssh_option, source_dir, dest_dir, paths): #vers 1
+    """Job body - one rsync for an explicit selection"""
+    return run_rsync(build_batch_cmd(ssh_option, source_dir, dest_dir), token, progress,
+        input_data=encode_file_list(paths))
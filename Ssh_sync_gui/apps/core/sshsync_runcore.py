@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Process Runner Core - version 5
+this belongs in apps/core/sshsync_runcore.py
+
+Cancellable subprocess execution shared by the GUI job executor and headless tools
+"""
+
+import os
+import re
+import subprocess
+import threading
+
+
+class CancelToken:
+    """Cancellation flag shared between a job and whoever started it"""
+
+    def __init__(self): #vers 2
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes = []
+        self._children = []
+
+    @property
+    def cancelled(self): #vers 1
+        return self._event.is_set()
+
+    def cancel(self): #vers 2
+        """Flag cancellation, cancel child tokens and terminate any attached process"""
+        self._event.set()
+        with self._lock:
+            processes = list(self._processes)
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+        for process in processes:
+            try:
+                process.terminate()
+            except Exception:
+                pass
+
+    def child(self): #vers 1
+        """Token cancelled along with this one that can also be cancelled on its own -
+        stops one attempt of a job without cancelling the job"""
+        child = CancelToken()
+        with self._lock:
+            self._children.append(child)
+        if self.cancelled:
+            child.cancel()
+        return child
+
+    def release(self, child): #vers 1
+        """Forget a finished child token"""
+        with self._lock:
+            if child in self._children:
+                self._children.remove(child)
+
+    def attach(self, process): #vers 1
+        """Register a running process, terminating it at once if already cancelled"""
+        with self._lock:
+            self._processes.append(process)
+        if self.cancelled:
+            process.terminate()
+
+    def detach(self, process): #vers 1
+        """Forget a finished process"""
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+    def wait(self, seconds): #vers 1
+        """Sleep up to seconds, returns True if cancelled meanwhile"""
+        return self._event.wait(seconds)
+
+
+def run_process(cmd, token=None, timeout=None, input_data=None, errors='replace'): #vers 2
+    """Run cmd to completion, returns (returncode, stdout, stderr)
+
+    Unlike subprocess.run the process is terminated as soon as token is cancelled.
+    timeout=None means no limit - long transfers are never killed mid-way.
+    errors is the stdout decoding mode - 'surrogateescape' keeps file names byte-exact.
+    """
+    process = subprocess.Popen(cmd,
+        stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if token:
+        token.attach(process)
+    try:
+        stdout, stderr = process.communicate(input=input_data, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        stdout, stderr = process.communicate()
+        stderr += b"\nTimed out"
+    finally:
+        if token:
+            token.detach(process)
+
+    return (process.returncode,
+        stdout.decode('utf-8', errors=errors),
+        stderr.decode('utf-8', errors='replace'))
+
+
+def stream_process(cmd, token=None, on_line=None, input_data=None, delimiter=None): #vers 2
+    """Run cmd and hand every stdout line to on_line as it arrives, returns (returncode, stderr)
+
+    Lines are split on both newline and carriage return so in-place progress
+    updates (rsync --info=progress2) arrive live rather than at exit.
+    With a delimiter (e.g. b"\\0") records are split on it alone and decoded with
+    surrogateescape, so file names round-trip unchanged.
+    """
+    errors = 'surrogateescape' if delimiter else 'replace'
+    process = subprocess.Popen(cmd,
+        stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if token:
+        token.attach(process)
+
+    # Drain stderr (and feed stdin) on helper threads so neither pipe can fill up and stall
+    stderr_chunks = []
+    stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True)
+    stderr_thread.start()
+    if input_data is not None:
+        def feed():
+            try:
+                process.stdin.write(input_data)
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+        threading.Thread(target=feed, daemon=True).start()
+
+    try:
+        pending = b""
+        fd = process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            if delimiter:
+                parts = (pending + chunk).split(delimiter)
+            else:
+                parts = re.split(rb"[\r\n]", pending + chunk)
+            pending = parts.pop()
+            if on_line:
+                for part in parts:
+                    if part:
+                        on_line(part.decode('utf-8', errors=errors))
+        if pending and on_line:
+            on_line(pending.decode('utf-8', errors=errors))
+        process.wait()
+    finally:
+        stderr_thread.join()
+        process.stdout.close()
+        process.stderr.close()
+        if token:
+            token.detach(process)
+
+    stderr = b"".join(chunk for chunk in stderr_chunks if chunk)
+    return process.returncode, stderr.decode('utf-8', errors='replace')
+
+
+def run_command_job(token, progress, cmd, timeout=None, input_data=None): #vers 1
+    """Job body for a single command, returns (success, stdout or error)"""
+    try:
+        returncode, stdout, stderr = run_process(cmd, token, timeout, input_data)
+    except FileNotFoundError as e:
+        return False, f"{e.filename}: command not found"
+    except Exception as e:
+        return False, str(e)
+
+    if token and token.cancelled:
+        return False, "Cancelled"
+    if returncode == 0:
+        return True, stdout
+    return False, stderr.strip() or f"Exit code {returncode}"
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Sharded Transfer Core - version 4
+this belongs in apps/core/sshsync_shardcore.py
+
+Parallel sharded rsync - partitions the file tree into size-balanced shards and runs
+concurrent rsync streams, auto-tuning the stream count from measured throughput
+"""
+
+import heapq
+import os
+import stat
+import threading
+import time
+
+from core.sshsync_rsynccore import PARTIAL_DIR, build_rsync_cmd, encode_file_list, run_rsync
+from core.sshsync_runcore import run_process
+
+
+SHARDS_PER_STREAM = 4  # shards queued per possible stream, keeps late streams busy
+TUNE_WINDOW = 3.0      # seconds of throughput measured before each tuning step
+TUNE_GAIN = 1.10       # an extra stream must add 10% throughput to be kept
+
+
+def walk_local_tree(root): #vers 2
+    """List every entry under root as (relative path, size) - files, symlinks and
+    directories (size 0), so empty directories and directory symlinks are sent too"""
+    files = []
+    root = str(root)
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            full = os.path.join(dirpath, name)
+            try:
+                info = os.lstat(full)
+            except OSError:
+                continue
+            size = 0 if stat.S_ISDIR(info.st_mode) else info.st_size
+            files.append((os.path.relpath(full, root), size))
+    return files
+
+
+def partition_shards(files, shard_count): #vers 1
+    """Split (path, size) files into shard_count size-balanced shards (largest first, greedy)"""
+    shard_count = max(1, min(shard_count, len(files)))
+    heap = [(0, index) for index in range(shard_count)]
+    shards = [[] for _ in range(shard_count)]
+    sizes = [0] * shard_count
+    for path, size in sorted(files, key=lambda item: item[1], reverse=True):
+        total, index = heapq.heappop(heap)
+        shards[index].append(path)
+        sizes[index] = total + size
+        heapq.heappush(heap, (sizes[index], index))
+    return [(shard, sizes[index]) for index, shard in enumerate(shards) if shard]
+
+
+class ShardedTransfer:
+    """Runs shards from a queue on a self-tuning number of rsync streams"""
+
+    def __init__(self, ssh_option, source, dest, shards, max_streams, token=None,
+        progress=None, extra_args=None): #vers 1
+        self.ssh_option = ssh_option
+        self.source = source
+        self.dest = dest
+        self.pending = list(shards)
+        self.max_streams = max(1, max_streams)
+        self.token = token
+        self.progress = progress
+        self.extra_args = extra_args or []
+
+        self.total_bytes = sum(size for _, size in shards)
+        self.target_streams = min(2, self.max_streams)
+        self.active = 0
+        self.done_bytes = 0
+        self.live_bytes = {}    # shard id -> bytes so far
+        self.next_id = 0
+        self.changed = []
+        self.errors = []
+        self.current_file = ""
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+
+    def _shard_cmd(self): #vers 1
+        """rsync reading its NUL-separated file list from stdin"""
+        return build_rsync_cmd(self.ssh_option, self.source, self.dest,
+            extra_args=["--files-from=-", "--from0"] + self.extra_args)
+
+    def _worker(self, paths): #vers 1
+        """Run shards until none are left or the target stream count drops"""
+        while True:
+            with self.lock:
+                shard_id = self.next_id
+                self.next_id += 1
+
+            def on_progress(info, shard_id=shard_id):
+                with self.lock:
+                    self.live_bytes[shard_id] = info.get('bytes', 0)
+                    if info.get('file'):
+                        self.current_file = info['file']
+
+            success, result = self._run_shard(paths, on_progress)
+            with self.lock:
+                self.live_bytes.pop(shard_id, None)
+                if success:
+                    self.done_bytes += result['bytes']
+                    self.changed.extend(result['changed'])
+                else:
+                    self.errors.append(result)
+                cancelled = self.token is not None and self.token.cancelled
+                if cancelled or self.errors or not self.pending or self.active > self.target_streams:
+                    self.active -= 1
+                    self.idle.notify_all()
+                    return
+                paths, _ = self.pending.pop(0)
+
+    def _run_shard(self, paths, on_progress): #vers 2
+        """One rsync over one shard, file list fed NUL-separated on stdin"""
+        return run_rsync(self._shard_cmd(), self.token, on_progress, interval=0.5,
+            input_data=encode_file_list(paths))
+
+    def _spawn(self): #vers 1
+        """Start streams until target reached or shards run out (lock held)"""
+        while self.pending and not self.errors and self.active < self.target_streams:
+            paths, _ = self.pending.pop(0)
+            self.active += 1
+            threading.Thread(target=self._worker, args=(paths,), daemon=True).start()
+
+    def _transferred(self): #vers 1
+        return self.done_bytes + sum(self.live_bytes.values())
+
+    def run(self): #vers 1
+        """Run every shard, returns (success, summary dict or error)"""
+        start = time.monotonic()
+        best_rate = 0.0
+        window_start, window_bytes = start, 0
+        with self.lock:
+            self._spawn()
+            while self.active:
+                self.idle.wait(0.5)
+                now = time.monotonic()
+                transferred = self._transferred()
+
+                # Auto-tune: after each window keep an extra stream only if it paid off
+                if now - window_start >= TUNE_WINDOW:
+                    rate = (transferred - window_bytes) / (now - window_start)
+                    if rate > best_rate * TUNE_GAIN and self.target_streams < self.max_streams:
+                        self.target_streams += 1
+                    elif rate < best_rate / TUNE_GAIN and self.target_streams > 1:
+                        self.target_streams -= 1
+                    best_rate = max(best_rate, rate)
+                    window_start, window_bytes = now, transferred
+
+                if self.token is None or not self.token.cancelled:
+                    self._spawn()
+
+                if self.progress:
+                    elapsed = max(now - start, 0.001)
+                    rate = transferred / elapsed
+                    remaining = max(self.total_bytes - transferred, 0)
+                    eta = int(remaining / rate) if rate else 0
+                    self.progress({
+                        'bytes': transferred,
+                        'percent': int(100 * transferred / self.total_bytes) if self.total_bytes else 100,
+                        'rate_bps': rate,
+                        'eta': f"{eta // 3600}:{eta // 60 % 60:02d}:{eta % 60:02d}",
+                        'file': self.current_file,
+                        'streams': self.active,
+                    })
+
+        if self.token and self.token.cancelled:
+            return False, "Cancelled"
+        if self.errors:
+            return False, "; ".join(str(error) for error in self.errors[:3])
+        return True, {
+            'bytes': self.done_bytes,
+            'changed': self.changed,
+            'deleted': [],
+            'streams': self.target_streams,
+        }
+
+
+def prune_extraneous(ssh_option, source, dest, token=None): #vers 2
+    """Delete files in dest missing from source without transferring anything - partial files are kept"""
+    cmd = ["rsync", "-r", "--delete", "--existing", "--ignore-existing",
+        "--itemize-changes", f"--exclude={PARTIAL_DIR}/", "-e", ssh_option, source, dest]
+    returncode, stdout, stderr = run_process(cmd, token)
+    if returncode != 0:
+        return False, stderr.strip()
+    deleted = [line.split(None, 1)[1] for line in stdout.splitlines()
+        if line.startswith("*deleting")]
+    return True, deleted
+
+
+def run_sharded_job(token, progress, ssh_option, source, dest, delete, lister,
+    max_streams): #vers 1
+    """Job body - list, shard and transfer in parallel, then prune if delete is set"""
+    progress({'file': "Scanning file tree...", 'percent': 0})
+    try:
+        files = lister()
+    except Exception as e:
+        return False, f"Listing failed: {e}"
+    if token.cancelled:
+        return False, "Cancelled"
+
+    shards = partition_shards(files, max_streams * SHARDS_PER_STREAM)
+    summary = {'bytes': 0, 'changed': [], 'deleted': [], 'streams': 0}
+    if shards:
+        success, result = ShardedTransfer(ssh_option, source, dest, shards, max_streams,
+            token, progress).run()
+        if not success:
+            return False, result
+        summary = result
+
+    if delete:
+        success, result = prune_extraneous(ssh_option, source, dest, token)
+        if not success:
+            return False, f"Prune failed: {result}"
+        summary['deleted'] = result
+    return True, summary
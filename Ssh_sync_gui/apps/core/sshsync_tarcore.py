@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Tar Stream Core - version 5
+this belongs in apps/core/sshsync_tarcore.py
+
+Tar-stream transport - the planned change set is piped as one tar stream
+(zstd / lz4 / none) through a single ssh channel, avoiding rsync's per-file
+round trips on trees of many small files. The plan made to choose the transport
+is also what the transfer executes, so the tree is compared once either way.
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+from core.sshsync_bwcore import get_bandwidth_budget
+from core.sshsync_core import quote_remote_path
+from core.sshsync_plancore import build_planned_cmd, run_planned_job
+from core.sshsync_rsynccore import encode_file_list, plan_transfer, run_rsync
+from core.sshsync_runcore import run_process
+
+
+# name -> (compress command, decompress command)
+COMPRESSORS = {
+    'zstd': ("zstd -q -c -T0 -3", "zstd -q -d -c"),
+    'lz4': ("lz4 -q -c", "lz4 -q -d -c"),
+    'none': (None, None),
+}
+COMPRESSION_CHOICES = ('auto', 'zstd', 'lz4', 'none')
+
+TAR_MIN_FILES = 1000          # fewer files than this - rsync overhead is negligible
+TAR_MAX_AVG_SIZE = 256 * 1024  # bigger average files - rsync delta/resume is worth more
+TAR_BLOCK = 512
+
+RELAY_CHUNK = 256 * 1024
+
+
+def choose_transport(file_count, total_bytes): #vers 1
+    """'tar' for many small files, otherwise 'rsync'"""
+    if file_count < TAR_MIN_FILES:
+        return 'rsync'
+    if total_bytes / file_count > TAR_MAX_AVG_SIZE:
+        return 'rsync'
+    return 'tar'
+
+
+def remote_compressors(ssh_prefix, target, token=None): #vers 1
+    """Compressors installed on the remote host"""
+    returncode, stdout, _ = run_process(ssh_prefix + [target,
+        "for c in zstd lz4; do command -v $c >/dev/null 2>&1 && echo $c; done"], token, timeout=30)
+    return set(stdout.split()) if returncode == 0 else set()
+
+
+def pick_compression(preferred, remote_available): #vers 1
+    """Resolve 'auto' (or an unavailable choice) to a compressor both ends have"""
+    def usable(name):
+        return name == 'none' or (shutil.which(name) and name in remote_available)
+
+    if preferred != 'auto' and usable(preferred):
+        return preferred
+    for name in ('zstd', 'lz4'):
+        if usable(name):
+            return name
+    return 'none'
+
+
+def estimate_tar_size(plan): #vers 1
+    """Approximate uncompressed tar stream size for a plan"""
+    total = 0
+    for flags, size, _ in plan['items']:
+        total += TAR_BLOCK
+        if flags[1] == 'f':
+            total += -(-size // TAR_BLOCK) * TAR_BLOCK
+    return total
+
+
+def tar_member_list(plan): #vers 1
+    """Paths to archive - new/changed files, directories and links, never "./" itself"""
+    return [path.rstrip('/') for flags, _, path in plan['items']
+        if flags[0] in '<>ch' and path not in ('./', '.')]
+
+
+def _relay(source, sink, counter, token, bucket=None): #vers 2
+    """Copy source to sink counting bytes, closes sink at the end
+
+    bucket (a TokenBucket) paces the copy - the rate is re-read per chunk, so
+    schedule changes and streams starting elsewhere apply mid-transfer.
+    """
+    try:
+        while not token.cancelled:
+            chunk = source.read(RELAY_CHUNK)
+            if not chunk:
+                break
+            if bucket and not bucket.consume(len(chunk), token):
+                break
+            sink.write(chunk)
+            counter[0] += len(chunk)
+    except (BrokenPipeError, OSError, ValueError):
+        pass
+    finally:
+        try:
+            sink.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+
+def _spawn_chain(stages, stdin, last_stdout, processes, token): #vers 1
+    """Start stages piped into each other, returns the last process"""
+    process = None
+    for index, cmd in enumerate(stages):
+        source = process.stdout if process else stdin
+        stdout = last_stdout if index == len(stages) - 1 else subprocess.PIPE
+        process = subprocess.Popen(cmd, stdin=source, stdout=stdout, stderr=subprocess.PIPE)
+        processes.append(process)
+        token.attach(process)
+        if source is not stdin:
+            source.close()  # the next stage owns it now, so SIGPIPE reaches the writer
+    return process
+
+
+def run_tar_pipeline(producer, consumer, members, total_bytes, token, progress): #vers 3
+    """Run producer | (counted, rate limited relay) | consumer, each a list of argv stages
+
+    members is fed NUL-separated to the first producer stage. The relay counts as
+    one stream of the global bandwidth budget and of token's profile cap.
+    Returns (success, bytes relayed or error).
+    """
+    processes = []
+    try:
+        tail = _spawn_chain(producer, subprocess.PIPE, subprocess.PIPE, processes, token)
+        head_index = len(processes)
+        _spawn_chain(consumer, subprocess.PIPE, subprocess.DEVNULL, processes, token)
+    except FileNotFoundError as e:
+        for process in processes:
+            process.kill()
+            token.detach(process)
+        return False, f"{e.filename}: command not found"
+    feeder, head = processes[0], processes[head_index]
+
+    # stderr of every stage drained on threads, file list fed on a thread
+    stderr_chunks = []
+    readers = []
+    for process in processes:
+        chunks = []
+        stderr_chunks.append(chunks)
+        reader = threading.Thread(target=lambda p=process, c=chunks: c.append(p.stderr.read()),
+            daemon=True)
+        reader.start()
+        readers.append(reader)
+
+    def feed():
+        try:
+            feeder.stdin.write(encode_file_list(members))
+            feeder.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+    threading.Thread(target=feed, daemon=True).start()
+
+    counter = [0]
+    budget = get_bandwidth_budget()
+    with budget.stream(token):
+        relay = threading.Thread(target=_relay,
+            args=(tail.stdout, head.stdin, counter, token, budget.bucket(token)), daemon=True)
+        relay.start()
+
+        started = time.monotonic()
+        while relay.is_alive():
+            relay.join(0.25)
+            elapsed = max(time.monotonic() - started, 0.001)
+            rate = counter[0] / elapsed
+            remaining = max(total_bytes - counter[0], 0)
+            eta = int(remaining / rate) if rate else 0
+            progress({
+                'bytes': counter[0],
+                'percent': min(99, int(100 * counter[0] / total_bytes)) if total_bytes else 0,
+                'rate_bps': rate,
+                'eta': f"{eta // 3600}:{eta // 60 % 60:02d}:{eta % 60:02d}",
+                'file': "tar stream",
+            })
+    tail.stdout.close()
+
+    failed = []
+    for process, reader, chunks in zip(processes, readers, stderr_chunks):
+        process.wait()
+        reader.join()
+        token.detach(process)
+        if process.returncode != 0:
+            error = b"".join(chunk for chunk in chunks if chunk).decode('utf-8', errors='replace')
+            failed.append(error.strip() or f"{process.args[0]} exit code {process.returncode}")
+    if token.cancelled:
+        return False, "Cancelled"
+    if failed:
+        return False, "; ".join(failed[:2])
+    return True, counter[0]
+
+
+def build_push_stages(local_dir, ssh_prefix, target, remote_dir, compression): #vers 1
+    """(producer, consumer) stages sending local_dir members into remote_dir"""
+    compress, decompress = COMPRESSORS[compression]
+    quoted = quote_remote_path(remote_dir)
+    extract = f"{decompress} | tar -xf - --no-same-owner" if decompress else "tar -xf - --no-same-owner"
+    producer = [["tar", "-C", local_dir, "-cf", "-", "--no-recursion", "--null", "-T", "-"]]
+    consumer = []
+    if compress:
+        consumer.append(compress.split())
+    consumer.append(ssh_prefix + [target, f"mkdir -p {quoted} && cd {quoted} && {extract}"])
+    return producer, consumer
+
+
+def build_pull_stages(ssh_prefix, target, remote_dir, local_dir, compression): #vers 1
+    """(producer, consumer) stages fetching remote_dir members into local_dir"""
+    compress, decompress = COMPRESSORS[compression]
+    quoted = quote_remote_path(remote_dir)
+    archive = "tar -cf - --no-recursion --null -T -"
+    if compress:
+        archive += f" | {compress}"
+    producer = [ssh_prefix + [target, f"cd {quoted} && {archive}"]]
+    if decompress:
+        producer.append(decompress.split())
+    consumer = [["tar", "-C", local_dir, "-xf", "-", "--no-same-owner"]]
+    return producer, consumer
+
+
+def run_auto_transfer_job(token, progress, ssh_option, ssh_prefix, target, local_dir,
+    remote_dir, push, delete, compression, fallback=None): #vers 3
+    """Job body - plan the transfer, then tar-stream it or rsync exactly the planned paths
+
+    The plan's file list drives both transports (rsync --files-from), so the trees
+    are walked once. fallback is an optional (fn, *args) job - the sharded parallel
+    streams - run instead when the plan favours rsync; it lists the tree again.
+    """
+    remote = f"{target}:{remote_dir}/"
+    source, dest = (f"{local_dir}/", remote) if push else (remote, f"{local_dir}/")
+
+    progress({'file': "Planning transfer...", 'percent': 0})
+    success, plan = plan_transfer(ssh_option, source, dest, delete, token)
+    if not success:
+        return False, f"Planning failed: {plan}"
+    if choose_transport(plan['files'], plan['bytes']) != 'tar':
+        if fallback is not None:
+            fn, *args = fallback
+            return fn(token, progress, *args)
+        # Preserve mode never deletes - not even a planned file removed since planning
+        return run_planned_job(token, progress, ssh_option, source, dest, plan, delete)
+
+    compression = pick_compression(compression, remote_compressors(ssh_prefix, target, token))
+    progress({'file': f"tar stream ({compression}) - {plan['files']:,} files", 'percent': 0})
+    members = tar_member_list(plan)
+    if push:
+        stages = build_push_stages(local_dir, ssh_prefix, target, remote_dir, compression)
+    else:
+        os.makedirs(local_dir, exist_ok=True)
+        stages = build_pull_stages(ssh_prefix, target, remote_dir, local_dir, compression)
+    success, result = run_tar_pipeline(*stages, members, estimate_tar_size(plan), token, progress)
+    if not success:
+        return False, result
+
+    summary = {'bytes': result, 'changed': members, 'deleted': [],
+        'transport': f"tar/{compression}"}
+    if plan['deleted']:
+        # Listed paths missing from the source are deleted - no second tree walk
+        success, result = run_rsync(build_planned_cmd(ssh_option, source, dest, True), token,
+            input_data=encode_file_list(plan['deleted']))
+        if not success:
+            return False, f"Prune failed: {result}"
+        summary['deleted'] = result['deleted']
+    return True, summary
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Theme Snapshot Core - version 1
+this belongs in apps/core/sshsync_themecore.py
+
+Active theme without the settings system - reads the app settings file and the one
+theme file it names, so the window is themed at startup without importing
+app_settings_system or parsing every theme; the full AppSettings loads when the
+theme dialog is first opened
+"""
+
+import json
+from pathlib import Path
+
+
+# Same locations AppSettings uses when it lives in apps/utils
+APPS_DIR = Path(__file__).resolve().parent.parent
+SETTINGS_FILE = APPS_DIR / "appfactory.settings.json"
+THEMES_DIR = APPS_DIR / "themes"
+
+
+def _read_json(path): #vers 1
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class ThemeSnapshot:
+    """Read-only stand-in for AppSettings holding what the window reads at startup
+
+    current_settings is the saved settings file, themes holds only the active theme.
+    """
+
+    def __init__(self, current_settings, themes): #vers 1
+        self.current_settings = current_settings
+        self.themes = themes
+
+
+def load_theme_snapshot(settings_file=SETTINGS_FILE, themes_dir=THEMES_DIR): #vers 1
+    """Saved settings plus the active theme - missing files give an empty snapshot"""
+    settings = _read_json(settings_file) or {}
+    name = settings.get('theme')
+    theme = _read_json(Path(themes_dir) / f"{name}.json") if name else None
+    return ThemeSnapshot(settings, {name: theme} if theme else {})
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Local Watcher Core - version 2
+this belongs in apps/core/sshsync_watchcore.py
+
+Recursive inotify watcher (libc via ctypes, no extra packages) that coalesces bursts of
+file events into debounced batches of changed relative paths
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import threading
+import time
+
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+    IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+DEBOUNCE = 0.5  # seconds of quiet before a batch is released
+
+
+_libc = None
+
+
+def _load_libc(): #vers 1
+    """libc with inotify symbols, or None on platforms without inotify"""
+    global _libc
+    if _libc is None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            _libc = libc
+        except (OSError, AttributeError):
+            _libc = False
+    return _libc or None
+
+
+def inotify_available(): #vers 1
+    """True when the platform offers inotify"""
+    return _load_libc() is not None
+
+
+class LocalWatcher:
+    """Watches a directory tree and reports changed paths in debounced batches
+
+    on_changes(paths) runs on the watcher thread with a set of relative paths, or
+    None when events were lost (queue overflow) and the whole tree must be treated
+    as changed. A batch is released after DEBOUNCE seconds of quiet, or at the
+    latest `latency` seconds after its first event.
+    """
+
+    def __init__(self, root, on_changes, latency=2.0): #vers 1
+        self.root = os.path.abspath(root)
+        self.on_changes = on_changes
+        self.latency = max(latency, DEBOUNCE)
+        self.fd = -1
+        self.watches = {}   # wd -> relative directory ("" for root)
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self): #vers 1
+        """Set up watches and start the reader thread, returns (success, watch count or error)"""
+        libc = _load_libc()
+        if libc is None:
+            return False, "inotify is not available on this platform"
+        if not os.path.isdir(self.root):
+            return False, f"Directory does not exist: {self.root}"
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            return False, f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}"
+        success, error = self._add_tree("")
+        if not success:
+            os.close(self.fd)
+            self.fd = -1
+            return False, error
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return True, len(self.watches)
+
+    def stop(self): #vers 1
+        """Stop the reader thread and release every watch"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(2)
+            self.thread = None
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.watches.clear()
+
+    def _add_watch(self, relative): #vers 1
+        path = os.path.join(self.root, relative) if relative else self.root
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            return False, ctypes.get_errno()
+        self.watches[wd] = relative
+        return True, wd
+
+    def _drop_tree(self, relative): #vers 1
+        """Forget watches on relative and below - the directory moved away"""
+        prefix = relative + '/'
+        for wd, directory in list(self.watches.items()):
+            if directory == relative or directory.startswith(prefix):
+                _libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def _add_tree(self, relative): #vers 1
+        """Watch relative and every directory below it"""
+        stack = [relative]
+        while stack:
+            current = stack.pop()
+            success, result = self._add_watch(current)
+            if not success:
+                if result == errno.ENOSPC:
+                    return False, ("inotify watch limit reached - raise "
+                        "fs.inotify.max_user_watches")
+                if result in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                    continue  # vanished or unreadable meanwhile
+                return False, f"inotify_add_watch failed: {os.strerror(result)}"
+            try:
+                with os.scandir(os.path.join(self.root, current) if current else self.root) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(f"{current}/{entry.name}" if current else entry.name)
+            except OSError:
+                continue
+        return True, None
+
+    def _read_events(self, changed): #vers 1
+        """Drain pending events into changed, returns (event count, False if events were lost)"""
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return 0, True
+        complete = True
+        count = 0
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            count += 1
+
+            if mask & IN_Q_OVERFLOW:
+                complete = False
+                continue
+            directory = self.watches.get(wd)
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            if directory is None or not name:
+                continue
+            name = os.fsdecode(name)
+            path = f"{directory}/{name}" if directory else name
+            changed.add(path)
+            # Moved-out directories keep stale paths, new or moved-in ones need watches
+            if mask & IN_ISDIR and mask & IN_MOVED_FROM:
+                self._drop_tree(path)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                success, _ = self._add_tree(path)
+                if not success:
+                    complete = False
+        return count, complete
+
+    def _run(self): #vers 1
+        changed = set()
+        complete = True
+        first_event = last_event = 0.0
+        while not self.stop_event.is_set():
+            try:
+                ready, _, _ = select.select([self.fd], [], [], 0.1)
+            except (OSError, ValueError):
+                break
+            now = time.monotonic()
+            if ready:
+                count, batch_complete = self._read_events(changed)
+                complete = complete and batch_complete
+                if count:
+                    if not first_event:
+                        first_event = now
+                    last_event = now
+            if first_event and (now - last_event >= DEBOUNCE or now - first_event >= self.latency):
+                batch = set(changed) if complete else None
+                changed.clear()
+                complete = True
+                first_event = last_event = 0.0
+                try:
+                    self.on_changes(batch)
+                except Exception:
+                    pass
+
+
+class PendingChanges:
+    """Changed paths waiting for a transfer - batches arriving meanwhile are merged"""
+
+    def __init__(self): #vers 1
+        self.paths = set()
+        self.full = False
+        self.running = False
+
+    def add(self, paths): #vers 1
+        """Merge a watcher batch - None means everything must be treated as changed"""
+        if paths is None:
+            self.full = True
+        else:
+            self.paths.update(paths)
+
+    def take(self): #vers 1
+        """Next (full, sorted paths) to transfer and mark it running, or None"""
+        if self.running or not (self.full or self.paths):
+            return None
+        batch = (self.full, sorted(self.paths))
+        self.paths = set()
+        self.full = False
+        self.running = True
+        return batch
+
+    def finish(self): #vers 1
+        self.running = False
+
+    def clear(self): #vers 1
+        self.paths = set()
+        self.full = False
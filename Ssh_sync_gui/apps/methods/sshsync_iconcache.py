@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+X-Seti - October17 2026 - SSH File Sync - Icon Cache Module - version 3
+this belongs in apps/methods/sshsync_iconcache.py
+
+Process-wide cache of rasterized SVG icons keyed by (svg id, color, size, device
+pixel ratio) - every toolbar asking for the same icon shares one QIcon. The svg id
+is the SVG bytes themselves (icon factories return the same constant), the color
+replaces currentColor. Entries drawn in the theme text color are dropped only when
+that color changes.
+
+A miss is served from the pre-rendered icon atlas (see sshsync_atlascore) when it
+has the icon at that size and ratio, and rendered from the SVG otherwise.
+ensure_icon_atlas() builds the atlas when it is missing or was built from another
+icon set.
+"""
+
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QImage
+from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtCore import QByteArray
+
+from core.sshsync_atlascore import (ATLAS_DPRS, atlas_key, atlas_write_path, get_icon_atlas,
+    reset_icon_atlas, write_atlas)
+from core.sshsync_iconcore import ICON_SVGS, icon_set_digest, icon_sizes
+
+
+# Digest of the icon set this build draws - an atlas with another source is stale
+ICON_SET_DIGEST = icon_set_digest(ATLAS_DPRS)
+
+# Two unrelated colors - an icon is atlas-safe when tinting the mask of one
+# rendering reproduces the other
+CHECK_COLORS = ('#ff0000', '#0000ff')
+CHECK_TOLERANCE = 2
+
+_pixmaps = {}
+_icons = {}
+_theme_color = None
+
+
+def render_svg_pixmap(svg_data, color=None, size=24, dpr=1.0): #vers 1
+    """Render SVG bytes to a transparent size x size pixmap at the given device pixel ratio"""
+    if color:
+        svg_data = svg_data.replace(b'currentColor', color.encode('ascii'))
+
+    renderer = QSvgRenderer(QByteArray(svg_data))
+    pixmap = QPixmap(round(size * dpr), round(size * dpr))
+    pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
+
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+def pixmap_mask(pixmap): #vers 1
+    """(bytes, width, height, bytes_per_line) alpha mask of a rendered icon"""
+    image = pixmap.toImage().convertToFormat(QImage.Format.Format_Alpha8)
+    return bytes(image.constBits().asstring(image.sizeInBytes())), image.width(), image.height(), image.bytesPerLine()
+
+
+def tint_mask(data, width, height, bytes_per_line, color=None, dpr=1.0): #vers 1
+    """Pixmap of an alpha mask filled with color - what rendering the SVG in that color gives"""
+    mask = QImage(data, width, height, bytes_per_line, QImage.Format.Format_Alpha8)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(color or '#000000'))
+
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, mask)
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+def cached_pixmap(svg_data, color=None, size=24, dpr=1.0): #vers 3
+    """Shared pixmap for (svg, color, size, dpr) - from the atlas, else rendered, on first request"""
+    key = (svg_data, color, size, dpr)
+    pixmap = _pixmaps.get(key)
+    if pixmap is None:
+        found = get_icon_atlas(ICON_SET_DIGEST).mask(svg_data, size, dpr)
+        if found is not None:
+            pixmap = tint_mask(*found, color, dpr)
+        else:
+            pixmap = render_svg_pixmap(svg_data, color, size, dpr)
+        _pixmaps[key] = pixmap
+    return pixmap
+
+
+def cached_icon(svg_data, color=None, size=24, dpr=1.0): #vers 1
+    """Shared QIcon for (svg, color, size, dpr) - rendered on first request"""
+    key = (svg_data, color, size, dpr)
+    icon = _icons.get(key)
+    if icon is None:
+        icon = QIcon(cached_pixmap(svg_data, color, size, dpr))
+        _icons[key] = icon
+    return icon
+
+
+def set_theme_color(color): #vers 1
+    """Record the theme text color - returns True (and drops icons drawn in the old one) on change"""
+    global _theme_color
+    if color == _theme_color:
+        return False
+
+    old_color, _theme_color = _theme_color, color
+    if old_color is not None:
+        for cache in (_pixmaps, _icons):
+            for key in [key for key in cache if key[1] == old_color]:
+                del cache[key]
+    return True
+
+
+def clear_icon_cache(): #vers 1
+    """Drop every cached icon"""
+    _pixmaps.clear()
+    _icons.clear()
+
+
+def _pixels(pixmap): #vers 1
+    image = pixmap.toImage().convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    return image.constBits().asstring(image.sizeInBytes())
+
+
+def _single_color(svg_data, size, dpr, mask): #vers 1
+    """True when tinting mask reproduces the SVG rendered in another color"""
+    rendered = _pixels(render_svg_pixmap(svg_data, CHECK_COLORS[0], size, dpr))
+    tinted = _pixels(tint_mask(*mask, CHECK_COLORS[0], dpr))
+    return len(rendered) == len(tinted) and all(
+        abs(a - b) <= CHECK_TOLERANCE for a, b in zip(rendered, tinted))
+
+
+def build_atlas_masks(): #vers 1
+    """({atlas key: mask} for every single-color icon, size and ratio, [skipped renderings])"""
+    masks = {}
+    skipped = []
+    for name, svg_data in ICON_SVGS.items():
+        for size in icon_sizes(name):
+            for dpr in ATLAS_DPRS:
+                mask = pixmap_mask(render_svg_pixmap(svg_data, CHECK_COLORS[1], size, dpr))
+                if not _single_color(svg_data, size, dpr, mask):
+                    skipped.append(f"{name} {size}px @{dpr:g}x")
+                    continue
+                data, width, height, bytes_per_line = mask
+                masks[atlas_key(svg_data, size, dpr)] = (width, height, bytes_per_line, data)
+    return masks, skipped
+
+
+def ensure_icon_atlas(path=None): #vers 1
+    """Build the atlas unless a current one exists - needs a Qt GUI application
+
+    Returns (path written, mask count, skipped renderings), or None when the atlas
+    is current. Raises OSError when it cannot be written.
+    """
+    if path is None:
+        if get_icon_atlas(ICON_SET_DIGEST).source == ICON_SET_DIGEST:
+            return None
+        path = atlas_write_path()
+    masks, skipped = build_atlas_masks()
+    write_atlas(masks, path, ICON_SET_DIGEST)
+    reset_icon_atlas()
+    return path, len(masks), skipped
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+X-Seti - October17 2026 - SSH File Sync - Job Executor - version 2
+this belongs in apps/methods/sshsync_jobexec.py
+
+Background job executor - QThread worker pool fed from a queue, so transfers and
+remote operations never block the Qt event loop
+"""
+
+import queue
+import threading
+import traceback
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from core.sshsync_runcore import CancelToken
+
+
+class SyncJob:
+    """One queued unit of work - fn(token, progress, *args) returns (success, result)"""
+
+    def __init__(self, job_id, name, fn, args, on_done=None, on_progress=None): #vers 1
+        self.job_id = job_id
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.token = CancelToken()
+
+
+class JobWorker(QThread):
+    """Worker thread - pulls jobs off the shared queue until it gets None"""
+
+    def __init__(self, executor): #vers 1
+        super().__init__()
+        self.executor = executor
+
+    def run(self): #vers 1
+        while True:
+            job = self.executor.job_queue.get()
+            if job is None:
+                break
+            self.executor._run_job(job)
+
+
+class JobExecutor(QObject):
+    """Queue + worker pool with cancellation tokens and progress/completion signals"""
+
+    job_started = pyqtSignal(int, str)           # job_id, name
+    job_progress = pyqtSignal(int, object)       # job_id, progress dict
+    job_finished = pyqtSignal(int, bool, object) # job_id, success, result
+    busy_changed = pyqtSignal(bool)              # True while any job is queued or running
+
+    def __init__(self, max_workers=2, parent=None): #vers 2
+        super().__init__(parent)
+        self.job_queue = queue.Queue()
+        self.jobs = {}  # job_id -> SyncJob, queued or running
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.workers = []
+        self.max_workers = 0
+        self.resize(max_workers)
+
+        # Completion/progress callbacks run on the GUI thread via queued connections
+        self.job_progress.connect(self._dispatch_progress)
+        self.job_finished.connect(self._dispatch_finished)
+
+    def resize(self, max_workers): #vers 1
+        """Grow or shrink the pool - surplus workers exit once the jobs queued before are taken"""
+        self.workers = [worker for worker in self.workers if not worker.isFinished()]
+        for _ in range(max_workers - self.max_workers):
+            worker = JobWorker(self)
+            worker.start()
+            self.workers.append(worker)
+        for _ in range(self.max_workers - max_workers):
+            self.job_queue.put(None)
+        self.max_workers = max_workers
+
+    @property
+    def busy(self): #vers 1
+        return bool(self.jobs)
+
+    def submit(self, name, fn, *args, on_done=None, on_progress=None): #vers 1
+        """Queue fn(token, progress, *args), returns the job id"""
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+        job = SyncJob(job_id, name, fn, args, on_done, on_progress)
+        was_busy = self.busy
+        self.jobs[job_id] = job
+        self.job_queue.put(job)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return job_id
+
+    def cancel(self, job_id): #vers 1
+        """Cancel one queued or running job"""
+        job = self.jobs.get(job_id)
+        if job:
+            job.token.cancel()
+
+    def cancel_all(self): #vers 1
+        """Cancel every queued and running job"""
+        for job in list(self.jobs.values()):
+            job.token.cancel()
+
+    def shutdown(self): #vers 1
+        """Cancel outstanding work and stop the worker threads"""
+        self.cancel_all()
+        for _ in self.workers:
+            self.job_queue.put(None)
+        for worker in self.workers:
+            worker.wait(5000)
+
+    def _run_job(self, job): #vers 1
+        """Worker-thread side of a job"""
+        if job.token.cancelled:
+            self.job_finished.emit(job.job_id, False, "Cancelled")
+            return
+
+        self.job_started.emit(job.job_id, job.name)
+
+        def progress(info):
+            self.job_progress.emit(job.job_id, info)
+
+        try:
+            success, result = job.fn(job.token, progress, *job.args)
+        except Exception as e:
+            traceback.print_exc()
+            success, result = False, str(e)
+        if job.token.cancelled:
+            success, result = False, "Cancelled"
+        self.job_finished.emit(job.job_id, success, result)
+
+    def _dispatch_progress(self, job_id, info): #vers 1
+        """GUI-thread side of job progress"""
+        job = self.jobs.get(job_id)
+        if job and job.on_progress:
+            job.on_progress(info)
+
+    def _dispatch_finished(self, job_id, success, result): #vers 1
+        """GUI-thread side of job completion"""
+        job = self.jobs.pop(job_id, None)
+        if job and job.on_done:
+            try:
+                job.on_done(success, result)
+            except Exception:
+                traceback.print_exc()
+        if not self.jobs:
+            self.busy_changed.emit(False)
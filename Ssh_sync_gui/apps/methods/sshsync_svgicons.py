@@ -1,34 +1,24 @@
 #!/usr/bin/env python3
 
 """
-X-Seti - July03 2023 - SSH File Sync - Icon Methods Module - version 3
+X-Seti - July03 2023 - SSH File Sync - Icon Methods Module - version 4
 this belongs in apps/methods/sshsync_svgicons.py
 
 Shared SVG icon creation methods
 """
 
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
-from PyQt6.QtSvg import QSvgRenderer
-from PyQt6.QtCore import QByteArray
+from PyQt6.QtGui import QIcon, QGuiApplication
 
+from methods.sshsync_iconcache import cached_icon
 
-def svg_to_icon(svg_data, size=24):
-    """Convert SVG data to QIcon with theme color support"""
+
+def svg_to_icon(svg_data, size=24, color=None):
+    """Convert SVG data to QIcon with theme color support - shared via the icon cache"""
     try:
-        # Create SVG renderer
-        renderer = QSvgRenderer(QByteArray(svg_data))
-        
-        # Create pixmap
-        pixmap = QPixmap(size, size)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
-        
-        # Render SVG
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        
-        return QIcon(pixmap)
-        
+        app = QGuiApplication.instance()
+        dpr = app.devicePixelRatio() if app else 1.0
+        return cached_icon(svg_data, color, size, dpr)
+
     except Exception as e:
         print(f"Error creating icon: {e}")
         return QIcon()
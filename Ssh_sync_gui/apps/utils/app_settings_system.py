@@ -6,10 +6,13 @@ App Factory - App Settings System - Clean Version
 Settings management without demo code
 """
 
-#This goes in root/ app_settings_system.py - version 60
+#This goes in root/ app_settings_system.py - version 63
 
+import hashlib
 import json
 import os
+import tempfile
+from collections.abc import MutableMapping
 from pathlib import Path
 from PyQt6.QtCore import Qt, pyqtSignal, QDateTime  # Fixed: Added QDateTime
 from PyQt6.QtGui import QFont
@@ -29,20 +32,25 @@ from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread, pyqtSlot, QRect, QDate
 from PyQt6.QtGui import QFont, QColor, QPixmap, QPainter, QCursor
 
 
-# Check for screen capture libraries (for robust color picking)
-try:
-    import mss
-    MSS_AVAILABLE = True
-    print("MSS library available")
-except ImportError:
-    MSS_AVAILABLE = False
-    try:
-        from PIL import ImageGrab
-        PIL_AVAILABLE = True
-        print("MSS not available, using PIL fallback")
-    except ImportError:
-        PIL_AVAILABLE = False
-        print("Neither MSS nor PIL available - using Qt fallback")
+# Screen capture libraries (for robust color picking) - probed on the first pick,
+# not at import, so loading the settings system never pulls in PIL
+_CAPTURE_BACKEND = None
+
+
+def _capture_backend(): #vers 1
+    """'mss', 'pil' or 'qt' - the best screen capture available, probed once"""
+    global _CAPTURE_BACKEND
+    if _CAPTURE_BACKEND is None:
+        try:
+            import mss
+            _CAPTURE_BACKEND = 'mss'
+        except ImportError:
+            try:
+                from PIL import ImageGrab
+                _CAPTURE_BACKEND = 'pil'
+            except ImportError:
+                _CAPTURE_BACKEND = 'qt'
+    return _CAPTURE_BACKEND
 
 
 ##Methods to add to SettingsDialog class
@@ -860,9 +868,10 @@ class ScreenCaptureThread(QThread):
     def run(self):
         """Capture color at coordinates in background thread"""
         try:
-            if MSS_AVAILABLE:
+            backend = _capture_backend()
+            if backend == 'mss':
                 color = self._capture_with_mss()
-            elif PIL_AVAILABLE:
+            elif backend == 'pil':
                 color = self._capture_with_pil()
             else:
                 color = self._capture_with_qt()
@@ -877,6 +886,7 @@ class ScreenCaptureThread(QThread):
     def _capture_with_mss(self):
         """High-performance capture using MSS library"""
         try:
+            import mss
             with mss.mss() as sct:
                 # Capture 1x1 pixel area for maximum efficiency
                 monitor = {"top": self.y, "left": self.x, "width": 1, "height": 1}
@@ -896,6 +906,7 @@ class ScreenCaptureThread(QThread):
         """Fallback capture using PIL/Pillow"""
         try:
             # Capture small area around point for efficiency
+            from PIL import ImageGrab
             bbox = (self.x, self.y, self.x + 1, self.y + 1)
             screenshot = ImageGrab.grab(bbox)
             pixel = screenshot.getpixel((0, 0))
@@ -1518,8 +1529,206 @@ class DebugSettings:
         self.app_settings.save_settings()
         return self.debug_enabled
 
+# Compiled theme index - display name and resolved palette of every theme file in
+# one JSON file beside the settings, rebuilt only when the theme folder changes
+THEME_INDEX_FILE = "themes.index.json"
+THEME_INDEX_VERSION = 1
+
+# Colors every palette is guaranteed to have - theme colors take priority
+THEME_COLOR_DEFAULTS = {
+    'bg_primary': '#ffffff',
+    'bg_secondary': '#f5f5f5',
+    'bg_tertiary': '#e9ecef',
+    'panel_bg': '#f0f0f0',
+    'text_primary': '#000000',
+    'text_secondary': '#666666',
+    'text_accent': '#0066cc',
+    'accent_primary': '#0078d4',
+    'accent_secondary': '#0A7Ad4',
+    'alternate_row': '#fefefe',
+    'border': '#cccccc',
+    'button_normal': '#e0e0e0',
+    'button_hover': '#d0d0d0',
+    'button_pressed': '#b1b1b1',
+    'selection_background': '#0188c4',
+    'selection_text': '#ffffff',
+    'table_row_even': '#fcfcfc',
+    'table_row_odd': '#f1f1f1',
+    'success': '#4caf50',
+    'warning': '#ff9800',
+    'error': '#f44336',
+    'grid': '#e0e0e0',
+    'pin_default': '#757575',
+    'pin_highlight': '#0078d4',
+    'action_import': '#e3f2fd',
+    'action_export': '#e8f5e8',
+    'action_remove': '#ffebee',
+    'action_update': '#fff3e0',
+    'action_convert': '#f3e5f5',
+    'panel_entries': '#f0fdf4',
+    'panel_filter': '#fefce8',
+    'toolbar_bg': '#fafafa'
+}
+
+
+# Generated stylesheets, one .qss per palette + font settings, kept beside the settings
+STYLESHEET_CACHE_DIR = "qss_cache"
+STYLESHEET_CACHE_LIMIT = 64
+
+
+def resolve_palette(colors): #vers 1
+    """New dict of the theme colors with every missing key filled from the defaults"""
+    palette = dict(THEME_COLOR_DEFAULTS)
+    if isinstance(colors, dict):
+        palette.update(colors)
+    return palette
+
+
+def _write_text_atomic(path, text): #vers 1
+    """Write text to path via a temp file and rename - readers never see half a file"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _theme_dir_signature(themes_dir): #vers 1
+    """Sorted [file, mtime_ns, size] of every theme file - one directory scan, no parsing"""
+    signature = []
+    try:
+        with os.scandir(themes_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    info = entry.stat()
+                    signature.append([entry.name, info.st_mtime_ns, info.st_size])
+    except OSError:
+        return []
+    return sorted(signature)
+
+
+class ThemeLibrary(MutableMapping):
+    """Theme key -> theme data, backed by the compiled theme index
+
+    Keys, display names and palettes come straight from the index; a theme file
+    is only parsed the first time its full data is read (the settings dialog
+    previewing or editing it). Themes assigned in memory - saved, edited or
+    built-in - take precedence over the files.
+    """
+
+    def __init__(self, themes_dir, index_file): #vers 1
+        self.themes_dir = Path(themes_dir)
+        self.index_file = Path(index_file)
+        self.entries = {}
+        self.loaded = {}
+        self._load_index()
+
+    def _load_index(self): #vers 1
+        """Use the saved index while it matches the theme folder, else rebuild it"""
+        signature = _theme_dir_signature(self.themes_dir)
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if (index.get('version') == THEME_INDEX_VERSION
+                    and index.get('themes_dir') == str(self.themes_dir)
+                    and index.get('signature') == signature):
+                self.entries = index['themes']
+                return
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        self._rebuild(signature)
+
+    def _rebuild(self, signature): #vers 2
+        """Parse every theme file once and write the index"""
+        entries = {}
+        for file_name, _mtime, _size in signature:
+            theme_key = Path(file_name).stem
+            try:
+                with open(self.themes_dir / file_name, 'r', encoding='utf-8') as f:
+                    theme_data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading {file_name}: {e}")
+                continue
+            if not isinstance(theme_data, dict):
+                continue
+            entries[theme_key] = {
+                'file': file_name,
+                'name': theme_data.get('name', theme_key),
+                'colors': resolve_palette(theme_data.get('colors'))
+            }
+            self.loaded[theme_key] = theme_data
+        self.entries = entries
+
+        index = {
+            'version': THEME_INDEX_VERSION,
+            'themes_dir': str(self.themes_dir),
+            'signature': signature,
+            'themes': entries
+        }
+        try:
+            _write_text_atomic(self.index_file, json.dumps(index))
+        except OSError as e:
+            print(f"[WARN] Theme index not saved: {e}")
+        print(f"Theme index rebuilt: {len(entries)} themes")
+
+    def __getitem__(self, theme_key): #vers 1
+        if theme_key not in self.loaded:
+            entry = self.entries[theme_key]
+            try:
+                with open(self.themes_dir / entry['file'], 'r', encoding='utf-8') as f:
+                    theme_data = json.load(f)
+            except (OSError, ValueError):
+                theme_data = None
+            if not isinstance(theme_data, dict):
+                theme_data = {'name': entry['name'], 'colors': dict(entry['colors'])}
+            self.loaded[theme_key] = theme_data
+        return self.loaded[theme_key]
+
+    def __setitem__(self, theme_key, theme_data): #vers 1
+        self.loaded[theme_key] = theme_data
+
+    def __delitem__(self, theme_key): #vers 1
+        if theme_key not in self:
+            raise KeyError(theme_key)
+        self.loaded.pop(theme_key, None)
+        self.entries.pop(theme_key, None)
+
+    def __contains__(self, theme_key): #vers 1
+        return theme_key in self.entries or theme_key in self.loaded
+
+    def __iter__(self): #vers 1
+        yield from self.entries
+        for theme_key in self.loaded:
+            if theme_key not in self.entries:
+                yield theme_key
+
+    def __len__(self): #vers 1
+        return len(self.entries) + sum(1 for key in self.loaded if key not in self.entries)
+
+    def display_name(self, theme_key): #vers 1
+        """Display name without parsing the theme file"""
+        if theme_key in self.loaded:
+            return self.loaded[theme_key].get('name', theme_key)
+        return self.entries[theme_key]['name']
+
+    def palette(self, theme_key): #vers 1
+        """Resolved colors - from the index unless the theme was loaded or edited"""
+        if theme_key in self.loaded:
+            return resolve_palette(self.loaded[theme_key].get('colors'))
+        return dict(self.entries[theme_key]['colors'])
+
+
 class AppSettings:
-    def __init__(self, settings_file="appfactory.settings.json"): #vers 3
+    def __init__(self, settings_file="appfactory.settings.json"): #vers 5
         """Initialize application settings with Windows compatibility"""
         current_file_dir = Path(__file__).parent
 
@@ -1594,15 +1803,15 @@ class AppSettings:
             'button_format': 'both'  # 'both', 'icon_only', 'text_only', 'separate'
         }
 
-        print(f"Looking for themes in: {self.themes_dir}")
-        print(f"Themes directory exists: {self.themes_dir.exists()}")
-        if self.themes_dir.exists():
-            theme_files = list(self.themes_dir.glob("*.json"))
-            print(f"Found {len(theme_files)} theme files")
-
         self.themes = self._load_all_themes()
         self.current_settings = self._load_settings()
 
+        # Stylesheet cache - memory first, then qss_cache/<key>.qss
+        self.stylesheet_cache_dir = self.settings_file.parent / STYLESHEET_CACHE_DIR
+        self._stylesheets = {}
+        code = AppSettings._generate_stylesheet.__code__
+        self._stylesheet_generator = hashlib.sha1(code.co_code + repr(code.co_consts).encode('utf-8')).hexdigest()
+
         # GTA Project Directories
         self.working_gta_folder = self.current_settings.get('working_gta_folder', self.default_settings['working_gta_folder'])
         self.assists_folder = self.current_settings.get('assists_folder', self.default_settings['assists_folder'])
@@ -2317,56 +2526,22 @@ class AppSettings:
             "performance_mode": True
         }
 
-    def _load_all_themes(self):
-        """Unified theme loading method"""
-        themes = {}
-
-        print(f"Looking for themes in: {self.themes_dir}")
-
-        # Check if themes directory exists
-        if self.themes_dir.exists() and self.themes_dir.is_dir():
-            print(f"Found themes directory")
-
-            # Load all .json files from apps.themes.directory
-            theme_files = list(self.themes_dir.glob("*.json"))
-            print(f"Found {len(theme_files)} theme files")
-
-            for theme_file in theme_files:
-                try:
-                    print(f"Loading: {theme_file.name}")
-                    with open(theme_file, 'r', encoding='utf-8') as f:
-                        theme_data = json.load(f)
-
-                    # Use filename without extension as theme key
-                    theme_name = theme_file.stem
-                    themes[theme_name] = theme_data
-
-                    # Show theme info
-                    display_name = theme_data.get('name', theme_name)
-                    print(f"Loaded: {theme_name} -> '{display_name}'")
-
-                except json.JSONDecodeError as e:
-                    print(f"JSON error in {theme_file.name}: {e}")
-                except Exception as e:
-                    print(f"Error loading {theme_file.name}: {e}")
-        else:
-            print(f"Themes directory not found: {self.themes_dir}")
-
-        # Add built-in fallback themes if no themes loaded
+    def _load_all_themes(self): #vers 3
+        """Theme library backed by the compiled index, built-in themes as fallbacks"""
+        themes = ThemeLibrary(self.themes_dir, self.settings_file.parent / THEME_INDEX_FILE)
         if not themes:
             print("No themes loaded from files, using built-in themes")
-            themes = self._get_builtin_themes()
-        else:
-            print(f"Successfully loaded {len(themes)} themes from files")
-            # Add a few essential built-in themes as fallbacks
-            builtin = self._get_builtin_themes()
-            for name, data in builtin.items():
-                if name not in themes:
-                    themes[name] = data
-                    print(f"Added built-in fallback: {name}")
+
+        for name, data in self._get_builtin_themes().items():
+            if name not in themes:
+                themes[name] = data
 
         return themes
 
+    def get_theme_display_names(self): #vers 1
+        """[(theme key, display name)] for theme lists - reads the index, parses nothing"""
+        return [(theme_key, self.themes.display_name(theme_key)) for theme_key in self.themes]
+
     def save_theme_to_file(self, theme_name, theme_data):
         """Save a theme to the themes folder"""
         try:
@@ -2464,56 +2639,13 @@ class AppSettings:
         return {}
 
 
-    def get_theme_colors(self, theme_name=None): #vers 4
+    def get_theme_colors(self, theme_name=None): #vers 5
         """Get colors for specified theme with complete fallback support"""
         if theme_name is None:
             theme_name = self.current_settings.get("theme", "IMG_Factory")
 
         if theme_name in self.themes:
-            colors = self.themes[theme_name].get("colors", {})
-
-            # Add missing colors with smart fallbacks if not in theme
-            defaults = {
-                'bg_primary': '#ffffff',
-                'bg_secondary': '#f5f5f5',
-                'bg_tertiary': '#e9ecef',
-                'panel_bg': '#f0f0f0',
-                'text_primary': '#000000',
-                'text_secondary': '#666666',
-                'text_accent': '#0066cc',
-                'accent_primary': '#0078d4',
-                'accent_secondary': '#0A7Ad4',
-                'alternate_row': '#fefefe',
-                'border': '#cccccc',
-                'button_normal': '#e0e0e0',
-                'button_hover': '#d0d0d0',
-                'button_pressed': '#b1b1b1',
-                'selection_background': '#0188c4',
-                'selection_text': '#ffffff',
-                'table_row_even': '#fcfcfc',
-                'table_row_odd': '#f1f1f1',
-                'success': '#4caf50',
-                'warning': '#ff9800',
-                'error': '#f44336',
-                'grid': '#e0e0e0',
-                'pin_default': '#757575',
-                'pin_highlight': '#0078d4',
-                'action_import': '#e3f2fd',
-                'action_export': '#e8f5e8',
-                'action_remove': '#ffebee',
-                'action_update': '#fff3e0',
-                'action_convert': '#f3e5f5',
-                'panel_entries': '#f0fdf4',
-                'panel_filter': '#fefce8',
-                'toolbar_bg': '#fafafa'
-            }
-
-            # Merge defaults with theme colors (theme colors take priority)
-            for key, value in defaults.items():
-                if key not in colors:
-                    colors[key] = value
-
-            return colors
+            return self.themes.palette(theme_name)
         else:
             print(f"Theme '{theme_name}' not found, using fallback")
             if self.themes:
@@ -2563,10 +2695,45 @@ class AppSettings:
         }
 
 
-    def get_stylesheet(self): #vers 4
+    def get_stylesheet(self): #vers 5
         """Generate complete stylesheet for current theme"""
         colors = self.get_theme_colors()
-        return self._generate_stylesheet(colors)
+        return self.get_cached_stylesheet(colors)
+
+    def get_cached_stylesheet(self, colors): #vers 1
+        """Stylesheet for a resolved palette - generated once per palette and font settings"""
+        key = self._stylesheet_key(colors)
+        stylesheet = self._stylesheets.get(key)
+        if stylesheet is None:
+            qss_file = self.stylesheet_cache_dir / f"{key}.qss"
+            try:
+                stylesheet = qss_file.read_text(encoding='utf-8')
+            except OSError:
+                stylesheet = self._generate_stylesheet(colors)
+                self._save_stylesheet(qss_file, stylesheet)
+            self._stylesheets[key] = stylesheet
+        return stylesheet
+
+    def _stylesheet_key(self, colors): #vers 1
+        """Hash of the palette, font settings and generator code - any change is a new key"""
+        payload = json.dumps({
+            'colors': colors,
+            'font_family': self.current_settings.get('font_family'),
+            'font_size': self.current_settings.get('font_size'),
+            'generator': self._stylesheet_generator
+        }, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _save_stylesheet(self, qss_file, stylesheet): #vers 1
+        """Persist a generated stylesheet, dropping the oldest beyond STYLESHEET_CACHE_LIMIT"""
+        try:
+            self.stylesheet_cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_text_atomic(qss_file, stylesheet)
+            cached = sorted(self.stylesheet_cache_dir.glob("*.qss"), key=lambda p: p.stat().st_mtime)
+            for old_file in cached[:-STYLESHEET_CACHE_LIMIT]:
+                old_file.unlink()
+        except OSError as e:
+            print(f"[WARN] Stylesheet not cached: {e}")
 
 
     def _darken_color(self, hex_color, factor=0.8): #keep
@@ -3126,10 +3293,9 @@ class SettingsDialog(QDialog): #vers 15
         self.demo_log.append(f"Random theme: {random_theme}")
 
 
-    def get_stylesheet(self): #vers 4
+    def get_stylesheet(self): #vers 5
         """Generate complete stylesheet for current theme"""
-        colors = self.get_theme_colors()
-        return self.app_settings._generate_stylesheet(colors)
+        return self.app_settings.get_stylesheet()
 
     def paintEvent(self, event): #vers 2
         """Paint corner resize triangles"""
@@ -3324,7 +3490,7 @@ class SettingsDialog(QDialog): #vers 15
         self.setGeometry(new_geometry)
 
 
-    def _create_color_picker_tab(self): #vers 7
+    def _create_color_picker_tab(self): #vers 8
         """Create color picker and theme editor tab - Final layout with logical flow"""
         tab = QWidget()
         main_layout = QHBoxLayout(tab)
@@ -3719,8 +3885,7 @@ class SettingsDialog(QDialog): #vers 15
         theme_selector_layout.addWidget(self.instant_apply_check)
 
         self.theme_selector_combo = QComboBox()
-        for theme_key, theme_data in self.app_settings.themes.items():
-            display_name = theme_data.get("name", theme_key)
+        for theme_key, display_name in self.app_settings.get_theme_display_names():
             self.theme_selector_combo.addItem(display_name, theme_key)
 
         current_theme = self.app_settings.current_settings.get("theme")
@@ -5798,11 +5963,11 @@ Ready for operations..."""
 
     # ===== THEME MANAGEMENT =====
 
-    def _on_theme_changed(self, theme_name): #vers 2
+    def _on_theme_changed(self, theme_name): #vers 3
         """Handle theme selection change"""
         theme_key = None
-        for key, data in self.app_settings.themes.items():
-            if data.get("name", key) == theme_name:
+        for key, display_name in self.app_settings.get_theme_display_names():
+            if display_name == theme_name:
                 theme_key = key
                 break
 
@@ -5855,14 +6020,13 @@ Ready for operations..."""
                 element_name = self.selected_element_combo.currentText()
                 self.demo_log.append(f"Applied {picked_color} to {element_name}")
 
-    def _refresh_themes(self): #vers 1
+    def _refresh_themes(self): #vers 2
         """Refresh themes from disk"""
         current_theme = self.theme_selector_combo.currentData()
         self.app_settings.refresh_themes()
 
         self.theme_selector_combo.clear()
-        for theme_key, theme_data in self.app_settings.themes.items():
-            display_name = theme_data.get("name", theme_key)
+        for theme_key, display_name in self.app_settings.get_theme_display_names():
             self.theme_selector_combo.addItem(display_name, theme_key)
 
         index = self.theme_selector_combo.findData(current_theme)
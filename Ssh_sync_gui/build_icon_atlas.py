@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+#X-Seti - October17 2026 - ssh_sync_gui - Icon Atlas Builder - version 2
+##this belongs in root /build_icon_atlas.py
+
+"""
+Pre-render the GUI icons into apps/icons.atlas
+
+    python build_icon_atlas.py [--output PATH]
+
+Every icon in apps/core/sshsync_iconcore.py is rendered at its sizes for each
+device pixel ratio in ATLAS_DPRS and stored as an alpha mask; the window tints the
+masks with the theme text color at startup instead of parsing SVG. Icons that do
+not draw in a single color are left out and keep rendering at runtime. The window
+builds the atlas itself on first run and after icon changes - run this to build
+it ahead of time, e.g. when packaging.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "apps"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QGuiApplication
+
+from core.sshsync_atlascore import ATLAS_FILE
+from methods.sshsync_iconcache import ensure_icon_atlas
+
+
+def main(argv=None): #vers 2
+    parser = argparse.ArgumentParser(description="Pre-render SSH File Sync icons into an atlas")
+    parser.add_argument("--output", default=str(ATLAS_FILE), help="atlas file (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication(sys.argv[:1])
+    path, count, skipped = ensure_icon_atlas(args.output)
+    for rendering in skipped:
+        print(f"[WARN] {rendering} is not single-color - left to runtime rendering")
+    print(f"[OK] {count} icon masks -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,48 @@
 #!/usr/bin/env python3
 
-#X-Seti - November06 2025 - ssh_sync_gui - Root Launcher - version 1
+#X-Seti - November06 2025 - ssh_sync_gui - Root Launcher - version 2
 ##this belongs in root /launch_ssh_sync.py
 
+# The window is built from the GUI module and its Qt-free core modules only - the
+# theme settings system (app_settings_system, color pickers, every theme file) loads
+# when the theme dialog is first opened.
+#   python launch_ssh_sync.py [--startup-profile]
+
+import time
+LAUNCH_START = time.perf_counter()
 
 import sys
 import os
 from pathlib import Path
 
+
+class StartupProfile:
+    """Per-phase startup timings for --startup-profile - does nothing unless enabled"""
+
+    def __init__(self, enabled): #vers 1
+        self.enabled = enabled
+        self.marks = [("launcher start", LAUNCH_START)]
+
+    def mark(self, phase): #vers 1
+        if self.enabled:
+            self.marks.append((phase, time.perf_counter()))
+
+    def report(self): #vers 1
+        """Time of each phase since the previous one, plus the running total"""
+        if not self.enabled:
+            return
+        print("\nStartup profile:")
+        for (_, previous), (phase, moment) in zip(self.marks, self.marks[1:]):
+            print(f"  {phase:<28} {(moment - previous) * 1000:8.1f} ms"
+                f"  {(moment - LAUNCH_START) * 1000:8.1f} ms total")
+        loaded = "yes" if "app_settings_system" in sys.modules else "no (deferred)"
+        print(f"  theme settings system loaded: {loaded}")
+
+
+startup_profile = StartupProfile("--startup-profile" in sys.argv)
+if startup_profile.enabled:
+    sys.argv.remove("--startup-profile")
+
 def find_project_root(): #vers 1
     """Find the project root by looking for apps directory"""
     current = Path.cwd()
@@ -55,47 +90,43 @@ if gui_path is None:
     print("  ssh_sync_gui.py")
     sys.exit(1)
 
-# Add paths for imports
+# Add paths for imports - utils stays on the path for the deferred theme dialog
 sys.path.insert(0, str(gui_path))
 sys.path.insert(0, str(root_dir / "apps" / "utils"))
 
 print(f"Loading from: {gui_path}")
 
 try:
-    # Import app settings system
-    try:
-        from app_settings_system import AppSettings
-        has_app_settings = True
-        print("App settings system loaded")
-    except ImportError as e:
-        print(f"Warning: Could not load app_settings_system: {e}")
-        print("Running without theme system...")
-        has_app_settings = False
-    
-    # Import SSH sync GUI
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    startup_profile.mark("import PyQt6")
+
+    # Import SSH sync GUI - its active theme is read without the settings system
     import ssh_sync_gui
     from ssh_sync_gui import SSHSyncGUI
-    
+    startup_profile.mark("import ssh_sync_gui")
+
     # Create QApplication
-    from PyQt6.QtWidgets import QApplication
-    
     app = QApplication(sys.argv)
-    
-    # Create SSH sync GUI
+    startup_profile.mark("QApplication")
+
+    # Create SSH sync GUI - construction phases are recorded into the same profile
+    if startup_profile.enabled:
+        SSHSyncGUI.startup_marks = startup_profile.marks
     window = SSHSyncGUI()
-    
-    # Add app settings if available
-    if has_app_settings:
-        app_settings = AppSettings()
-        window.app_settings = app_settings
-        window._apply_theme()
-        print("Theme applied from app_settings")
-    else:
-        print("Using default theme")
-    
+    SSHSyncGUI.startup_marks = None
+
     # Show window
     window.show()
-    
+    startup_profile.mark("show")
+
+    def first_turn():
+        startup_profile.mark("first event loop turn")
+        startup_profile.report()
+
+    if startup_profile.enabled:
+        QTimer.singleShot(0, first_turn)
+
     print(f"SSH File Sync started successfully")
     sys.exit(app.exec())
     
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+
+#X-Seti - October17 2026 - ssh_sync_gui - Headless CLI - version 1
+##this belongs in root /sshsync.py
+
+"""
+Headless SSH File Sync - no Qt, JSON results on stdout
+
+    python -m sshsync push   [--profile NAME] [--delete | --no-delete]
+    python -m sshsync pull   [--profile NAME] [--delete | --no-delete]
+    python -m sshsync mirror [--profile NAME] [--yes]
+    python -m sshsync watch  [--profile NAME] [--latency SECONDS]
+    python -m sshsync status [--connect]
+
+Kept tiny - the entry script is recompiled on every run, the commands live in
+apps/core/sshsync_clicore.py.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "apps"))
+
+from core.sshsync_clicore import main
+
+if __name__ == "__main__":
+    sys.exit(main())